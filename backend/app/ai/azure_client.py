@@ -0,0 +1,105 @@
+"""
+Azure OpenAI Client - process-wide async chat completion client for resume analysis
+One AsyncAzureOpenAI over a keep-alive httpx connection pool, with a per-request timeout and a
+semaphore bounding completions in flight, so analyses never block the event loop.
+"""
+
+import asyncio
+import concurrent.futures
+import logging
+from typing import Any, Dict, List, Optional
+
+import httpx
+# openai imports its resource modules on first use (~0.5s of class building); load them with
+# this module so the first completion does not stall the event loop
+import openai.resources  # noqa: F401
+from openai import AsyncAzureOpenAI
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+class AzureCompletionClient:
+    """Pooled async Azure OpenAI chat client bound to the event loop that created it"""
+
+    def __init__(self, endpoint: str, api_key: str, api_version: str, model: str,
+                 timeout: float = 60.0, max_concurrency: int = 8, max_connections: int = 20,
+                 max_retries: int = 2, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.model = model
+        self.timeout = timeout
+        self.loop = asyncio.get_running_loop()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_connections, max_keepalive_connections=max_connections),
+            timeout=httpx.Timeout(timeout, connect=min(timeout, 10.0)),
+            transport=transport
+        )
+        self._client = AsyncAzureOpenAI(
+            azure_endpoint=endpoint,
+            api_key=api_key,
+            api_version=api_version,
+            http_client=self._http,
+            max_retries=max_retries,
+            timeout=timeout
+        )
+        self.in_flight = 0
+        # Set by release(): the pool close scheduled on this client's own loop
+        self.closing: Optional[concurrent.futures.Future] = None
+
+    async def complete(self, messages: List[Dict[str, str]], **params: Any) -> str:
+        """Content of the first choice; waits for a free slot when max_concurrency are running"""
+        async with self._semaphore:
+            self.in_flight += 1
+            try:
+                response = await self._client.chat.completions.create(
+                    model=self.model, messages=messages, timeout=self.timeout, **params
+                )
+            finally:
+                self.in_flight -= 1
+        return response.choices[0].message.content
+
+    async def aclose(self):
+        await self._client.close()
+
+    def release(self):
+        """Close the connection pool from outside its event loop (the loop has been replaced)"""
+        if self.loop.is_running():
+            self.closing = asyncio.run_coroutine_threadsafe(self.aclose(), self.loop)
+        elif self.loop.is_closed():
+            # Nothing can await the pool any more; its sockets are freed when the client is collected
+            logger.info("Dropped Azure OpenAI client of a closed event loop")
+        else:
+            logger.warning("Dropped Azure OpenAI client of an idle event loop without closing its "
+                           f"connection pool ({self.in_flight} completions in flight)")
+
+# Global instance
+azure_client: Optional[AzureCompletionClient] = None
+
+def get_azure_client() -> AzureCompletionClient:
+    """Get the shared client, creating it for the running event loop on first use.
+    A loop change (e.g. a test client starting its own loop) gets a fresh client, since
+    pooled connections cannot move between loops; the old client's pool is released."""
+    global azure_client
+    if azure_client is None or azure_client.loop is not asyncio.get_running_loop():
+        if azure_client is not None:
+            azure_client.release()
+        azure_client = AzureCompletionClient(
+            endpoint=settings.azure_openai_endpoint,
+            api_key=settings.azure_openai_api_key,
+            api_version=settings.azure_openai_api_version,
+            model=settings.azure_openai_model,
+            timeout=settings.azure_openai_timeout,
+            max_concurrency=settings.azure_openai_max_concurrency,
+            max_connections=settings.azure_openai_max_connections,
+            max_retries=settings.azure_openai_max_retries
+        )
+        logger.info(f"Created Azure OpenAI client for {settings.azure_openai_endpoint} "
+                    f"(max {settings.azure_openai_max_concurrency} concurrent completions)")
+    return azure_client
+
+async def close_azure_client():
+    """Close the shared client's connection pool (application shutdown)"""
+    global azure_client
+    client, azure_client = azure_client, None
+    if client is not None and client.loop is asyncio.get_running_loop():
+        await client.aclose()
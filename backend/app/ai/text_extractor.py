@@ -0,0 +1,131 @@
+"""
+Text Extractor - resume text extraction off the event loop
+PDFs are parsed in a shared process pool under size, page-count and per-page time limits, and
+the extracted text is cached by file hash so re-uploads of the same PDF skip parsing.
+"""
+
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from fastapi import UploadFile
+
+from app.config import settings
+from app.storage.analysis_cache import AnalysisCache, get_resume_text_cache
+
+# Add the services directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from services.resume_text import ResumeTooLargeError, extract_pdf_text, extract_resume_text
+
+logger = logging.getLogger(__name__)
+
+# Uploads are read in chunks of this size, stopping as soon as the size limit is passed
+READ_CHUNK_BYTES = 256 * 1024
+
+class ResumeTextExtractor:
+    """Async front end for services.resume_text backed by a process pool and a hash cache"""
+
+    def __init__(self, max_workers: int = 4, max_bytes: int = 10 * 1024 * 1024, max_pages: int = 50,
+                 page_timeout: float = 5.0, cache: Optional[AnalysisCache] = None):
+        self.max_workers = max_workers
+        self.max_bytes = max_bytes
+        self.max_pages = max_pages
+        self.page_timeout = page_timeout
+        self.cache = cache
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # Spawned, not forked: the server process has live threads and locks
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers,
+                                             mp_context=multiprocessing.get_context('spawn'))
+        return self._pool
+
+    def _too_large(self, size: int) -> ResumeTooLargeError:
+        return ResumeTooLargeError(f"File is {size} bytes; at most {self.max_bytes} are supported")
+
+    async def read_upload(self, upload: UploadFile) -> bytes:
+        """Read an upload in chunks, raising ResumeTooLargeError once it passes max_bytes
+        instead of buffering the whole body first"""
+        chunks, size = [], 0
+        while True:
+            chunk = await upload.read(READ_CHUNK_BYTES)
+            if not chunk:
+                return b''.join(chunks)
+            size += len(chunk)
+            if size > self.max_bytes:
+                raise ResumeTooLargeError(f"File is larger than {self.max_bytes} bytes")
+            chunks.append(chunk)
+
+    async def extract(self, file_name: str, content: bytes) -> str:
+        """Text of a PDF or text file; raises ResumeTooLargeError over the size/page limits and
+        ValueError for unreadable or too slow PDFs"""
+        if len(content) > self.max_bytes:
+            raise self._too_large(len(content))
+        if not file_name.lower().endswith('.pdf'):
+            return extract_resume_text(file_name, content)
+
+        key = hashlib.sha256(content).hexdigest()
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+        loop = asyncio.get_running_loop()
+        try:
+            text = await loop.run_in_executor(
+                self.pool(), extract_pdf_text, content, self.max_pages, self.page_timeout
+            )
+        except BrokenProcessPool:
+            # A worker died (e.g. a parser crash); start a fresh pool for the next request
+            self._pool = None
+            raise ValueError("Error extracting text from PDF: extraction worker crashed")
+
+        if self.cache is not None:
+            self.cache.put(key, text)
+        return text
+
+    async def extract_file(self, path: str) -> str:
+        """extract() for a stored file"""
+        size = os.path.getsize(path)
+        if size > self.max_bytes:
+            raise self._too_large(size)
+        loop = asyncio.get_running_loop()
+        with open(path, 'rb') as f:
+            content = await loop.run_in_executor(None, f.read)
+        return await self.extract(path, content)
+
+    def shutdown(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+# Global instance
+resume_text_extractor = None
+
+def get_resume_text_extractor() -> ResumeTextExtractor:
+    """Get the global resume text extractor"""
+    global resume_text_extractor
+    if resume_text_extractor is None:
+        resume_text_extractor = ResumeTextExtractor(
+            max_workers=settings.resume_extract_workers,
+            max_bytes=settings.resume_max_file_bytes,
+            max_pages=settings.resume_max_pdf_pages,
+            page_timeout=settings.resume_pdf_page_timeout,
+            cache=get_resume_text_cache()
+        )
+    return resume_text_extractor
+
+def close_resume_text_extractor():
+    """Stop the extraction process pool (application shutdown)"""
+    global resume_text_extractor
+    extractor, resume_text_extractor = resume_text_extractor, None
+    if extractor is not None:
+        extractor.shutdown()
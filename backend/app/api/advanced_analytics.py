@@ -1,31 +1,21 @@
 from fastapi import APIRouter, HTTPException, Query
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
-import json
-import os
 from collections import defaultdict, Counter
 import statistics
 from ..models.schemas import *
+from ..storage.candidate_store import get_candidate_store
+from ..storage.database import get_table
 
 router = APIRouter(tags=["Advanced Analytics"])
 
 def load_data():
     """Load all data sources for analytics"""
-    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    # Load candidates from the shared store
+    candidates = get_candidate_store().all()
     
-    # Load candidates
-    candidates_file = os.path.join(base_dir, "candidates.json")
-    candidates = []
-    if os.path.exists(candidates_file):
-        with open(candidates_file, 'r') as f:
-            candidates = json.load(f)
-    
-    # Load interviews
-    interviews_file = os.path.join(base_dir, "interviews.json")
-    interviews = []
-    if os.path.exists(interviews_file):
-        with open(interviews_file, 'r') as f:
-            interviews = json.load(f)
+    # Load interviews from the configured storage backend
+    interviews = get_table('interviews').all()
     
     return candidates, interviews
 
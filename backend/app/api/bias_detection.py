@@ -1,13 +1,21 @@
-from fastapi import APIRouter, HTTPException
-from typing import List, Dict, Any
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+from typing import List, Dict, Any, Optional
+from app.config import settings
 from app.models.schemas import BiasAnalysisRequest, BiasAnalysisResult
+from app.storage.candidate_store import get_candidate_store
+from app.storage.columnar import get_candidate_columns
 import json
+import numpy as np
 import os
 import sys
 
 # Add the services directory to the Python path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
 
+from services.json_encoding import AnalysisJSONResponse, dumps
+
 # Import AI orchestrator
 try:
     from services.ai_orchestrator import get_ai_orchestrator, AIOrchestrator
@@ -19,6 +27,9 @@ except ImportError as e:
 
 router = APIRouter()
 
+# Upper bound on evaluations per /batch-analyze request; results are streamed as they complete
+BATCH_ANALYZE_MAX_EVALUATIONS = 5000
+
 # Get AI orchestrator instance (which includes the enhanced bias detection engine)
 def get_bias_detector():
     """Get the bias detection engine from AI orchestrator"""
@@ -31,27 +42,24 @@ def get_bias_detector():
         return BiasDetector()
 
 def load_candidates() -> List[dict]:
-    """Load candidates from JSON file"""
-    if not os.path.exists("candidates.json"):
-        return []
-    try:
-        with open("candidates.json", 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return []
+    """Load candidates from the shared candidate store"""
+    return get_candidate_store().all()
 
 @router.post("/analyze", response_model=BiasAnalysisResult)
 async def analyze_bias(request: BiasAnalysisRequest):
     """Analyze hiring decisions for bias"""
-    candidates = load_candidates()
+    store = get_candidate_store()
+    version = store.current_version()
     
     # Filter candidates if specific IDs provided
     if request.candidate_ids:
-        candidates = [c for c in candidates if c.get('id') in request.candidate_ids]
-    
-    # Filter by position if specified
-    if request.position:
-        candidates = [c for c in candidates if c.get('position_applied', '').lower() == request.position.lower()]
+        candidates = store.get_many(request.candidate_ids)
+        
+        # Filter by position if specified
+        if request.position:
+            candidates = [c for c in candidates if (c.get('position_applied') or '').lower() == request.position.lower()]
+    else:
+        candidates = store.filter(position=request.position)
     
     if not candidates:
         raise HTTPException(status_code=404, detail="No candidates found for analysis")
@@ -61,7 +69,7 @@ async def analyze_bias(request: BiasAnalysisRequest):
         if AI_ORCHESTRATOR_AVAILABLE:
             # Use enhanced AI orchestrator bias detection
             orchestrator = get_ai_orchestrator()
-            analysis_result = orchestrator.get_bias_insights(candidates)
+            analysis_result = orchestrator.get_bias_insights(candidates, version, request.position)
             
             return BiasAnalysisResult(
                 overall_bias_score=analysis_result['summary'].get('overall_bias_score', 0.0),
@@ -88,8 +96,9 @@ async def analyze_bias(request: BiasAnalysisRequest):
 @router.get("/metrics/{position}")
 async def get_fairness_metrics(position: str):
     """Get fairness metrics for a specific position"""
-    candidates = load_candidates()
-    position_candidates = [c for c in candidates if c.get('position_applied', '').lower() == position.lower()]
+    store = get_candidate_store()
+    version = store.current_version()
+    position_candidates = store.filter(position=position)
     
     if not position_candidates:
         raise HTTPException(status_code=404, detail=f"No candidates found for position: {position}")
@@ -98,15 +107,15 @@ async def get_fairness_metrics(position: str):
         if AI_ORCHESTRATOR_AVAILABLE:
             # Use enhanced AI orchestrator for position-specific analysis
             orchestrator = get_ai_orchestrator()
-            analysis_result = orchestrator.get_bias_insights(position_candidates)
+            analysis_result = orchestrator.get_bias_insights(position_candidates, version, position)
             
-            return {
+            return AnalysisJSONResponse({
                 "position": position,
                 "total_candidates": len(position_candidates),
                 "bias_score": analysis_result['summary'].get('overall_bias_score', 0.0),
                 "fairness_metrics": analysis_result.get('demographic_analysis', {}),
                 "recommendations": analysis_result.get('recommendations', [])
-            }
+            })
         else:
             # Fallback to basic bias detector
             bias_detector = get_bias_detector()
@@ -124,7 +133,7 @@ async def get_fairness_metrics(position: str):
 @router.get("/dashboard")
 async def get_bias_dashboard():
     """Get bias dashboard data"""
-    candidates = load_candidates()
+    version, candidates = get_candidate_store().snapshot()
     
     if not candidates:
         return {
@@ -135,61 +144,40 @@ async def get_bias_dashboard():
             "recent_flags": []
         }
     
-    # Overall statistics
-    total_candidates = len(candidates)
-    hired_candidates = len([c for c in candidates if c.get('hiring_decision') == 'hired'])
+    # Overall statistics from columns built at the same version as `candidates`
+    columns = get_candidate_columns((version, candidates))
+    hired_mask = columns.mask('hiring_decision', 'hired')
+    total_candidates = columns.size
+    hired_candidates = int(hired_mask.sum())
+    
+    def breakdown(field: str, default: str) -> Dict[str, Dict[str, Any]]:
+        """total / hired / hiring_rate per category from two bincounts"""
+        totals = columns.value_counts(field, default=default)
+        hires = columns.value_counts(field, hired_mask, default=default)
+        return {
+            group: {
+                'total': total,
+                'hired': hires.get(group, 0),
+                'hiring_rate': (hires.get(group, 0) / total * 100) if total > 0 else 0
+            }
+            for group, total in totals.items()
+        }
     
     # Position breakdown
-    positions = {}
-    for candidate in candidates:
-        position = candidate.get('position_applied', 'Unknown')
-        if position not in positions:
-            positions[position] = {'total': 0, 'hired': 0}
-        positions[position]['total'] += 1
-        if candidate.get('hiring_decision') == 'hired':
-            positions[position]['hired'] += 1
-    
-    # Calculate hiring rates by position
-    for position in positions:
-        total = positions[position]['total']
-        hired = positions[position]['hired']
-        positions[position]['hiring_rate'] = (hired / total * 100) if total > 0 else 0
+    positions = breakdown('position_applied', 'Unknown')
     
     # Demographic summary
     demographics = {
-        'gender': {},
-        'ethnicity': {}
+        'gender': breakdown('gender', 'unknown'),
+        'ethnicity': breakdown('ethnicity', 'unknown')
     }
     
-    for candidate in candidates:
-        gender = candidate.get('gender', 'unknown')
-        ethnicity = candidate.get('ethnicity', 'unknown')
-        
-        if gender not in demographics['gender']:
-            demographics['gender'][gender] = {'total': 0, 'hired': 0}
-        if ethnicity not in demographics['ethnicity']:
-            demographics['ethnicity'][ethnicity] = {'total': 0, 'hired': 0}
-        
-        demographics['gender'][gender]['total'] += 1
-        demographics['ethnicity'][ethnicity]['total'] += 1
-        
-        if candidate.get('hiring_decision') == 'hired':
-            demographics['gender'][gender]['hired'] += 1
-            demographics['ethnicity'][ethnicity]['hired'] += 1
-    
-    # Calculate hiring rates by demographics
-    for demo_type in demographics:
-        for group in demographics[demo_type]:
-            total = demographics[demo_type][group]['total']
-            hired = demographics[demo_type][group]['hired']
-            demographics[demo_type][group]['hiring_rate'] = (hired / total * 100) if total > 0 else 0
-    
     # Overall bias analysis
     try:
         if AI_ORCHESTRATOR_AVAILABLE:
             # Use enhanced AI orchestrator for comprehensive analysis
             orchestrator = get_ai_orchestrator()
-            insights = orchestrator.get_bias_insights(candidates)
+            insights = orchestrator.get_bias_insights(candidates, version)
             overall_bias_score = insights['summary'].get('overall_bias_score', 0.0)
             recent_flags = []  # Enhanced analysis doesn't track individual flags
         else:
@@ -202,7 +190,7 @@ async def get_bias_dashboard():
         overall_bias_score = 0.0
         recent_flags = []
     
-    return {
+    return AnalysisJSONResponse({
         "total_candidates": total_candidates,
         "total_hired": hired_candidates,
         "overall_hiring_rate": (hired_candidates / total_candidates * 100) if total_candidates > 0 else 0,
@@ -210,7 +198,7 @@ async def get_bias_dashboard():
         "position_breakdown": positions,
         "demographic_summary": demographics,
         "recent_flags": recent_flags[:10]  # Last 10 flagged candidates
-    }
+    })
 
 @router.post("/train")
 async def train_bias_model():
@@ -250,19 +238,22 @@ async def train_bias_model():
 @router.get("/audit/{candidate_id}")
 async def audit_candidate_decision(candidate_id: int):
     """Audit a specific candidate's hiring decision for bias"""
-    candidates = load_candidates()
+    store = get_candidate_store()
     
-    candidate = next((c for c in candidates if c.get('id') == candidate_id), None)
+    candidate = store.get(candidate_id)
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    # Find similar candidates for comparison
-    similar_candidates = []
-    for c in candidates:
-        if (c.get('id') != candidate_id and 
-            c.get('position_applied') == candidate.get('position_applied') and
-            abs(c.get('experience_years', 0) - candidate.get('experience_years', 0)) <= 2):
-            similar_candidates.append(c)
+    # Find similar candidates for comparison: same position, within 2 years of experience
+    columns = get_candidate_columns()
+    version = columns.version
+    experience = np.nan_to_num(columns.numeric['experience_years'])
+    similar = (
+        columns.mask('position_applied', candidate.get('position_applied')) &
+        (np.abs(experience - (candidate.get('experience_years') or 0)) <= 2) &
+        (columns.ids != candidate_id)
+    )
+    similar_candidates = store.get_many(columns.ids[similar].tolist())
     
     if not similar_candidates:
         return {
@@ -279,7 +270,7 @@ async def audit_candidate_decision(candidate_id: int):
         if AI_ORCHESTRATOR_AVAILABLE:
             # Use enhanced bias detection for audit
             orchestrator = get_ai_orchestrator()
-            comparison_insights = orchestrator.get_bias_insights(comparison_group)
+            comparison_insights = orchestrator.get_bias_insights(comparison_group, version)
             
             # Individual candidate bias check
             individual_bias = {}
@@ -302,7 +293,7 @@ async def audit_candidate_decision(candidate_id: int):
             elif comparison_insights.get('risk_level') == 'medium':
                 bias_indicators.append("Medium bias risk detected in comparison group")
             
-            return {
+            return AnalysisJSONResponse({
                 "candidate_id": candidate_id,
                 "candidate_demographics": candidate_demo,
                 "similar_candidates_count": len(similar_candidates),
@@ -311,7 +302,7 @@ async def audit_candidate_decision(candidate_id: int):
                 "recommendations": comparison_insights.get('recommendations', []),
                 "fairness_metrics": comparison_insights.get('demographic_analysis', {}),
                 "individual_analysis": individual_bias
-            }
+            })
         else:
             # Fallback to basic bias detector
             bias_detector = get_bias_detector()
@@ -375,7 +366,7 @@ async def analyze_text_bias(request: Dict[str, Any]):
             candidate_info=candidate_info
         )
         
-        return {
+        return AnalysisJSONResponse({
             "status": "success",
             "text_analysis": {
                 "bias_detected": analysis_result.get('bias_detected', False),
@@ -387,7 +378,7 @@ async def analyze_text_bias(request: Dict[str, Any]):
             },
             "recommendations": analysis_result.get('recommendations', []),
             "analysis_timestamp": analysis_result.get('analysis_timestamp')
-        }
+        })
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Text analysis failed: {str(e)}")
@@ -417,40 +408,80 @@ async def ai_analyze_bias(request: Dict[str, Any]):
             candidates_dataset=candidates
         )
         
-        return {
+        return AnalysisJSONResponse({
             "status": "success",
             "analysis": bias_analysis,
             "analysis_type": "comprehensive_ai_powered",
             "timestamp": bias_analysis.get('analysis_timestamp')
-        }
+        })
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"AI bias analysis failed: {str(e)}")
 
 @router.get("/insights")
-async def get_bias_insights():
+async def get_bias_insights(
+    score_attributes: Optional[str] = Query(None, description="Comma-separated protected attributes to also analyze score bias by (e.g. gender,ethnicity,age_group)")
+):
     """Get comprehensive bias insights for all candidates"""
     if not AI_ORCHESTRATOR_AVAILABLE:
         raise HTTPException(status_code=503, detail="AI Orchestrator not available")
     
+    score_by = tuple(a.strip() for a in score_attributes.split(",") if a.strip()) if score_attributes else ()
+    
     ai_orchestrator = get_ai_orchestrator()
-    candidates = load_candidates()
+    version, candidates = get_candidate_store().snapshot()
     
     if not candidates:
         raise HTTPException(status_code=404, detail="No candidates found")
     
     try:
-        insights = ai_orchestrator.get_bias_insights(candidates)
-        return {
+        insights = ai_orchestrator.get_bias_insights(candidates, version, score_attributes=score_by)
+        return AnalysisJSONResponse({
             "status": "success",
             "insights": insights,
             "total_candidates_analyzed": len(candidates),
             "analysis_timestamp": insights.get('summary', {}).get('analysis_timestamp')
-        }
+        })
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Insights generation failed: {str(e)}")
 
+@router.get("/intersectional")
+async def get_intersectional_bias(
+    attributes: Optional[str] = Query(None, description="Comma-separated attributes to cross; defaults to gender, ethnicity, age_group and position"),
+    max_order: int = Query(3, ge=1, le=5),
+    min_support: Optional[int] = Query(None, ge=1, description="Smallest group tested (default 30)"),
+    alpha: float = Query(0.05, gt=0, lt=1),
+    correction: str = Query("fdr_bh", pattern="^(fdr_bh|bonferroni)$"),
+    max_groups: int = Query(50, ge=1, le=1000)
+):
+    """Hire-rate disparities for combinations of protected attributes (e.g. gender x ethnicity x position)"""
+    if not AI_ORCHESTRATOR_AVAILABLE:
+        raise HTTPException(status_code=503, detail="AI Orchestrator not available")
+    
+    options = {"max_order": max_order, "alpha": alpha, "correction": correction, "max_groups": max_groups}
+    if attributes is not None:
+        options["attributes"] = tuple(a.strip() for a in attributes.split(",") if a.strip())
+        if not options["attributes"]:
+            raise HTTPException(status_code=400, detail="attributes must name at least one field")
+    if min_support is not None:
+        options["min_support"] = min_support
+    
+    version, candidates = get_candidate_store().snapshot()
+    if not candidates:
+        raise HTTPException(status_code=404, detail="No candidates found")
+    
+    try:
+        analysis = get_ai_orchestrator().get_intersectional_insights(candidates, version, **options)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Intersectional analysis failed: {str(e)}")
+    
+    return AnalysisJSONResponse({
+        "status": "success",
+        "analysis": analysis,
+        "total_candidates_analyzed": len(candidates)
+    })
+
 @router.post("/text-analyze")
 async def analyze_text_bias(request: Dict[str, Any]):
     """Analyze text for bias indicators using rule-based analysis"""
@@ -469,12 +500,12 @@ async def analyze_text_bias(request: Dict[str, Any]):
         # Use the AI orchestrator's text bias analysis
         text_analysis = ai_orchestrator._analyze_text_bias(text, candidate_info)
         
-        return {
+        return AnalysisJSONResponse({
             "status": "success",
             "text_analysis": text_analysis,
             "analysis_type": "rule_based_text_analysis",
             "text_length": len(text)
-        }
+        })
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Text analysis failed: {str(e)}")
@@ -528,6 +559,26 @@ async def bias_detection_health():
     
     return health_status
 
+async def iter_batch_analysis(ai_orchestrator, evaluations: List[Any], statistical_analysis: Dict[str, Any]):
+    """Yield the batch-analyze JSON document piece by piece; items are analyzed concurrently
+    and written in completion order, each tagged with its request index. The dataset-level
+    statistics are the same for every item, so they are written once ahead of the results."""
+    yield '{"status": "success", "statistical_analysis": ' + dumps(statistical_analysis) + ', "batch_results": ['
+    successful = failed = 0
+    results = ai_orchestrator.detect_bias_batch(evaluations, statistical_analysis, settings.llm_max_concurrency)
+    async for result in results:
+        if result["status"] == "success":
+            successful += 1
+        else:
+            failed += 1
+        yield ("," if successful + failed > 1 else "") + dumps(result)
+    
+    yield "], " + json.dumps({
+        "total_evaluations": len(evaluations),
+        "successful_analyses": successful,
+        "failed_analyses": failed
+    })[1:]
+
 @router.post("/batch-analyze")
 async def batch_analyze_bias(request: Dict[str, Any]):
     """Batch analysis of multiple evaluations for bias detection"""
@@ -540,50 +591,24 @@ async def batch_analyze_bias(request: Dict[str, Any]):
     if not evaluations:
         raise HTTPException(status_code=400, detail="evaluations list is required")
     
-    if len(evaluations) > 50:  # Limit batch size
-        raise HTTPException(status_code=400, detail="Maximum 50 evaluations per batch")
-    
-    # Load candidates for context
-    candidates = load_candidates()
-    
-    batch_results = []
+    if len(evaluations) > BATCH_ANALYZE_MAX_EVALUATIONS:  # Limit batch size
+        raise HTTPException(status_code=400,
+                            detail=f"Maximum {BATCH_ANALYZE_MAX_EVALUATIONS} evaluations per batch")
     
+    # Dataset-level statistics are the same for every evaluation, so compute them once per
+    # store version, off the event loop
+    version, candidates = get_candidate_store().snapshot()
     try:
-        for i, evaluation in enumerate(evaluations):
-            evaluation_text = evaluation.get("text", "")
-            candidate_info = evaluation.get("candidate_info", {})
-            
-            if not evaluation_text:
-                batch_results.append({
-                    "index": i,
-                    "status": "error",
-                    "error": "Missing evaluation text"
-                })
-                continue
-            
-            # Analyze this evaluation
-            analysis = await ai_orchestrator.detect_bias_comprehensive(
-                evaluation_text=evaluation_text,
-                candidate_info=candidate_info,
-                candidates_dataset=candidates
-            )
-            
-            batch_results.append({
-                "index": i,
-                "status": "success",
-                "analysis": analysis
-            })
-        
-        return {
-            "status": "success",
-            "batch_results": batch_results,
-            "total_evaluations": len(evaluations),
-            "successful_analyses": len([r for r in batch_results if r["status"] == "success"]),
-            "failed_analyses": len([r for r in batch_results if r["status"] == "error"])
-        }
-    
+        statistical_analysis = await run_in_threadpool(
+            ai_orchestrator.dataset_bias_statistics, candidates, version
+        ) if len(candidates) > 5 else {}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Batch analysis failed: {str(e)}")
+    
+    return StreamingResponse(
+        iter_batch_analysis(ai_orchestrator, evaluations, statistical_analysis),
+        media_type="application/json"
+    )
 
 @router.get("/recommendations/{risk_level}")
 async def get_bias_recommendations(risk_level: str):
@@ -645,7 +670,7 @@ async def validate_hiring_decision(request: Dict[str, Any]):
     
     # Load candidates for analysis
     candidates = load_candidates()
-    candidate = next((c for c in candidates if c.get('id') == candidate_id), None)
+    candidate = get_candidate_store().get(candidate_id)
     
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
@@ -667,11 +692,11 @@ async def validate_hiring_decision(request: Dict[str, Any]):
             "confidence_score": 1.0 - decision_analysis.get('bias_score', 0)
         }
         
-        return {
+        return AnalysisJSONResponse({
             "status": "success",
             "validation": validation_result,
             "recommendation": "proceed" if validation_result["validation_status"] == "passed" else "review_required"
-        }
+        })
     
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Decision validation failed: {str(e)}")
@@ -686,7 +711,7 @@ async def get_comprehensive_insights():
             "insights": {}
         }
     
-    candidates = load_candidates()
+    version, candidates = get_candidate_store().snapshot()
     
     if not candidates:
         return {
@@ -702,22 +727,15 @@ async def get_comprehensive_insights():
         print(f"DEBUG: Analyzing {len(candidates)} candidates")
         
         # Get insights with error handling
-        comprehensive_insights = orchestrator.get_bias_insights(candidates)
-        
-        print(f"DEBUG: Got insights, converting numpy types...")
+        comprehensive_insights = orchestrator.get_bias_insights(candidates, version)
         
-        # Ensure all data is JSON serializable
-        from services.ai_orchestrator import convert_numpy_types
-        safe_insights = convert_numpy_types(comprehensive_insights)
-        
-        print(f"DEBUG: Conversion successful")
-        
-        return {
+        # NumPy values in the insights are serialized by the response itself
+        return AnalysisJSONResponse({
             "status": "success",
-            "insights": safe_insights,
+            "insights": comprehensive_insights,
             "total_candidates": len(candidates),
-            "analysis_timestamp": safe_insights.get('summary', {}).get('analysis_timestamp')
-        }
+            "analysis_timestamp": comprehensive_insights.get('summary', {}).get('analysis_timestamp')
+        })
     
     except Exception as e:
         print(f"DEBUG: Error in insights generation: {str(e)}")
@@ -3,6 +3,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 import json
 import uuid
+from app.storage.database import get_table
 
 router = APIRouter()
 
@@ -173,6 +174,10 @@ class CalendarService:
         else:
             return ""
 
+def get_events_table():
+    """Calendar events table, seeded with the sample events above on first use"""
+    return get_table('calendar_events', seed=CALENDAR_DATA["calendar_events"])
+
 @router.get("/providers")
 async def get_calendar_providers():
     """Get available calendar providers"""
@@ -268,9 +273,13 @@ async def create_calendar_event(event_data: Dict[str, Any]):
             provider = CALENDAR_DATA["calendar_settings"]["meeting_link_provider"]
             meeting_link = CalendarService.generate_meeting_link(provider)
         
-        # Create calendar event
+        # Create calendar event (skip past ids still held after earlier deletes)
+        table = get_events_table()
+        event_number = table.count() + 1
+        while table.get(f"cal_event_{event_number}") is not None:
+            event_number += 1
         new_event = {
-            "id": f"cal_event_{len(CALENDAR_DATA['calendar_events']) + 1}",
+            "id": f"cal_event_{event_number}",
             "interview_id": event_data["interview_id"],
             "calendar_id": event_data["calendar_id"],
             "event_id": f"external_event_{uuid.uuid4().hex[:8]}",
@@ -291,7 +300,7 @@ async def create_calendar_event(event_data: Dict[str, Any]):
             "updated_at": datetime.now().isoformat()
         }
         
-        CALENDAR_DATA["calendar_events"].append(new_event)
+        table.insert(new_event)
         
         return {
             "success": True,
@@ -307,11 +316,8 @@ async def update_calendar_event(event_id: str, update_data: Dict[str, Any]):
     """Update a calendar event"""
     try:
         # Find event
-        event = None
-        for e in CALENDAR_DATA["calendar_events"]:
-            if e["id"] == event_id:
-                event = e
-                break
+        table = get_events_table()
+        event = table.get(event_id)
         
         if not event:
             raise HTTPException(status_code=404, detail="Calendar event not found")
@@ -322,6 +328,7 @@ async def update_calendar_event(event_id: str, update_data: Dict[str, Any]):
                 event[key] = value
         
         event["updated_at"] = datetime.now().isoformat()
+        table.update(event_id, event)
         
         return {
             "success": True,
@@ -336,13 +343,11 @@ async def update_calendar_event(event_id: str, update_data: Dict[str, Any]):
 async def delete_calendar_event(event_id: str):
     """Delete a calendar event"""
     try:
-        for i, event in enumerate(CALENDAR_DATA["calendar_events"]):
-            if event["id"] == event_id:
-                del CALENDAR_DATA["calendar_events"][i]
-                return {
-                    "success": True,
-                    "message": "Calendar event deleted successfully"
-                }
+        if get_events_table().delete(event_id) is not None:
+            return {
+                "success": True,
+                "message": "Calendar event deleted successfully"
+            }
         
         raise HTTPException(status_code=404, detail="Calendar event not found")
     
@@ -357,22 +362,15 @@ async def get_calendar_events(
     date_to: Optional[str] = None
 ):
     """Get calendar events with optional filters"""
-    events = CALENDAR_DATA["calendar_events"]
-    
-    # Apply filters
+    # Apply filters as an indexed query
+    filters = {}
     if calendar_id:
-        events = [e for e in events if e["calendar_id"] == calendar_id]
+        filters["calendar_id"] = calendar_id
     
     if interview_id:
-        events = [e for e in events if e["interview_id"] == interview_id]
-    
-    if date_from:
-        date_from_obj = datetime.fromisoformat(date_from)
-        events = [e for e in events if datetime.fromisoformat(e["start_time"]) >= date_from_obj]
+        filters["interview_id"] = interview_id
     
-    if date_to:
-        date_to_obj = datetime.fromisoformat(date_to)
-        events = [e for e in events if datetime.fromisoformat(e["start_time"]) <= date_to_obj]
+    events = get_events_table().find(date_from=date_from, date_to=date_to, **filters)
     
     return {
         "success": True,
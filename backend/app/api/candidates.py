@@ -1,8 +1,17 @@
-from fastapi import APIRouter, HTTPException, Depends, Query
-from typing import List, Optional
-from app.models.schemas import Candidate, CandidateCreate, CandidateUpdate
+from fastapi import APIRouter, HTTPException, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Optional
+from app.config import settings
+from app.models.schemas import Candidate, CandidateBatchUpdate, CandidateCreate, CandidateUpdate
+from app.storage.candidate_store import SORTABLE_FIELDS, VersionConflictError, get_candidate_store
+from app.storage.fairness import get_fairness_monitor
+import base64
+import csv
+import io
 import json
+import math
 import os
+import zlib
 from datetime import datetime
 import logging
 
@@ -19,49 +28,56 @@ async def debug_candidates():
     logger.info("DEBUG endpoint called")
     return {"message": "Candidates router is working", "data_file": DATA_FILE, "file_exists": os.path.exists(DATA_FILE)}
 
-# Simple file-based storage for demo (replace with database in production)
-DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "candidates.json")
+# Shared indexed candidate store (replace with database in production)
+DATA_FILE = get_candidate_store().data_file
 
-# Log the file path for debugging
-logger.info(f"Candidates DATA_FILE path: {DATA_FILE}")
-logger.info(f"Candidates file exists: {os.path.exists(DATA_FILE)}")
-if os.path.exists(DATA_FILE):
-    logger.info(f"Candidates file size: {os.path.getsize(DATA_FILE)} bytes")
+def encode_cursor(sort: str, key: tuple) -> str:
+    """Opaque keyset cursor: the sort spec plus the last row's (is_null, value, id) key"""
+    payload = json.dumps([sort, list(key)], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
 
-def load_candidates() -> List[dict]:
-    """Load candidates from JSON file"""
-    logger.info(f"Loading candidates from: {DATA_FILE}")
-    logger.info(f"File exists: {os.path.exists(DATA_FILE)}")
-    
-    if not os.path.exists(DATA_FILE):
-        logger.warning(f"Candidates file not found: {DATA_FILE}")
-        return []
+def is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def decode_cursor(cursor: str, sort: str) -> tuple:
+    """Decode a cursor issued for the same sort spec; 400 on anything else"""
     try:
-        with open(DATA_FILE, 'r') as f:
-            data = json.load(f)
-            logger.info(f"Successfully loaded {len(data)} candidates")
-            return data
-    except (json.JSONDecodeError, FileNotFoundError) as e:
-        logger.error(f"Error loading candidates: {e}")
-        return []
-
-def save_candidates(candidates: List[dict]):
-    """Save candidates to JSON file"""
-    with open(DATA_FILE, 'w') as f:
-        json.dump(candidates, f, indent=2, default=str)
+        padded = cursor + '=' * (-len(cursor) % 4)
+        cursor_sort, key = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        if cursor_sort != sort or not isinstance(key, list) or len(key) != 3:
+            raise ValueError("cursor does not match sort")
+        is_null, value, candidate_id = key
+        if not (is_int(is_null) and is_null in (0, 1) and is_int(candidate_id)):
+            raise ValueError("malformed cursor key")
+        # Must compare cleanly against the store's sort_key tuples for this field
+        field = sort.lstrip('-')
+        if is_null:
+            valid = value == 0 and is_int(value)
+        elif field == 'created_at':
+            valid = isinstance(value, str)
+        elif field == 'id':
+            valid = is_int(value)
+        else:
+            valid = (is_int(value) or isinstance(value, float)) and math.isfinite(value)
+            value = float(value) if valid else value
+        if not valid:
+            raise ValueError("malformed cursor value")
+        return (is_null, value, candidate_id)
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor for this sort order")
 
-@router.post("/", response_model=Candidate)
-async def create_candidate(candidate: CandidateCreate):
-    """Create a new candidate"""
-    candidates = load_candidates()
-    
-    # Generate new ID
-    new_id = max([c.get('id', 0) for c in candidates], default=0) + 1
-    
-    # Create candidate dict
+def version_conflict(e: VersionConflictError) -> HTTPException:
+    """409 telling the client to re-read the candidate and retry"""
+    return HTTPException(
+        status_code=409,
+        detail=f"Candidate {e.candidate_id} was modified concurrently "
+               f"(current version {e.current_version}, expected {e.expected_version})"
+    )
+
+def new_candidate_record(candidate: CandidateCreate) -> dict:
+    """Candidate dict with server-side defaults (the store assigns the new ID)"""
     candidate_dict = candidate.dict()
     candidate_dict.update({
-        'id': new_id,
         'created_at': datetime.now().isoformat(),
         'updated_at': None,
         'is_active': True,
@@ -73,51 +89,172 @@ async def create_candidate(candidate: CandidateCreate):
         'bias_score': None,
         'fairness_metrics': None
     })
-    
-    candidates.append(candidate_dict)
-    save_candidates(candidates)
+    return candidate_dict
+
+@router.post("/", response_model=Candidate)
+async def create_candidate(candidate: CandidateCreate):
+    """Create a new candidate"""
+    candidate_dict = get_candidate_store().create(new_candidate_record(candidate))
     
     return Candidate(**candidate_dict)
 
+# Rows validated and committed together by the bulk ingest endpoint
+BULK_CHUNK_SIZE = 1000
+# Bulk bodies are read this much at a time, up to settings.bulk_max_body_bytes
+BULK_READ_CHUNK_BYTES = 256 * 1024
+
+async def upload_chunks(upload) -> AsyncIterator[bytes]:
+    while True:
+        chunk = await upload.read(BULK_READ_CHUNK_BYTES)
+        if not chunk:
+            return
+        yield chunk
+
+async def read_bulk_body(chunks: AsyncIterator[bytes]) -> bytes:
+    """Join a bulk body read in chunks; 413 as soon as it passes bulk_max_body_bytes"""
+    parts, size = [], 0
+    async for chunk in chunks:
+        size += len(chunk)
+        if size > settings.bulk_max_body_bytes:
+            raise HTTPException(status_code=413,
+                                detail=f"Body is larger than {settings.bulk_max_body_bytes} bytes")
+        parts.append(chunk)
+    return b''.join(parts)
+
+def parse_bulk_payload(body: bytes, ndjson: bool):
+    """Yield (row_number, row or None, parse_error) from a JSON array or NDJSON payload.
+    
+    The body is decoded before the first row is yielded, so an encoding error is a 400
+    with nothing committed.
+    """
+    try:
+        text = body.decode('utf-8-sig')
+    except UnicodeDecodeError as e:
+        raise HTTPException(status_code=400, detail=f"Body must be UTF-8 encoded: {e.reason} at byte {e.start}")
+    if not ndjson and text.lstrip().startswith('['):
+        try:
+            rows = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid JSON array: {e}")
+        for row_number, row in enumerate(rows, start=1):
+            yield row_number, row, None
+        return
+    
+    row_number = 0
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        row_number += 1
+        try:
+            yield row_number, json.loads(line), None
+        except json.JSONDecodeError as e:
+            yield row_number, None, f"Invalid JSON: {e.msg}"
+
+def validation_messages(error: Exception) -> List[str]:
+    if hasattr(error, 'errors'):
+        return [f"{'.'.join(str(part) for part in e['loc'])}: {e['msg']}" for e in error.errors()]
+    return [str(error)]
+
+@router.post("/bulk")
+async def bulk_create_candidates(request: Request):
+    """Bulk-create candidates from a JSON array or NDJSON body (or a multipart `file` upload).
+    
+    Rows are validated in chunks; each chunk's valid rows get a contiguous block of IDs
+    and are committed together. Invalid rows are reported by 1-based row number.
+    Bodies over `bulk_max_body_bytes` are rejected with 413 while they are still being read.
+    """
+    content_type = request.headers.get('content-type', '')
+    content_length = request.headers.get('content-length', '')
+    if content_length.isdigit() and int(content_length) > settings.bulk_max_body_bytes:
+        raise HTTPException(status_code=413, detail=f"Body is larger than {settings.bulk_max_body_bytes} bytes")
+    if content_type.startswith('multipart/form-data'):
+        form = await request.form()
+        upload = form.get('file')
+        if upload is None:
+            raise HTTPException(status_code=400, detail="Multipart upload must include a 'file' field")
+        body = await read_bulk_body(upload_chunks(upload))
+        ndjson = (upload.filename or '').endswith(('.ndjson', '.jsonl'))
+    else:
+        body = await read_bulk_body(request.stream())
+        ndjson = 'ndjson' in content_type or 'jsonl' in content_type
+    
+    store = get_candidate_store()
+    received = 0
+    created_ids: List[int] = []
+    errors: List[dict] = []
+    chunk: List[dict] = []
+    
+    def flush():
+        created_ids.extend(record['id'] for record in store.create_many(chunk))
+        chunk.clear()
+    
+    for row_number, row, parse_error in parse_bulk_payload(body, ndjson):
+        received += 1
+        if parse_error:
+            errors.append({"row": row_number, "errors": [parse_error]})
+            continue
+        try:
+            if not isinstance(row, dict):
+                raise ValueError("Row must be a JSON object")
+            chunk.append(new_candidate_record(CandidateCreate(**row)))
+        except Exception as e:
+            errors.append({"row": row_number, "errors": validation_messages(e)})
+        if len(chunk) >= BULK_CHUNK_SIZE:
+            flush()
+    if chunk:
+        flush()
+    
+    logger.info(f"Bulk ingest: {len(created_ids)} created, {len(errors)} rejected of {received} rows")
+    return {
+        "received": received,
+        "created": len(created_ids),
+        "failed": len(errors),
+        "created_ids": created_ids,
+        "errors": errors
+    }
+
 @router.get("/", response_model=List[Candidate])
 async def get_candidates(
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     position: Optional[str] = None,
-    is_active: Optional[bool] = None
+    is_active: Optional[bool] = None,
+    sort: Optional[str] = Query(None, description="Sort field, prefix with '-' for descending: "
+                                                  + ", ".join(SORTABLE_FIELDS)),
+    cursor: Optional[str] = Query(None, description="Opaque cursor from the X-Next-Cursor header")
 ):
-    """Get all candidates with filtering options"""
-    logger.info(f"GET /candidates called with skip={skip}, limit={limit}, position={position}, is_active={is_active}")
+    """Get candidates with filtering and keyset pagination.
+    
+    Pass `sort` and/or `cursor` for keyset pages: each response carries an `X-Next-Cursor`
+    header while more rows follow. Plain `skip`/`limit` still works in id order.
+    """
+    sort_spec = sort or ('created_at' if cursor else None)
+    descending = bool(sort_spec and sort_spec.startswith('-'))
+    sort_field = sort_spec.lstrip('-') if sort_spec else 'id'
+    if sort_field not in SORTABLE_FIELDS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of: {', '.join(SORTABLE_FIELDS)}")
+    after = decode_cursor(cursor, sort_spec) if cursor else None
     
     try:
-        candidates = load_candidates()
-        logger.info(f"Loaded {len(candidates)} candidates from file")
-        
-        # Apply filters
-        if position:
-            candidates = [c for c in candidates if c.get('position_applied', '').lower() == position.lower()]
-        
-        if is_active is not None:
-            candidates = [c for c in candidates if c.get('is_active') == is_active]
-        
-        # Apply pagination
-        candidates = candidates[skip:skip + limit]
-        
-        logger.info(f"Returning {len(candidates)} candidates after filtering and pagination")
+        # Walk the store's ordered index; only the requested page is materialized
+        candidates, next_key = get_candidate_store().page(
+            sort=sort_field, descending=descending, after=after, limit=limit,
+            offset=0 if after is not None else skip, position=position, is_active=is_active
+        )
+        if next_key is not None and sort_spec:
+            response.headers['X-Next-Cursor'] = encode_cursor(sort_spec, next_key)
         
         # Convert to Pydantic models with error handling
         result = []
-        for i, c in enumerate(candidates):
+        for c in candidates:
             try:
-                candidate = Candidate(**c)
-                result.append(candidate)
+                result.append(Candidate(**c))
             except Exception as e:
-                logger.error(f"Error converting candidate {i} to Pydantic model: {e}")
-                logger.error(f"Candidate data: {c}")
+                logger.error(f"Error converting candidate {c.get('id')} to Pydantic model: {e}")
                 # Skip invalid candidates rather than failing the entire request
                 continue
         
-        logger.info(f"Successfully converted {len(result)} candidates to Pydantic models")
         return result
         
     except Exception as e:
@@ -126,12 +263,93 @@ async def get_candidates(
         logger.error(traceback.format_exc())
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
+# Rows fetched from the store per lock acquisition while streaming an export
+EXPORT_CHUNK_SIZE = 500
+
+def iter_export_rows(position: Optional[str], is_active: Optional[bool], sort_field: str, descending: bool):
+    """Yield matching candidates chunk by chunk along the store's keyset index"""
+    store = get_candidate_store()
+    after = None
+    while True:
+        rows, after = store.page(sort=sort_field, descending=descending, after=after, limit=EXPORT_CHUNK_SIZE,
+                                 position=position, is_active=is_active)
+        yield from rows
+        if after is None:
+            return
+
+def iter_ndjson(rows):
+    for row in rows:
+        yield json.dumps(row, default=str) + "\n"
+
+def iter_csv(rows):
+    columns = list(Candidate.model_fields.keys())
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow([
+            json.dumps(row.get(column), default=str) if isinstance(row.get(column), (list, dict)) else row.get(column)
+            for column in columns
+        ])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate(0)
+    yield buffer.getvalue()
+
+def iter_encoded(chunks, compress: bool):
+    """UTF-8 encode the text stream, gzip-compressing it incrementally when requested"""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS) if compress else None
+    pending = []
+    size = 0
+    for chunk in chunks:
+        pending.append(chunk)
+        size += len(chunk)
+        # Coalesce rows into ~64KB writes instead of one network write per row
+        if size >= 65536:
+            data = ''.join(pending).encode('utf-8')
+            pending, size = [], 0
+            yield compressor.compress(data) if compressor else data
+    data = ''.join(pending).encode('utf-8')
+    if compressor:
+        yield compressor.compress(data) + compressor.flush()
+    elif data:
+        yield data
+
+@router.get("/export")
+async def export_candidates(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    position: Optional[str] = None,
+    is_active: Optional[bool] = None,
+    sort: str = Query("id", description="Sort field, prefix with '-' for descending"),
+    gzip: Optional[bool] = Query(None, description="Force gzip on/off; defaults to the Accept-Encoding header")
+):
+    """Stream every matching candidate as NDJSON or CSV in constant memory"""
+    descending = sort.startswith('-')
+    sort_field = sort.lstrip('-')
+    if sort_field not in SORTABLE_FIELDS:
+        raise HTTPException(status_code=400, detail=f"sort must be one of: {', '.join(SORTABLE_FIELDS)}")
+    
+    if gzip is None:
+        gzip = 'gzip' in request.headers.get('accept-encoding', '')
+    
+    rows = iter_export_rows(position, is_active, sort_field, descending)
+    if format == 'csv':
+        chunks, media_type = iter_csv(rows), "text/csv"
+    else:
+        chunks, media_type = iter_ndjson(rows), "application/x-ndjson"
+    
+    headers = {"Content-Disposition": f"attachment; filename=candidates.{format}"}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    
+    return StreamingResponse(iter_encoded(chunks, gzip), media_type=media_type, headers=headers)
+
 @router.get("/{candidate_id}", response_model=Candidate)
 async def get_candidate(candidate_id: int):
     """Get a specific candidate by ID"""
-    candidates = load_candidates()
-    
-    candidate = next((c for c in candidates if c.get('id') == candidate_id), None)
+    candidate = get_candidate_store().get(candidate_id)
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
@@ -140,96 +358,143 @@ async def get_candidate(candidate_id: int):
 @router.put("/{candidate_id}", response_model=Candidate)
 async def update_candidate(candidate_id: int, candidate_update: CandidateUpdate):
     """Update a candidate"""
-    candidates = load_candidates()
-    
-    candidate_idx = next((i for i, c in enumerate(candidates) if c.get('id') == candidate_id), None)
-    if candidate_idx is None:
-        raise HTTPException(status_code=404, detail="Candidate not found")
-    
-    # Update candidate
+    # Update candidate (compare-and-swap when the client sends the version it read)
     update_data = candidate_update.dict(exclude_unset=True)
+    expected_version = update_data.pop('version', None)
     update_data['updated_at'] = datetime.now().isoformat()
     
-    candidates[candidate_idx].update(update_data)
-    save_candidates(candidates)
+    try:
+        candidate = get_candidate_store().update(candidate_id, update_data, expected_version)
+    except VersionConflictError as e:
+        raise version_conflict(e)
+    if candidate is None:
+        raise HTTPException(status_code=404, detail="Candidate not found")
     
-    return Candidate(**candidates[candidate_idx])
+    return Candidate(**candidate)
 
 @router.delete("/{candidate_id}")
-async def delete_candidate(candidate_id: int):
+async def delete_candidate(candidate_id: int, version: Optional[int] = Query(None, ge=1)):
     """Delete a candidate (soft delete)"""
-    candidates = load_candidates()
-    
-    candidate_idx = next((i for i, c in enumerate(candidates) if c.get('id') == candidate_id), None)
-    if candidate_idx is None:
+    try:
+        candidate = get_candidate_store().update(candidate_id, {
+            'is_active': False,
+            'updated_at': datetime.now().isoformat()
+        }, expected_version=version)
+    except VersionConflictError as e:
+        raise version_conflict(e)
+    if candidate is None:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    # Soft delete
-    candidates[candidate_idx]['is_active'] = False
-    candidates[candidate_idx]['updated_at'] = datetime.now().isoformat()
+    return {"message": "Candidate deleted successfully"}
+
+def with_final_score(current: dict, changes: dict) -> dict:
+    """Add the recomputed final score to `changes` when all three scores are known.
+    Runs against the record as stored under the write lock, so a concurrent update to
+    another score is never computed away."""
+    scores = [changes.get(field, current.get(field)) for field in ('resume_score', 'interview_score', 'technical_score')]
+    if all(score is not None for score in scores):
+        # Weighted average: resume (30%), interview (40%), technical (30%)
+        return {**changes, 'final_score': (scores[0] * 0.3 + scores[1] * 0.4 + scores[2] * 0.3)}
+    return changes
+
+@router.post("/batch-update", response_model=List[Candidate])
+async def batch_update_candidates(batch: CandidateBatchUpdate):
+    """Apply many score/decision updates atomically in one storage transaction.
     
-    save_candidates(candidates)
+    Either every patch is applied or none is: unknown IDs return 404 and a stale
+    `version` returns 409 before anything is written.
+    """
+    now = datetime.now().isoformat()
+    patches = {}
+    befores = {}
+    for patch in batch.updates:
+        if patch.candidate_id in patches:
+            raise HTTPException(status_code=400, detail=f"Candidate {patch.candidate_id} appears more than once")
+        changes = patch.dict(exclude_none=True, exclude={'candidate_id', 'version'})
+        changes['updated_at'] = now
+        def build_changes(current: dict, changes=changes) -> dict:
+            befores[current['id']] = dict(current)
+            return with_final_score(current, changes)
+        patches[patch.candidate_id] = (build_changes, patch.version)
     
-    return {"message": "Candidate deleted successfully"}
+    store = get_candidate_store()
+    try:
+        candidates = store.modify_many(patches)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=f"Candidates not found: {e.args[0]}")
+    except VersionConflictError as e:
+        raise version_conflict(e)
+    
+    written_fields = {patch.candidate_id: list(patch.dict(exclude_none=True)) for patch in batch.updates}
+    get_fairness_monitor().record_batch([(befores[c['id']], c, written_fields[c['id']]) for c in candidates])
+    return [Candidate(**c) for c in candidates]
 
 @router.post("/{candidate_id}/scores")
 async def update_candidate_scores(
     candidate_id: int,
     resume_score: Optional[float] = None,
     interview_score: Optional[float] = None,
-    technical_score: Optional[float] = None
+    technical_score: Optional[float] = None,
+    version: Optional[int] = Query(None, ge=1)
 ):
     """Update candidate scores"""
-    candidates = load_candidates()
-    
-    candidate_idx = next((i for i, c in enumerate(candidates) if c.get('id') == candidate_id), None)
-    if candidate_idx is None:
+    store = get_candidate_store()
+    if store.get(candidate_id) is None:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    candidate = candidates[candidate_idx]
+    changes = {}
     
     # Update scores
     if resume_score is not None:
         if not 0 <= resume_score <= 100:
             raise HTTPException(status_code=400, detail="Resume score must be between 0 and 100")
-        candidate['resume_score'] = resume_score
+        changes['resume_score'] = resume_score
     
     if interview_score is not None:
         if not 0 <= interview_score <= 100:
             raise HTTPException(status_code=400, detail="Interview score must be between 0 and 100")
-        candidate['interview_score'] = interview_score
+        changes['interview_score'] = interview_score
     
     if technical_score is not None:
         if not 0 <= technical_score <= 100:
             raise HTTPException(status_code=400, detail="Technical score must be between 0 and 100")
-        candidate['technical_score'] = technical_score
+        changes['technical_score'] = technical_score
     
-    # Calculate final score if all scores are available
-    scores = [candidate.get('resume_score'), candidate.get('interview_score'), candidate.get('technical_score')]
-    if all(score is not None for score in scores):
-        # Weighted average: resume (30%), interview (40%), technical (30%)
-        candidate['final_score'] = (scores[0] * 0.3 + scores[1] * 0.4 + scores[2] * 0.3)
+    changes['updated_at'] = datetime.now().isoformat()
     
-    candidate['updated_at'] = datetime.now().isoformat()
-    save_candidates(candidates)
+    before = {}
+    def build_changes(current: dict) -> dict:
+        before.update(current)
+        return with_final_score(current, changes)
+    
+    try:
+        candidate = store.modify(candidate_id, build_changes, version)
+    except VersionConflictError as e:
+        raise version_conflict(e)
+    if candidate is None:
+        raise HTTPException(status_code=404, detail="Candidate not found")
     
+    get_fairness_monitor().record_scores(before, candidate)
     return Candidate(**candidate)
 
 @router.post("/{candidate_id}/decision")
-async def make_hiring_decision(candidate_id: int, decision: str):
+async def make_hiring_decision(candidate_id: int, decision: str, version: Optional[int] = Query(None, ge=1)):
     """Make a hiring decision for a candidate"""
     if decision not in ['hired', 'rejected', 'on_hold']:
         raise HTTPException(status_code=400, detail="Decision must be 'hired', 'rejected', or 'on_hold'")
     
-    candidates = load_candidates()
+    store = get_candidate_store()
+    before = {}
+    def build_changes(current: dict) -> dict:
+        before.update(current)
+        return {'hiring_decision': decision, 'updated_at': datetime.now().isoformat()}
     
-    candidate_idx = next((i for i, c in enumerate(candidates) if c.get('id') == candidate_id), None)
-    if candidate_idx is None:
+    try:
+        candidate = store.modify(candidate_id, build_changes, expected_version=version)
+    except VersionConflictError as e:
+        raise version_conflict(e)
+    if candidate is None:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
-    candidates[candidate_idx]['hiring_decision'] = decision
-    candidates[candidate_idx]['updated_at'] = datetime.now().isoformat()
-    
-    save_candidates(candidates)
-    
+    get_fairness_monitor().record_decision(before, candidate)
     return {"message": f"Hiring decision '{decision}' recorded for candidate {candidate_id}"}
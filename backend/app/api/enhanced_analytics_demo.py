@@ -1,32 +1,18 @@
 from fastapi import APIRouter, Query
 from typing import Dict, List, Any, Optional
-import json
-import os
 from datetime import datetime, timedelta
 from collections import defaultdict, Counter
 import statistics
 import random
 from math import ceil
+from app.storage.candidate_store import get_candidate_store
+from app.storage.columnar import SCORE_FIELDS, get_candidate_columns
 
 router = APIRouter()
 
 def load_candidates() -> List[dict]:
-    """Load candidates from JSON file with enhanced path resolution"""
-    # Try multiple possible paths
-    possible_paths = [
-        "candidates.json",
-        os.path.join(os.path.dirname(__file__), "..", "..", "candidates.json"),
-        os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "candidates.json")
-    ]
-    
-    for path in possible_paths:
-        if os.path.exists(path):
-            try:
-                with open(path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, FileNotFoundError):
-                continue
-    return []
+    """Load candidates from the shared candidate store"""
+    return get_candidate_store().all()
 
 def generate_time_series_data(days_back=30, base_value=100, trend="growth"):
     """Generate realistic time series data for charts"""
@@ -56,13 +42,13 @@ def generate_time_series_data(days_back=30, base_value=100, trend="growth"):
 @router.get("/executive-dashboard")
 async def get_executive_dashboard():
     """Get high-level executive dashboard metrics"""
-    candidates = load_candidates()
+    columns = get_candidate_columns()
     
     # Key Performance Indicators
-    total_candidates = len(candidates)
-    hired_count = len([c for c in candidates if c.get('hiring_decision') == 'hired'])
-    in_progress = len([c for c in candidates if c.get('hiring_decision') in ['pending', 'interviewing']])
-    rejected_count = len([c for c in candidates if c.get('hiring_decision') == 'rejected'])
+    total_candidates = columns.size
+    hired_count = int(columns.mask('hiring_decision', 'hired').sum())
+    in_progress = int((columns.mask('hiring_decision', 'pending') | columns.mask('hiring_decision', 'interviewing')).sum())
+    rejected_count = int(columns.mask('hiring_decision', 'rejected').sum())
     
     # Calculate rates
     hire_rate = (hired_count / total_candidates * 100) if total_candidates > 0 else 0
@@ -76,7 +62,7 @@ async def get_executive_dashboard():
     total_hiring_cost = cost_per_hire * hired_count
     
     # Diversity metrics
-    diversity_stats = calculate_diversity_metrics(candidates)
+    diversity_stats = calculate_diversity_metrics(columns)
     
     # Monthly trends
     hiring_trend = generate_time_series_data(30, 25, "growth")
@@ -121,31 +107,24 @@ async def get_executive_dashboard():
         ]
     }
 
-def calculate_diversity_metrics(candidates):
-    """Calculate comprehensive diversity metrics"""
-    total = len(candidates)
-    if total == 0:
+def calculate_diversity_metrics(columns):
+    """Calculate comprehensive diversity metrics from the columnar candidate snapshot"""
+    if columns.size == 0:
         return {}
     
-    # Gender distribution
-    gender_dist = Counter(c.get('gender', 'unknown') for c in candidates)
-    
-    # Ethnicity distribution
-    ethnicity_dist = Counter(c.get('ethnicity', 'unknown') for c in candidates)
-    
-    # Age distribution
-    ages = [c.get('age', 0) for c in candidates if c.get('age')]
+    # Age distribution (NaN ages compare False everywhere, so they drop out)
+    ages = columns.numeric['age']
     age_groups = {
-        "18-25": len([a for a in ages if 18 <= a <= 25]),
-        "26-35": len([a for a in ages if 26 <= a <= 35]),
-        "36-45": len([a for a in ages if 36 <= a <= 45]),
-        "46-55": len([a for a in ages if 46 <= a <= 55]),
-        "55+": len([a for a in ages if a > 55])
+        "18-25": int(((ages >= 18) & (ages <= 25)).sum()),
+        "26-35": int(((ages >= 26) & (ages <= 35)).sum()),
+        "36-45": int(((ages >= 36) & (ages <= 45)).sum()),
+        "46-55": int(((ages >= 46) & (ages <= 55)).sum()),
+        "55+": int((ages > 55).sum())
     }
     
     return {
-        "gender_distribution": dict(gender_dist),
-        "ethnicity_distribution": dict(ethnicity_dist),
+        "gender_distribution": columns.value_counts('gender', default='unknown'),
+        "ethnicity_distribution": columns.value_counts('ethnicity', default='unknown'),
         "age_distribution": age_groups,
         "diversity_score": random.randint(78, 85),  # Demo score
         "inclusion_metrics": {
@@ -537,30 +516,28 @@ async def get_real_time_metrics():
 @router.get("/summary")
 async def get_analytics_summary():
     """Get comprehensive analytics summary with enhanced demo data"""
-    candidates = load_candidates()
+    columns = get_candidate_columns()
     
-    if not candidates:
+    if not columns.size:
         # Return impressive demo data even with no candidates
         return {
             "total_candidates": 0,
             "message": "No candidate data available"
         }
     
-    total_candidates = len(candidates)
-    hired_count = len([c for c in candidates if c.get('hiring_decision') == 'hired'])
+    total_candidates = columns.size
+    hired_count = int(columns.mask('hiring_decision', 'hired').sum())
     
     # Enhanced position statistics
-    positions = set(c.get('position_applied', 'Unknown') for c in candidates)
-    total_positions = len(positions)
+    total_positions = len(columns.value_counts('position_applied', default='Unknown'))
     
-    # Score averages with better handling
-    score_fields = ['resume_score', 'interview_score', 'technical_score', 'final_score']
+    # Score averages with better handling (non-numeric values are NaN in the snapshot)
     average_scores = {}
     
-    for field in score_fields:
-        scores = [c.get(field) for c in candidates if c.get(field) is not None and isinstance(c.get(field), (int, float))]
-        if scores:
-            average_scores[field] = round(sum(scores) / len(scores), 2)
+    for field in SCORE_FIELDS:
+        present = columns.present(field)
+        if present.any():
+            average_scores[field] = round(float(columns.numeric[field][present].mean()), 2)
         else:
             # Demo values for impressive display
             demo_scores = {
@@ -3,6 +3,7 @@ from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 import json
 import random
+from app.storage.database import get_table
 
 router = APIRouter()
 
@@ -159,6 +160,10 @@ FEEDBACK_DATA = {
     }
 }
 
+def get_feedback_table():
+    """Feedback forms table, seeded with the sample forms above on first use"""
+    return get_table('feedback', seed=FEEDBACK_DATA["feedback_forms"])
+
 @router.get("/templates")
 async def get_feedback_templates():
     """Get available feedback templates"""
@@ -250,9 +255,8 @@ async def submit_feedback(feedback_data: Dict[str, Any]):
             if field not in feedback_data:
                 raise HTTPException(status_code=400, detail=f"Missing required field: {field}")
         
-        # Create feedback record
+        # Create feedback record (the table assigns the next ID)
         feedback_record = {
-            "id": len(FEEDBACK_DATA["feedback_forms"]) + 1,
             "interview_id": feedback_data["interview_id"],
             "candidate_id": feedback_data.get("candidate_id"),
             "candidate_name": feedback_data.get("candidate_name"),
@@ -278,7 +282,7 @@ async def submit_feedback(feedback_data: Dict[str, Any]):
             "custom_fields": feedback_data.get("custom_fields", {})
         }
         
-        FEEDBACK_DATA["feedback_forms"].append(feedback_record)
+        get_feedback_table().insert(feedback_record)
         
         return {
             "success": True,
@@ -292,10 +296,7 @@ async def submit_feedback(feedback_data: Dict[str, Any]):
 @router.get("/interviews/{interview_id}")
 async def get_interview_feedback(interview_id: int):
     """Get all feedback for a specific interview"""
-    feedback_list = [
-        feedback for feedback in FEEDBACK_DATA["feedback_forms"]
-        if feedback["interview_id"] == interview_id
-    ]
+    feedback_list = get_feedback_table().find(interview_id=interview_id)
     
     return {
         "success": True,
@@ -305,10 +306,7 @@ async def get_interview_feedback(interview_id: int):
 @router.get("/candidates/{candidate_id}")
 async def get_candidate_feedback(candidate_id: int):
     """Get all feedback for a specific candidate"""
-    feedback_list = [
-        feedback for feedback in FEEDBACK_DATA["feedback_forms"]
-        if feedback.get("candidate_id") == candidate_id
-    ]
+    feedback_list = get_feedback_table().find(candidate_id=candidate_id)
     
     return {
         "success": True,
@@ -318,10 +316,7 @@ async def get_candidate_feedback(candidate_id: int):
 @router.get("/interviewers/{interviewer_id}")
 async def get_interviewer_feedback(interviewer_id: int):
     """Get all feedback submitted by a specific interviewer"""
-    feedback_list = [
-        feedback for feedback in FEEDBACK_DATA["feedback_forms"]
-        if feedback["interviewer_id"] == interviewer_id
-    ]
+    feedback_list = get_feedback_table().find(interviewer_id=interviewer_id)
     
     return {
         "success": True,
@@ -332,7 +327,7 @@ async def get_interviewer_feedback(interviewer_id: int):
 async def get_feedback_analytics():
     """Get feedback analytics and metrics"""
     # Calculate additional analytics
-    all_feedback = FEEDBACK_DATA["feedback_forms"]
+    all_feedback = get_feedback_table().all()
     
     if not all_feedback:
         return {
@@ -397,10 +392,7 @@ async def get_feedback_analytics():
 @router.get("/summary/{candidate_id}")
 async def get_candidate_feedback_summary(candidate_id: int):
     """Get summarized feedback for a candidate"""
-    candidate_feedback = [
-        feedback for feedback in FEEDBACK_DATA["feedback_forms"]
-        if feedback.get("candidate_id") == candidate_id
-    ]
+    candidate_feedback = get_feedback_table().find(candidate_id=candidate_id)
     
     if not candidate_feedback:
         return {
@@ -464,11 +456,8 @@ async def update_feedback(feedback_id: int, update_data: Dict[str, Any]):
     """Update existing feedback"""
     try:
         # Find feedback
-        feedback = None
-        for f in FEEDBACK_DATA["feedback_forms"]:
-            if f["id"] == feedback_id:
-                feedback = f
-                break
+        table = get_feedback_table()
+        feedback = table.get(feedback_id)
         
         if not feedback:
             raise HTTPException(status_code=404, detail="Feedback not found")
@@ -479,6 +468,7 @@ async def update_feedback(feedback_id: int, update_data: Dict[str, Any]):
                 feedback[key] = value
         
         feedback["updated_at"] = datetime.now().isoformat()
+        table.update(feedback_id, feedback)
         
         return {
             "success": True,
@@ -494,13 +484,11 @@ async def delete_feedback(feedback_id: int):
     """Delete feedback"""
     try:
         # Find and remove feedback
-        for i, feedback in enumerate(FEEDBACK_DATA["feedback_forms"]):
-            if feedback["id"] == feedback_id:
-                del FEEDBACK_DATA["feedback_forms"][i]
-                return {
-                    "success": True,
-                    "message": "Feedback deleted successfully"
-                }
+        if get_feedback_table().delete(feedback_id) is not None:
+            return {
+                "success": True,
+                "message": "Feedback deleted successfully"
+            }
         
         raise HTTPException(status_code=404, detail="Feedback not found")
     
@@ -519,28 +507,9 @@ async def export_feedback(
         if format not in ["excel", "csv", "pdf"]:
             raise HTTPException(status_code=400, detail="Unsupported export format")
         
-        filtered_feedback = FEEDBACK_DATA["feedback_forms"]
-        
-        # Apply filters
-        if date_from:
-            date_from_obj = datetime.fromisoformat(date_from)
-            filtered_feedback = [
-                f for f in filtered_feedback
-                if datetime.fromisoformat(f["feedback_submitted_at"]) >= date_from_obj
-            ]
-        
-        if date_to:
-            date_to_obj = datetime.fromisoformat(date_to)
-            filtered_feedback = [
-                f for f in filtered_feedback
-                if datetime.fromisoformat(f["feedback_submitted_at"]) <= date_to_obj
-            ]
-        
-        if interviewer_id:
-            filtered_feedback = [
-                f for f in filtered_feedback
-                if f["interviewer_id"] == interviewer_id
-            ]
+        # Apply filters as an indexed query on submission date and interviewer
+        filters = {"interviewer_id": interviewer_id} if interviewer_id else {}
+        filtered_feedback = get_feedback_table().find(date_from=date_from, date_to=date_to, **filters)
         
         export_data = {
             "export_id": f"feedback_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
@@ -2,8 +2,8 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 from typing import List, Optional
 from datetime import datetime
-import json
-from pathlib import Path
+from app.storage.candidate_store import get_candidate_store
+from app.storage.database import get_table
 
 router = APIRouter()
 
@@ -83,41 +83,9 @@ class UpdateInterviewRequest(BaseModel):
     meeting_link: Optional[str] = None
     notes: Optional[str] = None
 
-def load_interviews():
-    """Load interviews from JSON file"""
-    interviews_file = Path(__file__).parent.parent / "interviews.json"
-    try:
-        with open(interviews_file, 'r') as f:
-            data = json.load(f)
-            # Convert datetime strings back to datetime objects
-            for interview in data:
-                interview['scheduled_date'] = datetime.fromisoformat(interview['scheduled_date'].replace('Z', '+00:00'))
-            return data
-    except FileNotFoundError:
-        return []
-
-def save_interviews(interviews):
-    """Save interviews to JSON file"""
-    interviews_file = Path(__file__).parent.parent / "interviews.json"
-    # Convert datetime objects to strings for JSON serialization
-    interviews_to_save = []
-    for interview in interviews:
-        interview_copy = interview.copy()
-        if isinstance(interview_copy['scheduled_date'], datetime):
-            interview_copy['scheduled_date'] = interview_copy['scheduled_date'].isoformat()
-        interviews_to_save.append(interview_copy)
-    
-    with open(interviews_file, 'w') as f:
-        json.dump(interviews_to_save, f, indent=2)
-
-def load_candidates():
-    """Load candidates from JSON file"""
-    candidates_file = Path(__file__).parent.parent / "candidates.json"
-    try:
-        with open(candidates_file, 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return []
+def get_interviews_table():
+    """Interviews table from the configured storage backend"""
+    return get_table('interviews')
 
 def get_mock_interviewers():
     """Get mock interviewer data"""
@@ -261,12 +229,12 @@ def get_mock_templates():
 async def get_interviews(status: Optional[str] = Query(None, description="Filter by interview status")):
     """Get all interviews with optional status filtering"""
     try:
-        interviews = load_interviews()
+        table = get_interviews_table()
         
         if status:
-            interviews = [i for i in interviews if i.get('status') == status]
+            return table.find(status=status)
         
-        return interviews
+        return table.all()
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error loading interviews: {str(e)}")
 
@@ -274,12 +242,11 @@ async def get_interviews(status: Optional[str] = Query(None, description="Filter
 async def create_interview(interview_request: CreateInterviewRequest):
     """Create a new interview"""
     try:
-        interviews = load_interviews()
-        candidates = load_candidates()
+        table = get_interviews_table()
         interviewers = get_mock_interviewers()
         
         # Validate candidate exists
-        candidate = next((c for c in candidates if c.get('id') == interview_request.candidate_id), None)
+        candidate = get_candidate_store().get(interview_request.candidate_id)
         if not candidate:
             raise HTTPException(status_code=404, detail="Candidate not found")
         
@@ -290,12 +257,8 @@ async def create_interview(interview_request: CreateInterviewRequest):
             if interviewer:
                 interview_interviewers.append(interviewer)
         
-        # Generate new interview ID
-        new_id = max([i.get('id', 0) for i in interviews], default=0) + 1
-        
-        # Create new interview
+        # Create new interview (the table assigns the next ID)
         new_interview = {
-            "id": new_id,
             "candidate_id": interview_request.candidate_id,
             "candidate_name": interview_request.candidate_name,
             "position": interview_request.position,
@@ -310,10 +273,7 @@ async def create_interview(interview_request: CreateInterviewRequest):
             "template_id": interview_request.template_id
         }
         
-        interviews.append(new_interview)
-        save_interviews(interviews)
-        
-        return new_interview
+        return table.insert(new_interview)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating interview: {str(e)}")
 
@@ -321,8 +281,7 @@ async def create_interview(interview_request: CreateInterviewRequest):
 async def get_interview(interview_id: int):
     """Get a specific interview by ID"""
     try:
-        interviews = load_interviews()
-        interview = next((i for i in interviews if i.get('id') == interview_id), None)
+        interview = get_interviews_table().get(interview_id)
         
         if not interview:
             raise HTTPException(status_code=404, detail="Interview not found")
@@ -335,20 +294,19 @@ async def get_interview(interview_id: int):
 async def update_interview(interview_id: int, update_request: UpdateInterviewRequest):
     """Update an existing interview"""
     try:
-        interviews = load_interviews()
-        interview_index = next((i for i, interview in enumerate(interviews) if interview.get('id') == interview_id), None)
+        table = get_interviews_table()
+        interview = table.get(interview_id)
         
-        if interview_index is None:
+        if interview is None:
             raise HTTPException(status_code=404, detail="Interview not found")
         
         # Update interview fields
-        interview = interviews[interview_index]
         update_data = update_request.dict(exclude_unset=True)
         
         for field, value in update_data.items():
             interview[field] = value
         
-        save_interviews(interviews)
+        table.update(interview_id, interview)
         return interview
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error updating interview: {str(e)}")
@@ -357,15 +315,11 @@ async def update_interview(interview_id: int, update_request: UpdateInterviewReq
 async def delete_interview(interview_id: int):
     """Delete an interview"""
     try:
-        interviews = load_interviews()
-        interview_index = next((i for i, interview in enumerate(interviews) if interview.get('id') == interview_id), None)
+        deleted_interview = get_interviews_table().delete(interview_id)
         
-        if interview_index is None:
+        if deleted_interview is None:
             raise HTTPException(status_code=404, detail="Interview not found")
         
-        deleted_interview = interviews.pop(interview_index)
-        save_interviews(interviews)
-        
         return {"message": "Interview deleted successfully", "deleted_interview": deleted_interview}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error deleting interview: {str(e)}")
@@ -383,17 +337,16 @@ async def get_interview_templates():
 async def submit_interview_scores(interview_id: int, scores: List[InterviewScore]):
     """Submit scores for an interview"""
     try:
-        interviews = load_interviews()
-        interview_index = next((i for i, interview in enumerate(interviews) if interview.get('id') == interview_id), None)
+        table = get_interviews_table()
+        interview = table.get(interview_id)
         
-        if interview_index is None:
+        if interview is None:
             raise HTTPException(status_code=404, detail="Interview not found")
         
-        interview = interviews[interview_index]
         interview['scores'] = [score.dict() for score in scores]
         interview['status'] = 'completed'
         
-        save_interviews(interviews)
+        table.update(interview_id, interview)
         
         return {"message": "Scores submitted successfully", "interview": interview}
     except Exception as e:
@@ -403,15 +356,16 @@ async def submit_interview_scores(interview_id: int, scores: List[InterviewScore
 async def get_interview_analytics():
     """Get interview analytics summary"""
     try:
-        interviews = load_interviews()
+        table = get_interviews_table()
         
-        total_interviews = len(interviews)
-        completed_interviews = len([i for i in interviews if i.get('status') == 'completed'])
-        scheduled_interviews = len([i for i in interviews if i.get('status') == 'scheduled'])
-        cancelled_interviews = len([i for i in interviews if i.get('status') == 'cancelled'])
+        total_interviews = table.count()
+        completed = table.find(status='completed')
+        completed_interviews = len(completed)
+        scheduled_interviews = table.count(status='scheduled')
+        cancelled_interviews = table.count(status='cancelled')
         
         # Calculate average scores
-        completed_with_scores = [i for i in interviews if i.get('status') == 'completed' and i.get('scores')]
+        completed_with_scores = [i for i in completed if i.get('scores')]
         avg_score = 0
         if completed_with_scores:
             total_score = 0
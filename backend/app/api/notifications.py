@@ -8,6 +8,7 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
 from email import encoders
 import logging
+from app.storage.database import get_table
 
 router = APIRouter()
 
@@ -195,6 +196,14 @@ class EmailService:
             logging.error(f"Failed to send email: {e}")
             return False
 
+def get_history_table():
+    """Sent notification log, seeded with the sample history above on first use"""
+    return get_table('notifications', seed=NOTIFICATIONS_DATA["notification_history"])
+
+def get_scheduled_table():
+    """Scheduled notifications, seeded with the sample entries above on first use"""
+    return get_table('scheduled_notifications', seed=NOTIFICATIONS_DATA["scheduled_notifications"])
+
 @router.get("/templates")
 async def get_email_templates():
     """Get all available email templates"""
@@ -234,9 +243,8 @@ async def send_notification(
             notification_data.get("attachments", [])
         )
         
-        # Log notification
+        # Log notification (the table assigns the next ID)
         notification_record = {
-            "id": len(NOTIFICATIONS_DATA["notification_history"]) + 1,
             "type": template_name,
             "recipient": recipient,
             "candidate_name": template_data.get("candidate_name", ""),
@@ -245,7 +253,7 @@ async def send_notification(
             "status": "sent",
             "template_used": template_name
         }
-        NOTIFICATIONS_DATA["notification_history"].append(notification_record)
+        get_history_table().insert(notification_record)
         
         return {
             "success": True,
@@ -272,7 +280,6 @@ async def schedule_notification(notification_data: Dict[str, Any]):
             )
         
         scheduled_notification = {
-            "id": len(NOTIFICATIONS_DATA["scheduled_notifications"]) + 1,
             "type": template_name,
             "recipient": recipient,
             "candidate_name": template_data.get("candidate_name", ""),
@@ -282,7 +289,7 @@ async def schedule_notification(notification_data: Dict[str, Any]):
             "created_at": datetime.now().isoformat()
         }
         
-        NOTIFICATIONS_DATA["scheduled_notifications"].append(scheduled_notification)
+        get_scheduled_table().insert(scheduled_notification)
         
         return {
             "success": True,
@@ -296,11 +303,11 @@ async def schedule_notification(notification_data: Dict[str, Any]):
 @router.get("/history")
 async def get_notification_history(limit: int = 50, offset: int = 0):
     """Get notification history"""
-    history = NOTIFICATIONS_DATA["notification_history"]
-    total = len(history)
+    table = get_history_table()
+    total = table.count()
     
-    # Apply pagination
-    paginated_history = history[offset:offset + limit]
+    # Apply pagination in the query
+    paginated_history = table.find(limit=limit, offset=offset)
     
     return {
         "success": True,
@@ -315,7 +322,7 @@ async def get_scheduled_notifications():
     """Get all scheduled notifications"""
     return {
         "success": True,
-        "scheduled_notifications": NOTIFICATIONS_DATA["scheduled_notifications"]
+        "scheduled_notifications": get_scheduled_table().all()
     }
 
 @router.put("/scheduled/{notification_id}")
@@ -323,11 +330,8 @@ async def update_scheduled_notification(notification_id: int, update_data: Dict[
     """Update a scheduled notification"""
     try:
         # Find the notification
-        notification = None
-        for notif in NOTIFICATIONS_DATA["scheduled_notifications"]:
-            if notif["id"] == notification_id:
-                notification = notif
-                break
+        table = get_scheduled_table()
+        notification = table.get(notification_id)
         
         if not notification:
             raise HTTPException(status_code=404, detail="Scheduled notification not found")
@@ -338,6 +342,7 @@ async def update_scheduled_notification(notification_id: int, update_data: Dict[
                 notification[key] = value
         
         notification["updated_at"] = datetime.now().isoformat()
+        table.update(notification_id, notification)
         
         return {
             "success": True,
@@ -353,13 +358,11 @@ async def cancel_scheduled_notification(notification_id: int):
     """Cancel a scheduled notification"""
     try:
         # Find and remove the notification
-        for i, notif in enumerate(NOTIFICATIONS_DATA["scheduled_notifications"]):
-            if notif["id"] == notification_id:
-                del NOTIFICATIONS_DATA["scheduled_notifications"][i]
-                return {
-                    "success": True,
-                    "message": "Scheduled notification cancelled successfully"
-                }
+        if get_scheduled_table().delete(notification_id) is not None:
+            return {
+                "success": True,
+                "message": "Scheduled notification cancelled successfully"
+            }
         
         raise HTTPException(status_code=404, detail="Scheduled notification not found")
     
@@ -459,7 +462,6 @@ async def send_bulk_notifications(
                 
                 # Log notification
                 notification_record = {
-                    "id": len(NOTIFICATIONS_DATA["notification_history"]) + 1,
                     "type": template_name,
                     "recipient": recipient_email,
                     "candidate_name": recipient_template_data.get("candidate_name", ""),
@@ -468,7 +470,7 @@ async def send_bulk_notifications(
                     "status": "sent",
                     "template_used": template_name
                 }
-                NOTIFICATIONS_DATA["notification_history"].append(notification_record)
+                get_history_table().insert(notification_record)
                 sent_count += 1
                 
             except Exception as e:
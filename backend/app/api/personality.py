@@ -1,9 +1,8 @@
 from fastapi import APIRouter, HTTPException
 from typing import List, Dict, Any, Optional
 from pydantic import BaseModel
-import json
-import os
 from datetime import datetime
+from app.storage.candidate_store import get_candidate_store
 
 router = APIRouter()
 
@@ -19,22 +18,8 @@ class AssessmentRequest(BaseModel):
     responses: Dict[str, int]
 
 def load_candidates() -> List[dict]:
-    """Load candidates from JSON file"""
-    if not os.path.exists("candidates.json"):
-        return []
-    try:
-        with open("candidates.json", 'r') as f:
-            return json.load(f)
-    except (json.JSONDecodeError, FileNotFoundError):
-        return []
-
-def save_candidates(candidates: List[dict]):
-    """Save candidates to JSON file"""
-    try:
-        with open("candidates.json", 'w') as f:
-            json.dump(candidates, f, indent=2)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Failed to save candidates: {str(e)}")
+    """Load candidates from the shared candidate store"""
+    return get_candidate_store().all()
 
 def calculate_mbti_type(responses: Dict[str, int]) -> Dict[str, Any]:
     """Calculate MBTI type from assessment responses"""
@@ -118,32 +103,26 @@ def calculate_mbti_type(responses: Dict[str, int]) -> Dict[str, Any]:
 @router.post("/assess")
 async def submit_personality_assessment(assessment: AssessmentRequest):
     """Submit personality assessment for a candidate"""
-    candidates = load_candidates()
+    store = get_candidate_store()
     
     # Find candidate
-    candidate_index = None
-    for i, candidate in enumerate(candidates):
-        if candidate.get('id') == assessment.candidate_id:
-            candidate_index = i
-            break
-    
-    if candidate_index is None:
+    if store.get(assessment.candidate_id) is None:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
     # Calculate MBTI type
     result = calculate_mbti_type(assessment.responses)
     
-    # Update candidate with assessment results
-    candidates[candidate_index].update({
-        'mbti_type': result['mbti_type'],
-        'personality_scores': result['personality_scores'],
-        'personality_traits': result['personality_traits'],
-        'assessment_date': datetime.now().isoformat(),
-        'assessment_responses': assessment.responses
-    })
-    
-    # Save updated candidates
-    save_candidates(candidates)
+    # Update and save candidate with assessment results
+    try:
+        store.update(assessment.candidate_id, {
+            'mbti_type': result['mbti_type'],
+            'personality_scores': result['personality_scores'],
+            'personality_traits': result['personality_traits'],
+            'assessment_date': datetime.now().isoformat(),
+            'assessment_responses': assessment.responses
+        })
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to save candidates: {str(e)}")
     
     return {
         "success": True,
@@ -243,9 +222,7 @@ async def get_mbti_distribution():
 @router.get("/candidate/{candidate_id}")
 async def get_candidate_personality(candidate_id: int):
     """Get personality assessment for a specific candidate"""
-    candidates = load_candidates()
-    
-    candidate = next((c for c in candidates if c.get('id') == candidate_id), None)
+    candidate = get_candidate_store().get(candidate_id)
     if not candidate:
         raise HTTPException(status_code=404, detail="Candidate not found")
     
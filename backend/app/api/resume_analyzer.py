@@ -1,21 +1,30 @@
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 from pydantic import BaseModel
 from typing import List, Dict, Any, Optional
+import hashlib
 import json
 import os
+import sys
 import tempfile
 import aiofiles
 from pathlib import Path
-from openai import AzureOpenAI
-import PyPDF2
-from io import BytesIO
+from openai import APITimeoutError
+from ..ai.azure_client import get_azure_client
+from ..ai.text_extractor import ResumeTooLargeError, get_resume_text_extractor
 from ..config import settings
+from ..storage.analysis_cache import content_key, get_resume_analysis_cache
+
+# Add the services directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from services.skill_matcher import SkillMatcher, is_clear_reject
 
 router = APIRouter()
 
 class ResumeAnalysisRequest(BaseModel):
     position_title: str
     resume_text: Optional[str] = None
+    prescreen: bool = True  # skip the LLM when the local skill match is a clear reject
 
 class SkillMatch(BaseModel):
     skill: str
@@ -42,18 +51,6 @@ def load_job_descriptions() -> List[Dict[str, Any]]:
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="Job descriptions file not found")
 
-def extract_text_from_pdf(file_content: bytes) -> str:
-    """Extract text from PDF file"""
-    try:
-        pdf_file = BytesIO(file_content)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text.strip()
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error extracting text from PDF: {str(e)}")
-
 def get_job_description_by_title(position_title: str, job_descriptions: List[Dict]) -> Optional[Dict]:
     """Find job description by position title"""
     for job in job_descriptions:
@@ -61,30 +58,18 @@ def get_job_description_by_title(position_title: str, job_descriptions: List[Dic
             return job
     return None
 
-async def analyze_resume_with_azure_openai(resume_text: str, job_description: Dict) -> Dict[str, Any]:
-    """Analyze resume against job description using Azure OpenAI"""
-    
-    if not settings.azure_openai_api_key:
-        raise HTTPException(status_code=500, detail="Azure OpenAI API key not configured")
-    
-    try:
-        client = AzureOpenAI(
-            azure_endpoint=settings.azure_openai_endpoint,
-            api_key=settings.azure_openai_api_key,
-            api_version=settings.azure_openai_api_version,
-        )
-        
-        # Prepare job description context
-        job_context = f"""
-        Position: {job_description.get('PositionTitle', '')}
-        Core Skills: {', '.join(job_description.get('CoreSkills', []))}
-        Technical Skills: {job_description.get('TechnicalSkills', {})}
-        Minimum Experience: {job_description.get('QualificationExperience', {}).get('MinimumExperienceYears', 'Not specified')} years
-        Education Requirements: {job_description.get('QualificationsExperience', {}).get('DegreeRequirements', [])}
-        Specific Knowledge & Skills: {job_description.get('SpecificKnowledgeSkill', [])}
+# Prompt templates and generation parameters. PROMPT_VERSION hashes all of them into the
+# analysis cache key, so editing any prompt invalidates previously cached analyses.
+JOB_CONTEXT_TEMPLATE = """
+        Position: {position}
+        Core Skills: {core_skills}
+        Technical Skills: {technical_skills}
+        Minimum Experience: {minimum_experience} years
+        Education Requirements: {degree_requirements}
+        Specific Knowledge & Skills: {specific_knowledge}
         """
-        
-        system_prompt = """You are an expert resume analyzer and HR consultant. Your task is to analyze a candidate's resume against a specific job description and provide a comprehensive assessment.
+
+SYSTEM_PROMPT = """You are an expert resume analyzer and HR consultant. Your task is to analyze a candidate's resume against a specific job description and provide a comprehensive assessment.
 
 Please analyze the resume and provide a JSON response with the following structure:
 {
@@ -113,7 +98,7 @@ Focus on:
 5. Areas for improvement
 """
 
-        user_prompt = f"""
+USER_PROMPT_TEMPLATE = """
         Job Description:
         {job_context}
         
@@ -123,19 +108,103 @@ Focus on:
         Please analyze this resume against the job requirements and provide a detailed assessment in the specified JSON format.
         """
 
-        response = client.chat.completions.create(
-            model=settings.azure_openai_model,
-            messages=[
-                {"role": "system", "content": system_prompt},
+COMPLETION_PARAMS = {"temperature": 0.3, "max_tokens": 2000}
+
+PROMPT_VERSION = hashlib.sha256(
+    json.dumps([JOB_CONTEXT_TEMPLATE, SYSTEM_PROMPT, USER_PROMPT_TEMPLATE, COMPLETION_PARAMS], sort_keys=True).encode()
+).hexdigest()[:16]
+
+def analysis_cache_key(resume_text: str, job_description: Dict) -> str:
+    """Content address of an analysis: whitespace-normalized resume text, the full job
+    description record, the prompt version and the model"""
+    return content_key(
+        resume=' '.join(resume_text.split()),
+        job=job_description,
+        prompt=PROMPT_VERSION,
+        model=settings.azure_openai_model
+    )
+
+# Compiled skill matchers by job description content, and pre-screen counters
+_skill_matchers: Dict[str, SkillMatcher] = {}
+prescreen_stats = {"screened": 0, "rejected": 0}
+
+def get_skill_matcher(job_description: Dict) -> SkillMatcher:
+    """Skill matcher for a job description, compiled once per distinct record"""
+    key = content_key(job=job_description)
+    matcher = _skill_matchers.get(key)
+    if matcher is None:
+        matcher = _skill_matchers[key] = SkillMatcher.for_position(job_description)
+    return matcher
+
+def prescreen_resume(resume_text: str, job_description: Dict) -> Optional[Dict[str, Any]]:
+    """Analysis built from the local skill match when the resume is a clear reject, else None"""
+    match = get_skill_matcher(job_description).match(resume_text)
+    prescreen_stats["screened"] += 1
+    if not is_clear_reject(match, settings.skill_prescreen_min_core_coverage, settings.skill_prescreen_min_coverage):
+        return None
+    prescreen_stats["rejected"] += 1
+
+    core_skills = job_description.get('CoreSkills', [])
+    found_core = [skill['skill'] for skill in match['matched_skills'] if skill['mentioned'] and skill['skill'] in core_skills]
+    not_assessed = "Not assessed: the resume did not pass the skill pre-screen"
+    return {
+        "overall_score": round(100 * match['skill_coverage'], 1),
+        "position_match": "poor",
+        "matched_skills": match['matched_skills'],
+        "missing_skills": match['missing_skills'],
+        "experience_assessment": not_assessed,
+        "education_match": not_assessed,
+        "recommendations": [
+            f"Resume mentions {len(found_core)} of {len(core_skills)} core skills for "
+            f"{job_description.get('PositionTitle', 'this position')}; re-run without the pre-screen "
+            "for a full assessment if the resume describes them in other words"
+        ],
+        "detailed_analysis": (
+            f"Local skill pre-screen: {match['skill_coverage']:.0%} weighted skill coverage and "
+            f"{match['core_coverage']:.0%} of core skills mentioned, below the thresholds for LLM analysis."
+        ),
+        "confidence_score": 0.8
+    }
+
+async def analyze_resume_with_azure_openai(resume_text: str, job_description: Dict,
+                                           prescreen: bool = True) -> Dict[str, Any]:
+    """Analyze resume against job description using Azure OpenAI"""
+    
+    if prescreen and settings.skill_prescreen_enabled:
+        rejected = prescreen_resume(resume_text, job_description)
+        if rejected is not None:
+            return rejected
+    
+    cache = get_resume_analysis_cache()
+    cache_key = analysis_cache_key(resume_text, job_description)
+    cached = cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    if not settings.azure_openai_api_key:
+        raise HTTPException(status_code=500, detail="Azure OpenAI API key not configured")
+    
+    try:
+        # Prepare job description context
+        job_context = JOB_CONTEXT_TEMPLATE.format(
+            position=job_description.get('PositionTitle', ''),
+            core_skills=', '.join(job_description.get('CoreSkills', [])),
+            technical_skills=job_description.get('TechnicalSkills', {}),
+            minimum_experience=job_description.get('QualificationExperience', {}).get('MinimumExperienceYears', 'Not specified'),
+            degree_requirements=job_description.get('QualificationsExperience', {}).get('DegreeRequirements', []),
+            specific_knowledge=job_description.get('SpecificKnowledgeSkill', [])
+        )
+        user_prompt = USER_PROMPT_TEMPLATE.format(job_context=job_context, resume_text=resume_text)
+
+        # Shared pooled async client: the event loop keeps serving while this is in flight
+        analysis_text = await get_azure_client().complete(
+            [
+                {"role": "system", "content": SYSTEM_PROMPT},
                 {"role": "user", "content": user_prompt}
             ],
-            temperature=0.3,
-            max_tokens=2000
+            **COMPLETION_PARAMS
         )
         
-        # Parse the response
-        analysis_text = response.choices[0].message.content
-        
         # Try to extract JSON from the response
         try:
             # Find JSON content in the response
@@ -144,6 +213,8 @@ Focus on:
             if start_idx != -1 and end_idx != -1:
                 json_str = analysis_text[start_idx:end_idx]
                 analysis_result = json.loads(json_str)
+                # Only parsed model answers are cached; fallbacks are retried next time
+                cache.put(cache_key, analysis_result)
             else:
                 # Fallback: create structured response
                 analysis_result = {
@@ -173,13 +244,16 @@ Focus on:
         
         return analysis_result
         
+    except APITimeoutError:
+        raise HTTPException(status_code=504, detail="Azure OpenAI request timed out")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error analyzing resume with Azure OpenAI: {str(e)}")
 
 @router.post("/upload-resume", response_model=ResumeAnalysisResponse)
 async def analyze_uploaded_resume(
     position_title: str = Form(...),
-    resume_file: UploadFile = File(...)
+    resume_file: UploadFile = File(...),
+    prescreen: bool = Form(True)
 ):
     """Upload and analyze a resume file against a job description"""
     
@@ -188,14 +262,17 @@ async def analyze_uploaded_resume(
         raise HTTPException(status_code=400, detail="Only PDF and text files are supported")
     
     try:
-        # Read file content
-        content = await resume_file.read()
-        
-        # Extract text based on file type
-        if resume_file.content_type == "application/pdf":
-            resume_text = extract_text_from_pdf(content)
-        else:
-            resume_text = content.decode('utf-8')
+        # Extract text based on file type; PDFs are parsed in the extraction process pool
+        file_name = "resume.pdf" if resume_file.content_type == "application/pdf" else "resume.txt"
+        extractor = get_resume_text_extractor()
+        try:
+            # Read file content, stopping early past the size limit
+            content = await extractor.read_upload(resume_file)
+            resume_text = await extractor.extract(file_name, content)
+        except ResumeTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
         if not resume_text.strip():
             raise HTTPException(status_code=400, detail="No text content found in the uploaded file")
@@ -209,10 +286,12 @@ async def analyze_uploaded_resume(
             raise HTTPException(status_code=404, detail=f"Job description not found for position: {position_title}")
         
         # Analyze resume with Azure OpenAI
-        analysis_result = await analyze_resume_with_azure_openai(resume_text, job_description)
+        analysis_result = await analyze_resume_with_azure_openai(resume_text, job_description, prescreen)
         
         return ResumeAnalysisResponse(**analysis_result)
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
 
@@ -233,10 +312,12 @@ async def analyze_resume_text(request: ResumeAnalysisRequest):
             raise HTTPException(status_code=404, detail=f"Job description not found for position: {request.position_title}")
         
         # Analyze resume with Azure OpenAI
-        analysis_result = await analyze_resume_with_azure_openai(request.resume_text, job_description)
+        analysis_result = await analyze_resume_with_azure_openai(request.resume_text, job_description, request.prescreen)
         
         return ResumeAnalysisResponse(**analysis_result)
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error analyzing resume: {str(e)}")
 
@@ -264,3 +345,29 @@ async def get_job_description(position_title: str):
         return job_description
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error fetching job description: {str(e)}")
+
+@router.post("/skill-match")
+async def match_resume_skills(request: ResumeAnalysisRequest):
+    """Local skill match of resume text against a position, without calling the LLM"""
+    if not request.resume_text:
+        raise HTTPException(status_code=400, detail="Resume text is required")
+    job_description = get_job_description_by_title(request.position_title, load_job_descriptions())
+    if not job_description:
+        raise HTTPException(status_code=404, detail=f"Job description not found for position: {request.position_title}")
+
+    match = get_skill_matcher(job_description).match(request.resume_text)
+    return {
+        **match,
+        "clear_reject": is_clear_reject(match, settings.skill_prescreen_min_core_coverage,
+                                        settings.skill_prescreen_min_coverage)
+    }
+
+@router.get("/cache-stats")
+async def get_cache_stats():
+    """Resume analysis cache size, hit rate and eviction counters, and LLM calls saved by the skill pre-screen"""
+    return {
+        "prompt_version": PROMPT_VERSION,
+        **get_resume_analysis_cache().stats(),
+        "prescreen_screened": prescreen_stats["screened"],
+        "prescreen_rejected": prescreen_stats["rejected"]
+    }
@@ -0,0 +1,411 @@
+"""
+Resume Screening - batch screening jobs that rank many resumes against one position
+Uploaded files (or zip archives of them) are stored under settings.screening_jobs_dir, text is
+extracted in the shared extraction process pool and analyzed with the pooled LLM client, and every result is
+persisted as it completes. Jobs are leased to one worker at a time, and jobs left behind by a
+dead worker resume from their pending files in whichever worker notices first.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+import socket
+import sys
+import time
+import uuid
+import zipfile
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from fastapi import APIRouter, File, Form, HTTPException, Query, UploadFile
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from ..ai.text_extractor import get_resume_text_extractor
+from ..config import settings
+from ..storage.database import BACKEND_DIR, get_database, get_table
+from .resume_analyzer import (
+    ResumeAnalysisResponse,
+    analyze_resume_with_azure_openai,
+    get_job_description_by_title,
+    load_job_descriptions,
+)
+
+# Add the services directory to the Python path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from services.resume_text import is_resume_file
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Job and item statuses
+QUEUED, RUNNING, COMPLETED = 'queued', 'running', 'completed'
+PENDING, DONE, FAILED = 'pending', 'done', 'failed'
+
+def jobs_directory() -> str:
+    return os.path.normpath(os.path.join(BACKEND_DIR, settings.screening_jobs_dir))
+
+class LeaseLostError(Exception):
+    """Another worker took over the job (or it was deleted) while this one was running it"""
+
+class ScreeningJobRunner:
+    """Runs screening jobs as event loop tasks, one task per job across all workers.
+
+    A worker owns a job while it holds a lease on the job row, renewed by a heartbeat; jobs
+    whose lease has expired (their worker died) are taken over by the next heartbeat or
+    startup in any worker. Needs the SQLite backend, whose write lock makes claims atomic."""
+
+    def __init__(self):
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self._heartbeat: Optional[asyncio.Task] = None
+
+    @property
+    def available(self) -> bool:
+        return get_database() is not None
+
+    @property
+    def jobs(self):
+        return get_table('screening_jobs')
+
+    @property
+    def results(self):
+        return get_table('screening_results')
+
+    def _claim(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Take or renew the lease on an unfinished job; None if another worker holds a live
+        lease or the job is gone or finished"""
+        now = time.time()
+        with get_database().transaction(immediate=True):
+            job = self.jobs.get(job_id)
+            if job is None or job['status'] == COMPLETED:
+                return None
+            if job.get('owner') not in (None, self.owner) and (job.get('lease_expires_at') or 0) > now:
+                return None
+            job.update(status=RUNNING, owner=self.owner, lease_expires_at=now + settings.screening_lease_seconds,
+                       updated_at=datetime.now().isoformat())
+            self.jobs.update(job_id, job)
+            return job
+
+    def start(self, job_id: str) -> bool:
+        task = self.tasks.get(job_id)
+        if task is not None and not task.done():
+            return True
+        if self._claim(job_id) is None:
+            return False
+        self.tasks[job_id] = asyncio.create_task(self.run(job_id))
+        self._ensure_heartbeat()
+        return True
+
+    def _ensure_heartbeat(self):
+        if self._heartbeat is None or self._heartbeat.done():
+            self._heartbeat = asyncio.create_task(self._renew_leases())
+
+    def resume_unfinished(self) -> List[str]:
+        """Take over every queued or running job whose lease has expired"""
+        if not self.available:
+            return []
+        self._ensure_heartbeat()
+        now = time.time()
+        candidates = [job['id'] for status in (QUEUED, RUNNING) for job in self.jobs.find(status=status)
+                      if job['id'] not in self.tasks and (job.get('lease_expires_at') or 0) <= now]
+        job_ids = [job_id for job_id in candidates if self.start(job_id)]
+        if job_ids:
+            logger.info(f"Resuming {len(job_ids)} screening jobs")
+        return job_ids
+
+    async def _renew_leases(self):
+        """Heartbeat: renew our leases, stop jobs we lost, pick up jobs orphaned by dead workers"""
+        while True:
+            await asyncio.sleep(settings.screening_lease_seconds / 3)
+            try:
+                for job_id, task in list(self.tasks.items()):
+                    if task.done():
+                        del self.tasks[job_id]
+                    elif self._claim(job_id) is None:
+                        logger.warning(f"Lost the lease on screening job {job_id}; stopping it")
+                        task.cancel()
+                        del self.tasks[job_id]
+                self.resume_unfinished()
+            except Exception as e:
+                logger.error(f"Screening lease renewal failed: {e}")
+
+    def _record_item(self, job_id: str, item: Dict[str, Any]):
+        """Persist one item's outcome, in the same transaction as checking we still own the job"""
+        with get_database().transaction(immediate=True):
+            job = self.jobs.get(job_id)
+            if job is None or job.get('owner') != self.owner:
+                raise LeaseLostError(job_id)
+            self.results.update(item['id'], item)
+            job['updated_at'] = item['completed_at']
+            self.jobs.update(job_id, job)
+
+    def _finish(self, job_id: str):
+        with get_database().transaction(immediate=True):
+            job = self.jobs.get(job_id)
+            if job is None or job.get('owner') != self.owner:
+                raise LeaseLostError(job_id)
+            job.update(status=COMPLETED, owner=None, lease_expires_at=None, updated_at=datetime.now().isoformat())
+            self.jobs.update(job_id, job)
+
+    async def _screen_item(self, job_id: str, item: Dict[str, Any], job_description: Optional[Dict],
+                           position_title: str):
+        try:
+            if job_description is None:
+                raise ValueError(f"Job description not found for position: {position_title}")
+            resume_text = await get_resume_text_extractor().extract_file(item['path'])
+            if not resume_text:
+                raise ValueError("No text content found in the uploaded file")
+            analysis = await analyze_resume_with_azure_openai(resume_text, job_description)
+            item['analysis'] = ResumeAnalysisResponse(**analysis).dict()
+            item['overall_score'] = item['analysis']['overall_score']
+            item['status'] = DONE
+        except Exception as e:
+            item['error'] = e.detail if isinstance(e, HTTPException) else str(e)
+            item['status'] = FAILED
+        item['completed_at'] = datetime.now().isoformat()
+        self._record_item(job_id, item)
+
+    async def run(self, job_id: str):
+        job = self.jobs.get(job_id)
+        if job is None or job['status'] == COMPLETED:
+            return
+        job_description = get_job_description_by_title(job['position_title'], load_job_descriptions())
+        queue: asyncio.Queue = asyncio.Queue()
+        for item in self.results.find(job_id=job_id, status=PENDING):
+            queue.put_nowait(item)
+
+        async def worker():
+            while not queue.empty():
+                await self._screen_item(job_id, queue.get_nowait(), job_description, job['position_title'])
+
+        # The LLM client bounds completions in flight; more workers than that only queue
+        workers = [asyncio.create_task(worker())
+                   for _ in range(min(settings.azure_openai_max_concurrency, queue.qsize()))]
+        try:
+            await asyncio.gather(*workers)
+            self._finish(job_id)
+        except Exception as e:
+            for task in workers:
+                task.cancel()
+            logger.error(f"Screening job {job_id} stopped: {e!r}")
+            return
+        logger.info(f"Screening job {job_id} completed")
+
+    async def shutdown(self):
+        """Stop our jobs and release their leases so another worker can take them over at once"""
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+        for task in self.tasks.values():
+            task.cancel()
+        for job_id in list(self.tasks):
+            with get_database().transaction(immediate=True):
+                job = self.jobs.get(job_id)
+                if job is not None and job.get('owner') == self.owner and job['status'] != COMPLETED:
+                    job.update(owner=None, lease_expires_at=None)
+                    self.jobs.update(job_id, job)
+        self.tasks.clear()
+
+# Global instance
+screening_runner = None
+
+def get_screening_runner() -> ScreeningJobRunner:
+    """Get the global screening job runner"""
+    global screening_runner
+    if screening_runner is None:
+        screening_runner = ScreeningJobRunner()
+    return screening_runner
+
+# Files are copied in chunks of this size so the size limits apply to the bytes actually written
+COPY_CHUNK_BYTES = 1024 * 1024
+
+def store_uploads(uploads: List[UploadFile], directory: str) -> List[Dict[str, str]]:
+    """Write each resume file, expanding zip archives, as <directory>/<index><ext>.
+    Returns [{file_name, path}] in upload order; other file types are skipped. Files over
+    settings.resume_max_file_bytes or a job over settings.screening_max_upload_bytes are
+    rejected with 413, checked against the bytes written rather than zip headers."""
+    os.makedirs(directory, exist_ok=True)
+    stored: List[Dict[str, str]] = []
+    total_bytes = 0
+
+    def add(file_name: str, source, declared_size: Optional[int] = None) -> None:
+        nonlocal total_bytes
+        if len(stored) >= settings.screening_max_files:
+            raise HTTPException(status_code=400, detail=f"Maximum {settings.screening_max_files} resumes per job")
+        too_large = HTTPException(status_code=413, detail=f"{file_name} is larger than "
+                                                          f"{settings.resume_max_file_bytes} bytes")
+        if declared_size is not None and declared_size > settings.resume_max_file_bytes:
+            raise too_large
+        path = os.path.join(directory, f"{len(stored):05d}{os.path.splitext(file_name.lower())[1]}")
+        written = 0
+        with open(path, 'wb') as f:
+            while True:
+                chunk = source.read(COPY_CHUNK_BYTES)
+                if not chunk:
+                    break
+                written += len(chunk)
+                if written > settings.resume_max_file_bytes:
+                    raise too_large
+                if total_bytes + written > settings.screening_max_upload_bytes:
+                    raise HTTPException(status_code=413, detail=f"Upload is larger than "
+                                                                f"{settings.screening_max_upload_bytes} bytes")
+                f.write(chunk)
+        total_bytes += written
+        stored.append({'file_name': file_name, 'path': path})
+
+    for upload in uploads:
+        name = upload.filename or 'resume'
+        if name.lower().endswith('.zip'):
+            try:
+                archive = zipfile.ZipFile(upload.file)
+            except zipfile.BadZipFile:
+                raise HTTPException(status_code=400, detail=f"Not a valid zip archive: {name}")
+            with archive:
+                for member in archive.infolist():
+                    base = os.path.basename(member.filename)
+                    if member.is_dir() or member.filename.startswith('__MACOSX/') or not is_resume_file(base):
+                        continue
+                    with archive.open(member) as source:
+                        add(base, source, member.file_size)
+        elif is_resume_file(name):
+            upload.file.seek(0)
+            add(name, upload.file)
+    return stored
+
+def job_progress(job: Dict[str, Any]) -> Dict[str, Any]:
+    """The job row plus counters derived from its results' statuses"""
+    results = get_screening_runner().results
+    completed = results.count(job_id=job['id'], status=DONE)
+    failed = results.count(job_id=job['id'], status=FAILED)
+    return {
+        **{key: value for key, value in job.items() if key != 'directory'},
+        'completed': completed,
+        'failed': failed,
+        'pending': job['total'] - completed - failed,
+        'progress': (completed + failed) / job['total'] if job['total'] else 1.0
+    }
+
+@router.post("/screening-jobs", status_code=202)
+async def create_screening_job(
+    position_title: str = Form(...),
+    files: List[UploadFile] = File(...)
+):
+    """Screen many resumes (PDF/text files or zip archives of them) against one position"""
+    runner = get_screening_runner()
+    if not runner.available:
+        raise HTTPException(status_code=501, detail="Screening jobs need the SQLite backend (database_url=sqlite:///...)")
+    job_description = get_job_description_by_title(position_title, load_job_descriptions())
+    if not job_description:
+        raise HTTPException(status_code=404, detail=f"Job description not found for position: {position_title}")
+
+    job_id = uuid.uuid4().hex[:12]
+    directory = os.path.join(jobs_directory(), job_id)
+    try:
+        stored = await run_in_threadpool(store_uploads, files, directory)
+    except BaseException:
+        shutil.rmtree(directory, ignore_errors=True)
+        raise
+    if not stored:
+        shutil.rmtree(directory, ignore_errors=True)
+        raise HTTPException(status_code=400, detail="No PDF or text resumes found in the upload")
+
+    now = datetime.now().isoformat()
+    runner.results.insert_many([
+        {
+            'id': f"{job_id}:{index:05d}",
+            'job_id': job_id,
+            'index': index,
+            'file_name': entry['file_name'],
+            'path': entry['path'],
+            'status': PENDING,
+            'overall_score': None,
+            'analysis': None,
+            'error': None,
+            'completed_at': None
+        }
+        for index, entry in enumerate(stored)
+    ])
+    job = runner.jobs.insert({
+        'id': job_id,
+        'position_title': job_description.get('PositionTitle', position_title),
+        'status': QUEUED,
+        'total': len(stored),
+        'owner': None,
+        'lease_expires_at': None,
+        'directory': directory,
+        'created_at': now,
+        'updated_at': now
+    })
+    runner.start(job_id)
+    return job_progress(runner.jobs.get(job_id) or job)
+
+@router.get("/screening-jobs")
+async def list_screening_jobs(status: Optional[str] = None):
+    """Screening jobs with their progress, newest first"""
+    jobs = get_screening_runner().jobs.find(**({'status': status} if status else {}))
+    return {"jobs": [job_progress(job) for job in reversed(jobs)]}
+
+@router.get("/screening-jobs/{job_id}")
+async def get_screening_job(job_id: str):
+    """Progress of one screening job"""
+    job = get_screening_runner().jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Screening job not found")
+    return job_progress(job)
+
+async def iter_ranked_results(job: Dict[str, Any], items: List[Dict[str, Any]]):
+    """Yield the ranked results JSON document one entry at a time"""
+    yield '{"job": ' + json.dumps(job_progress(job)) + ', "results": ['
+    for rank, item in enumerate(items, 1):
+        entry = {
+            'rank': rank if item['status'] == DONE else None,
+            'file_name': item['file_name'],
+            'status': item['status'],
+            'overall_score': item['overall_score'],
+            'analysis': item['analysis'],
+            'error': item['error']
+        }
+        yield (', ' if rank > 1 else '') + json.dumps(entry)
+    yield ']}'
+
+@router.get("/screening-jobs/{job_id}/results")
+async def get_screening_results(
+    job_id: str,
+    limit: Optional[int] = Query(None, ge=1),
+    include_failed: bool = False
+):
+    """Screened resumes so far, best overall score first (failed ones last when included)"""
+    runner = get_screening_runner()
+    job = runner.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Screening job not found")
+
+    items = runner.results.find(job_id=job_id, status=DONE)
+    items.sort(key=lambda item: (-item['overall_score'], item['index']))
+    if include_failed:
+        items += runner.results.find(job_id=job_id, status=FAILED)
+    if limit is not None:
+        items = items[:limit]
+    return StreamingResponse(iter_ranked_results(job, items), media_type="application/json")
+
+@router.delete("/screening-jobs/{job_id}")
+async def delete_screening_job(job_id: str):
+    """Stop a screening job and delete its results and uploaded files"""
+    runner = get_screening_runner()
+    job = runner.jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Screening job not found")
+    task = runner.tasks.pop(job_id, None)
+    if task is not None:
+        task.cancel()
+    # The owning worker, if another one, stops at its next write once the job row is gone
+    with get_database().transaction(immediate=True):
+        for item in runner.results.find(job_id=job_id):
+            runner.results.delete(item['id'])
+        runner.jobs.delete(job_id)
+    shutil.rmtree(job['directory'], ignore_errors=True)
+    return {"message": "Screening job deleted", "job_id": job_id}
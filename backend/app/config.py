@@ -24,6 +24,38 @@ class Settings(BaseSettings):
     azure_openai_api_key: str = "your-api-key-here"
     azure_openai_api_version: str = "2023-12-01-preview"
     azure_openai_model: str = "gpt-4o"
+    azure_openai_timeout: float = 60.0  # seconds per completion request
+    azure_openai_max_concurrency: int = 8  # completions in flight per process
+    azure_openai_max_connections: int = 20  # keep-alive connection pool size
+    azure_openai_max_retries: int = 2
+    
+    # Persistent resume analysis cache
+    resume_cache_url: str = "sqlite:///./resume_analysis_cache.db"
+    resume_cache_max_entries: int = 5000
+    resume_cache_ttl_seconds: float = 7 * 24 * 3600
+    
+    # Resume text extraction (process pool shared by uploads and screening jobs)
+    resume_extract_workers: int = 4
+    resume_max_file_bytes: int = 10 * 1024 * 1024
+    resume_max_pdf_pages: int = 50
+    resume_pdf_page_timeout: float = 5.0  # seconds per page
+    
+    # Local skill pre-screen: resumes below both floors skip the LLM analysis
+    skill_prescreen_enabled: bool = True
+    skill_prescreen_min_core_coverage: float = 0.34  # share of CoreSkills mentioned
+    skill_prescreen_min_coverage: float = 0.2  # weighted share of all position skills
+    
+    # Batch resume screening jobs
+    screening_jobs_dir: str = "./screening_jobs"  # uploaded files, relative to the backend directory
+    screening_max_files: int = 5000
+    screening_max_upload_bytes: int = 2 * 1024 * 1024 * 1024  # all files of one job, after unzipping
+    screening_lease_seconds: float = 60.0  # a job whose worker stops renewing this long is taken over
+    
+    # Bulk candidate ingest
+    bulk_max_body_bytes: int = 100 * 1024 * 1024  # one JSON array / NDJSON body or uploaded file
+    
+    # Concurrent LLM calls per batch request
+    llm_max_concurrency: int = 8
     
     # Application
     debug: bool = True
@@ -1,7 +1,10 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from app.api import analytics, bias_detection, personality, interviews, advanced_analytics, notifications, reports, feedback, calendar_integration, resume_analyzer, ai_copilot, enhanced_personality, enhanced_analytics_demo
+from app.api import analytics, bias_detection, personality, interviews, advanced_analytics, notifications, reports, feedback, calendar_integration, resume_analyzer, resume_screening, ai_copilot, enhanced_personality, enhanced_analytics_demo
 from app.api.candidates import router as candidates_router
+from app.ai.azure_client import close_azure_client
+from app.ai.text_extractor import close_resume_text_extractor
+from app.api.resume_screening import get_screening_runner
 from app.config import settings
 
 app = FastAPI(
@@ -18,6 +21,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # keyset pagination cursor for candidate listing
 )
 
 # Include routers with proper path handling
@@ -34,6 +38,7 @@ app.include_router(reports.router, prefix="/api/v1/reports", tags=["reports"])
 app.include_router(feedback.router, prefix="/api/v1/feedback", tags=["feedback"])
 app.include_router(calendar_integration.router, prefix="/api/v1/calendar", tags=["calendar"])
 app.include_router(resume_analyzer.router, prefix="/api/v1/resume", tags=["resume-analyzer"])
+app.include_router(resume_screening.router, prefix="/api/v1/resume", tags=["resume-screening"])
 app.include_router(ai_copilot.router, prefix="/api/v1/ai-copilot", tags=["ai-copilot", "smart-features"])
 
 @app.get("/")
@@ -54,6 +59,19 @@ async def root():
         ]
     }
 
+@app.on_event("startup")
+async def startup():
+    # Pick up screening jobs whose worker stopped without finishing them
+    get_screening_runner().resume_unfinished()
+
+@app.on_event("shutdown")
+async def shutdown():
+    # Unfinished screening jobs are released for another worker (or the next startup) to resume
+    await get_screening_runner().shutdown()
+    close_resume_text_extractor()
+    # Release the pooled Azure OpenAI connections
+    await close_azure_client()
+
 @app.get("/health")
 async def health_check():
     return {
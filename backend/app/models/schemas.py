@@ -53,6 +53,9 @@ class CandidateUpdate(BaseModel):
     gender: Optional[GenderEnum] = None
     ethnicity: Optional[EthnicityEnum] = None
     age: Optional[int] = Field(None, ge=18, le=100)
+    
+    # Optimistic concurrency: the version the client last read; a stale value is rejected with 409
+    version: Optional[int] = Field(None, ge=1)
 
 class Candidate(CandidateBase):
     """Complete candidate model with DB fields"""
@@ -60,6 +63,7 @@ class Candidate(CandidateBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
     is_active: bool = True
+    version: int = 1
     
     # Hiring process fields
     resume_score: Optional[float] = Field(None, ge=0, le=100)
@@ -73,6 +77,19 @@ class Candidate(CandidateBase):
     class Config:
         from_attributes = True
 
+class CandidatePatch(BaseModel):
+    """Score and/or decision change for one candidate in a batch update"""
+    candidate_id: int
+    resume_score: Optional[float] = Field(None, ge=0, le=100)
+    interview_score: Optional[float] = Field(None, ge=0, le=100)
+    technical_score: Optional[float] = Field(None, ge=0, le=100)
+    hiring_decision: Optional[str] = Field(None, pattern=r'^(hired|rejected|on_hold)$')
+    version: Optional[int] = Field(None, ge=1)
+
+class CandidateBatchUpdate(BaseModel):
+    """Batch of score/decision patches applied in one transaction"""
+    updates: List[CandidatePatch] = Field(..., min_length=1, max_length=10000)
+
 class BiasAnalysisRequest(BaseModel):
     """Request model for bias analysis"""
     candidate_ids: List[int]
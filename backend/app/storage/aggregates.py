@@ -0,0 +1,159 @@
+"""
+Candidate Aggregates - materialized analytics counters over the candidate store
+Kept up to date as the store indexes and unindexes records, so the analytics endpoints
+answer from per-group counters in O(groups) instead of rescanning every candidate.
+"""
+
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+SCORE_FIELDS = ('resume_score', 'interview_score', 'technical_score', 'final_score')
+
+# Age bucket upper bounds (exclusive) and labels for demographic analytics
+AGE_BOUNDS = [25, 35, 45, 55]
+AGE_GROUPS = ['under_25', '25_34', '35_44', '45_54', '55_plus']
+
+# Score distribution bucket upper bounds (inclusive) and labels
+SCORE_BOUNDS = [20, 40, 60, 80]
+SCORE_BUCKETS = ['0-20', '21-40', '41-60', '61-80', '81-100']
+
+# Grouping dimension -> categorical fields counted within each group
+DIMENSIONS = {
+    'position_applied': ('gender', 'ethnicity'),
+    'gender': ('position_applied',),
+    'ethnicity': ('position_applied',),
+    'age_group': (),
+    'created_month': (),
+}
+
+# Dimensions that leave out candidates without a value instead of grouping them under None
+OPTIONAL_DIMENSIONS = ('age_group', 'created_month')
+
+def parse_created_at(value: Any) -> Tuple[Optional[str], Optional[float]]:
+    """(YYYY-MM month, naive epoch seconds) for a created_at value; None where unavailable"""
+    if not value:
+        return None, None
+    try:
+        created = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None, None
+    # Timezone-aware stamps cannot be compared with the naive "now" the endpoints use
+    timestamp = created.timestamp() if created.tzinfo is None else None
+    return created.strftime('%Y-%m'), timestamp
+
+def numeric_value(value: Any) -> Optional[float]:
+    """A numeric field as a number, or None if it is missing, non-numeric or NaN"""
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value != value:
+        return None
+    return value
+
+def age_group(value: Any) -> Optional[str]:
+    age = numeric_value(value)
+    if not age:
+        return None
+    return AGE_GROUPS[bisect_right(AGE_BOUNDS, age)]
+
+def _bump(counter: Counter, key: Any, delta: int):
+    counter[key] += delta
+    if not counter[key]:
+        del counter[key]
+
+def _sorted_add(values: List[float], value: float, sign: int):
+    if sign > 0:
+        insort(values, value)
+        return
+    position = bisect_left(values, value)
+    if position < len(values) and values[position] == value:
+        del values[position]
+
+class ScoreStats:
+    """Count, sum, min/max and bucket counts for one score field"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.buckets = [0] * len(SCORE_BUCKETS)
+        self._values: Counter = Counter()
+        self._distinct: List[float] = []
+
+    def add(self, value: float, sign: int = 1):
+        self.count += sign
+        self.total = self.total + sign * value if self.count else 0.0
+        self.buckets[bisect_left(SCORE_BOUNDS, value)] += sign
+
+        # Distinct values stay sorted so min/max survive removals
+        seen = value in self._values
+        _bump(self._values, value, sign)
+        if seen != (value in self._values):
+            _sorted_add(self._distinct, value, sign)
+
+    @property
+    def min(self) -> Optional[float]:
+        return self._distinct[0] if self._distinct else None
+
+    @property
+    def max(self) -> Optional[float]:
+        return self._distinct[-1] if self._distinct else None
+
+class CandidateAggregates:
+    """Per-group counts, hire outcomes and score statistics for every candidate in the store"""
+
+    def __init__(self, records: Iterable[dict] = ()):
+        self.total = 0
+        self.decisions: Counter = Counter()
+        self.groups: Dict[str, Dict[Any, Counter]] = {dimension: {} for dimension in DIMENSIONS}
+        self.scores: Dict[str, ScoreStats] = {field: ScoreStats() for field in SCORE_FIELDS}
+        self._created: List[float] = []
+        self._hired_created: List[float] = []
+        for record in records:
+            self.add(record)
+
+    def add(self, record: dict):
+        self._apply(record, 1)
+
+    def remove(self, record: dict):
+        self._apply(record, -1)
+
+    def _apply(self, record: dict, sign: int):
+        decision = record.get('hiring_decision')
+        month, timestamp = parse_created_at(record.get('created_at'))
+        keys = {
+            'position_applied': record.get('position_applied'),
+            'gender': record.get('gender'),
+            'ethnicity': record.get('ethnicity'),
+            'age_group': age_group(record.get('age')),
+            'created_month': month,
+        }
+
+        self.total += sign
+        _bump(self.decisions, decision, sign)
+
+        for dimension, crossed in DIMENSIONS.items():
+            value = keys[dimension]
+            if value is None and dimension in OPTIONAL_DIMENSIONS:
+                continue
+            groups = self.groups[dimension]
+            group = groups.setdefault(value, Counter())
+            _bump(group, 'total', sign)
+            _bump(group, ('hiring_decision', decision), sign)
+            for field in crossed:
+                _bump(group, (field, keys[field]), sign)
+            if not group:
+                del groups[value]
+
+        if timestamp is not None:
+            _sorted_add(self._created, timestamp, sign)
+            if decision == 'hired':
+                _sorted_add(self._hired_created, timestamp, sign)
+
+        for field in SCORE_FIELDS:
+            value = numeric_value(record.get(field))
+            if value is not None:
+                self.scores[field].add(value, sign)
+
+    def created_since(self, timestamp: float) -> Tuple[int, int]:
+        """(candidates, hires) created at or after a naive epoch timestamp"""
+        return (len(self._created) - bisect_left(self._created, timestamp),
+                len(self._hired_created) - bisect_left(self._hired_created, timestamp))
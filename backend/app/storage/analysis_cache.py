@@ -0,0 +1,159 @@
+"""
+Analysis Cache - persistent content-addressed cache for LLM analyses and extracted resume text
+Entries live in their own SQLite file keyed by a digest of everything that determines the
+answer, expire after a TTL, and are evicted least-recently-used beyond a size bound.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from app.config import settings
+from app.storage.database import parse_database_url
+
+logger = logging.getLogger(__name__)
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS {table} (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_{table}_accessed_at ON {table}(accessed_at);
+"""
+
+def content_key(**parts: Any) -> str:
+    """SHA-256 over the canonical JSON of the parts (dict key order does not matter)"""
+    canonical = json.dumps(parts, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+class AnalysisCache:
+    """Key -> JSON value store with TTL, LRU size bound and hit/miss counters"""
+
+    def __init__(self, path: str, max_entries: int = 5000, ttl_seconds: float = 7 * 24 * 3600,
+                 table: str = 'analysis_cache'):
+        self.path = path
+        self.table = table
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.expirations = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            if path != ':memory:':
+                self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+            self.conn.executescript(CACHE_SCHEMA.format(table=table))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self.conn.execute(f'SELECT COUNT(*) FROM {self.table}').fetchone()[0]
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        with self._lock:
+            row = self.conn.execute(
+                f'SELECT value, created_at FROM {self.table} WHERE key = ?', (key,)
+            ).fetchone()
+            if row is not None and now - row[1] <= self.ttl_seconds:
+                self.conn.execute(f'UPDATE {self.table} SET accessed_at = ? WHERE key = ?', (now, key))
+                self.hits += 1
+                return json.loads(row[0])
+            if row is not None:
+                self.conn.execute(f'DELETE FROM {self.table} WHERE key = ?', (key,))
+                self.expirations += 1
+            self.misses += 1
+            return None
+
+    def put(self, key: str, value: Any):
+        now = time.time()
+        payload = json.dumps(value)
+        with self._lock:
+            self.conn.execute('BEGIN')
+            try:
+                self.conn.execute(
+                    f'INSERT OR REPLACE INTO {self.table} (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)',
+                    (key, payload, now, now)
+                )
+                # Past the bound, drop the least recently read entries
+                evicted = self.conn.execute(
+                    f'DELETE FROM {self.table} WHERE key IN '
+                    f'(SELECT key FROM {self.table} ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)',
+                    (self.max_entries,)
+                ).rowcount
+                self.conn.execute('COMMIT')
+            except BaseException:
+                self.conn.execute('ROLLBACK')
+                raise
+            self.evictions += max(evicted, 0)
+
+    def purge_expired(self) -> int:
+        """Delete every entry past its TTL; returns how many were removed"""
+        with self._lock:
+            removed = self.conn.execute(
+                f'DELETE FROM {self.table} WHERE created_at < ?', (time.time() - self.ttl_seconds,)
+            ).rowcount
+            self.expirations += removed
+            return removed
+
+    def clear(self):
+        with self._lock:
+            self.conn.execute(f'DELETE FROM {self.table}')
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'cache_size': len(self),
+            'cache_max_entries': self.max_entries,
+            'cache_ttl_seconds': self.ttl_seconds,
+            'cache_hits': self.hits,
+            'cache_misses': self.misses,
+            'cache_expirations': self.expirations,
+            'cache_evictions': self.evictions,
+            'cache_hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+# Global instance
+resume_analysis_cache = None
+
+def get_resume_analysis_cache() -> AnalysisCache:
+    """Get the global resume analysis cache (settings.resume_cache_url)"""
+    global resume_analysis_cache
+    if resume_analysis_cache is None:
+        _, path = parse_database_url(settings.resume_cache_url)
+        resume_analysis_cache = AnalysisCache(
+            path,
+            max_entries=settings.resume_cache_max_entries,
+            ttl_seconds=settings.resume_cache_ttl_seconds
+        )
+        purged = resume_analysis_cache.purge_expired()
+        logger.info(f"Opened resume analysis cache at {path} ({purged} expired entries purged)")
+    return resume_analysis_cache
+
+resume_text_cache = None
+
+def get_resume_text_cache() -> AnalysisCache:
+    """Get the global extracted-text cache, keyed by file hash (same file as the analysis cache)"""
+    global resume_text_cache
+    if resume_text_cache is None:
+        _, path = parse_database_url(settings.resume_cache_url)
+        resume_text_cache = AnalysisCache(
+            path,
+            max_entries=settings.resume_cache_max_entries,
+            ttl_seconds=settings.resume_cache_ttl_seconds,
+            table='resume_text_cache'
+        )
+        resume_text_cache.purge_expired()
+    return resume_text_cache
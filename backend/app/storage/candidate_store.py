@@ -0,0 +1,456 @@
+"""
+Candidate Store - shared in-process repository for candidate records
+Loads candidates once from the configured backend, keeps hash indexes and materialized analytics
+aggregates in memory and reloads
+only when the backend reports outside changes. Mutations are persisted through the backend
+(an append-only journal for JSON files, row upserts for SQLite).
+"""
+
+import logging
+import threading
+from bisect import bisect_left, bisect_right, insort
+from contextlib import contextmanager
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from app.storage.aggregates import CandidateAggregates
+from app.storage.json_backend import JsonCandidateBackend
+
+logger = logging.getLogger(__name__)
+
+# Fields with a secondary hash index (value -> set of candidate ids)
+INDEXED_FIELDS = ('position_applied', 'is_active', 'hiring_decision')
+
+def _index_key(field: str, value: Any) -> Any:
+    """Normalize a field value into its index key (positions match case-insensitively)"""
+    if field == 'position_applied':
+        return (value or '').lower()
+    return value
+
+# Fields with an ordered index of (is_null, value, id) keys, built on first use
+SORTABLE_FIELDS = ('created_at', 'id', 'final_score', 'resume_score', 'interview_score', 'technical_score')
+
+# Batch inserts larger than this rebuild the ordered indexes and aggregates instead of updating them
+BULK_REINDEX_THRESHOLD = 1000
+
+def sort_key(field: str, record: dict) -> tuple:
+    """Total-order key for keyset pagination: non-null values first, ties broken by id"""
+    value = record.get(field)
+    if value is None:
+        return (1, 0, record['id'])
+    if field == 'created_at':
+        return (0, str(value), record['id'])
+    return (0, value if field == 'id' else float(value), record['id'])
+
+class VersionConflictError(Exception):
+    """Raised when an update's expected version no longer matches the stored record"""
+
+    def __init__(self, candidate_id: int, expected_version: int, current_version: int):
+        super().__init__(f"Candidate {candidate_id} is at version {current_version}, "
+                         f"expected {expected_version}")
+        self.candidate_id = candidate_id
+        self.expected_version = expected_version
+        self.current_version = current_version
+
+def record_version(record: dict) -> int:
+    """Optimistic concurrency version of a record; rows written before versioning count as 1"""
+    return record.get('version') or 1
+
+class CandidateStore:
+    """Indexed candidate repository with change-signature invalidation over a storage backend"""
+
+    def __init__(self, backend=None):
+        self.backend = backend if backend is not None else JsonCandidateBackend()
+        self.data_file = self.backend.location
+        self._lock = threading.RLock()
+        self._records: Dict[int, dict] = {}
+        self._indexes: Dict[str, Dict[Any, Set[int]]] = {field: {} for field in INDEXED_FIELDS}
+        self._sorted: Dict[str, List[tuple]] = {}
+        self._aggregates: Optional[CandidateAggregates] = None
+        self._observers: List[Any] = []
+        self._max_id = 0
+        self._file_signature: Optional[Tuple] = None
+        self._loaded = False
+
+        # Bumped on every reload or mutation so callers can key derived data on it
+        self.version = 0
+
+    def _ensure_fresh(self):
+        """Reload if the backend changed since we last read or wrote it"""
+        signature = self.backend.signature()
+        if self._loaded and signature == self._file_signature:
+            return
+
+        with self._lock:
+            signature = self.backend.signature()
+            if self._loaded and signature == self._file_signature:
+                return
+            self._load()
+
+    @contextmanager
+    def _write(self):
+        """Serialize a read-check-write: in-process lock, then the backend's cross-process
+        write lock, then pick up anything another worker committed before we got it"""
+        with self._lock, self.backend.write_lock():
+            if not self._loaded or self.backend.signature() != self._file_signature:
+                self._load()
+            yield
+
+    def _load(self):
+        # Signature first: a write landing while we read then shows up as a change next time
+        signature = self.backend.signature()
+        data, entries = self.backend.load()
+
+        self._records = {}
+        self._indexes = {field: {} for field in INDEXED_FIELDS}
+        self._sorted = {}
+        self._aggregates = None
+        self._max_id = 0
+        for observer in self._observers:
+            observer.reset()
+        for record in data:
+            candidate_id = record.get('id')
+            if candidate_id is None:
+                continue
+            self._records[candidate_id] = record
+            self._index(record)
+            self._max_id = max(self._max_id, candidate_id)
+
+        # Replay mutations the backend has not folded into its snapshot yet
+        replayed = 0
+        for entry in entries:
+            self._apply(entry)
+            replayed += 1
+
+        self._file_signature = signature
+        self._loaded = True
+        self.version += 1
+        logger.info(f"Loaded {len(self._records)} candidates from {self.data_file} "
+                    f"(+{replayed} journal entries)")
+
+    def _apply(self, entry: Dict[str, Any]) -> Optional[dict]:
+        """Apply one journal entry to the in-memory records and indexes"""
+        op = entry.get('op')
+        candidate_id = entry.get('id')
+
+        if op == 'create':
+            existing = self._records.get(candidate_id)
+            if existing is not None:
+                self._unindex(existing)
+            record = dict(entry['data'])
+            self._records[candidate_id] = record
+            self._index(record)
+            self._max_id = max(self._max_id, candidate_id)
+            return record
+
+        if op == 'patch':
+            record = self._records.get(candidate_id)
+            if record is None:
+                return None
+            self._unindex(record)
+            record.update(entry['data'])
+            self._index(record)
+            return record
+
+        if op == 'delete':
+            record = self._records.pop(candidate_id, None)
+            if record is not None:
+                self._unindex(record)
+            return record
+
+        logger.warning(f"Ignoring unknown candidate journal op: {op}")
+        return None
+
+    def _commit(self, entries: List[Dict[str, Any]]):
+        """Persist applied entries through the backend"""
+        try:
+            self.backend.commit(entries, self._records)
+        except Exception:
+            # Memory is ahead of storage now; force a reload on next access
+            self._loaded = False
+            raise
+        self.version += 1
+        self._file_signature = self.backend.signature()
+
+    def compact(self):
+        """Fold pending journal entries into the snapshot (no-op for SQLite)"""
+        with self._write():
+            self.backend.compact(self._records)
+            self._file_signature = self.backend.signature()
+
+    def _index(self, record: dict):
+        candidate_id = record['id']
+        for field in INDEXED_FIELDS:
+            key = _index_key(field, record.get(field))
+            self._indexes[field].setdefault(key, set()).add(candidate_id)
+        for field, keys in self._sorted.items():
+            insort(keys, sort_key(field, record))
+        if self._aggregates is not None:
+            self._aggregates.add(record)
+        for observer in self._observers:
+            observer.add(record)
+
+    def _unindex(self, record: dict):
+        candidate_id = record['id']
+        for field in INDEXED_FIELDS:
+            key = _index_key(field, record.get(field))
+            bucket = self._indexes[field].get(key)
+            if bucket is not None:
+                bucket.discard(candidate_id)
+                if not bucket:
+                    del self._indexes[field][key]
+        for field, keys in self._sorted.items():
+            key = sort_key(field, record)
+            position = bisect_left(keys, key)
+            if position < len(keys) and keys[position] == key:
+                del keys[position]
+        if self._aggregates is not None:
+            self._aggregates.remove(record)
+        for observer in self._observers:
+            observer.remove(record)
+
+    def add_observer(self, observer):
+        """Keep `observer` in step with the records: it is seeded with add(record) for every
+        current record, then gets remove(old state)/add(new state) for each change applied by
+        any write or journal replay, and reset() before a full reload. Calls run under the
+        store lock."""
+        self._ensure_fresh()
+        with self._lock:
+            observer.reset()
+            for record in self._records.values():
+                observer.add(record)
+            self._observers.append(observer)
+
+    @contextmanager
+    def locked(self) -> Iterator[int]:
+        """Hold the store lock after picking up outside writes; yields the version, so derived
+        state read inside the block matches a single store version"""
+        self._ensure_fresh()
+        with self._lock:
+            yield self.version
+
+    def all(self) -> List[dict]:
+        """Return every candidate record in storage order"""
+        self._ensure_fresh()
+        return list(self._records.values())
+
+    def snapshot(self) -> Tuple[int, List[dict]]:
+        """(version, records) read atomically, for callers that cache derived data per version"""
+        self._ensure_fresh()
+        with self._lock:
+            return self.version, list(self._records.values())
+
+    def current_version(self) -> int:
+        """Data version after picking up anything another worker committed"""
+        self._ensure_fresh()
+        return self.version
+
+    def get(self, candidate_id: int) -> Optional[dict]:
+        """Return a single candidate by id via the hash index"""
+        self._ensure_fresh()
+        return self._records.get(candidate_id)
+
+    def get_many(self, candidate_ids: Iterable[int]) -> List[dict]:
+        """Return the candidates matching the given ids, skipping unknown ids"""
+        self._ensure_fresh()
+        return [self._records[i] for i in sorted(set(candidate_ids)) if i in self._records]
+
+    def _matching_ids(self, position: Optional[str] = None, is_active: Optional[bool] = None,
+                      hiring_decision: Optional[str] = None) -> Optional[Set[int]]:
+        """Intersect secondary indexes; None means no filter was applied"""
+        filters = []
+        if position:
+            filters.append(('position_applied', position))
+        if is_active is not None:
+            filters.append(('is_active', is_active))
+        if hiring_decision is not None:
+            filters.append(('hiring_decision', hiring_decision))
+
+        if not filters:
+            return None
+
+        buckets = [self._indexes[field].get(_index_key(field, value), set()) for field, value in filters]
+        buckets.sort(key=len)
+        return set(buckets[0]).intersection(*buckets[1:])
+
+    def filter(self, position: Optional[str] = None, is_active: Optional[bool] = None,
+               hiring_decision: Optional[str] = None) -> List[dict]:
+        """Return candidates matching all given filters using the secondary indexes"""
+        self._ensure_fresh()
+        with self._lock:
+            ids = self._matching_ids(position, is_active, hiring_decision)
+            if ids is None:
+                return list(self._records.values())
+            return [self._records[i] for i in sorted(ids)]
+
+    def _sorted_keys(self, field: str) -> List[tuple]:
+        keys = self._sorted.get(field)
+        if keys is None:
+            keys = sorted(sort_key(field, record) for record in self._records.values())
+            self._sorted[field] = keys
+        return keys
+
+    @staticmethod
+    def _walk(keys: List[tuple], descending: bool, after: Optional[tuple]) -> Iterator[tuple]:
+        """Yield keys strictly after `after` in the requested direction (nulls last both ways)"""
+        if not descending:
+            start = 0 if after is None else bisect_right(keys, after)
+            return (keys[i] for i in range(start, len(keys)))
+
+        nulls = bisect_left(keys, (1,))
+        if after is None:
+            positions = chain(range(nulls - 1, -1, -1), range(len(keys) - 1, nulls - 1, -1))
+        elif after[0] == 0:
+            positions = chain(range(bisect_left(keys, after) - 1, -1, -1), range(len(keys) - 1, nulls - 1, -1))
+        else:
+            positions = range(bisect_left(keys, after) - 1, nulls - 1, -1)
+        return (keys[i] for i in positions)
+
+    def page(self, sort: str = 'id', descending: bool = False, after: Optional[tuple] = None,
+             limit: int = 100, offset: int = 0, position: Optional[str] = None,
+             is_active: Optional[bool] = None,
+             hiring_decision: Optional[str] = None) -> Tuple[List[dict], Optional[tuple]]:
+        """One page in `sort` order resuming after the keyset position `after`.
+        Only the page itself is materialized. Returns (records, key of the last record
+        if more rows follow, else None)."""
+        if sort not in SORTABLE_FIELDS:
+            raise ValueError(f"Cannot sort candidates by {sort}")
+        self._ensure_fresh()
+        with self._lock:
+            ids = self._matching_ids(position, is_active, hiring_decision)
+            keys: List[tuple] = []
+            for key in self._walk(self._sorted_keys(sort), descending, after):
+                if ids is not None and key[2] not in ids:
+                    continue
+                if offset:
+                    offset -= 1
+                    continue
+                keys.append(key)
+                if len(keys) > limit:
+                    break
+
+            more = len(keys) > limit
+            keys = keys[:limit]
+            return [self._records[key[2]] for key in keys], (keys[-1] if more and keys else None)
+
+    def count(self, position: Optional[str] = None, is_active: Optional[bool] = None,
+              hiring_decision: Optional[str] = None) -> int:
+        """Count candidates matching the filters without materializing them"""
+        self._ensure_fresh()
+        with self._lock:
+            ids = self._matching_ids(position, is_active, hiring_decision)
+            return len(self._records) if ids is None else len(ids)
+
+    def analytics(self, report: Callable[[CandidateAggregates], Any]) -> Any:
+        """Run `report` against the materialized aggregates (built on first use) under the store
+        lock, so it reads counters consistent with a single store version"""
+        self._ensure_fresh()
+        with self._lock:
+            if self._aggregates is None:
+                self._aggregates = CandidateAggregates(self._records.values())
+            return report(self._aggregates)
+
+    def create(self, data: Dict[str, Any]) -> dict:
+        """Insert a new candidate at version 1, assigning the next id, and persist it"""
+        self._ensure_fresh()
+        with self._write():
+            candidate_id = self._max_id + 1
+            entry = {'op': 'create', 'id': candidate_id, 'data': {**data, 'id': candidate_id, 'version': 1}}
+            record = self._apply(entry)
+            self._commit([entry])
+            return record
+
+    def create_many(self, rows: List[Dict[str, Any]]) -> List[dict]:
+        """Insert a batch of candidates with a contiguous block of ids and one backend commit"""
+        if not rows:
+            return []
+        self._ensure_fresh()
+        with self._write():
+            first_id = self._max_id + 1
+            entries = [
+                {'op': 'create', 'id': first_id + offset, 'data': {**data, 'id': first_id + offset, 'version': 1}}
+                for offset, data in enumerate(rows)
+            ]
+            if len(entries) > BULK_REINDEX_THRESHOLD:
+                # Cheaper to drop the ordered indexes and aggregates and rebuild them on next
+                # use than to bisect-insert every row into them
+                self._sorted = {}
+                self._aggregates = None
+            records = [self._apply(entry) for entry in entries]
+            self._commit(entries)
+            return records
+
+    def modify(self, candidate_id: int, build_changes: Callable[[dict], Dict[str, Any]],
+               expected_version: Optional[int] = None) -> Optional[dict]:
+        """Compare-and-swap update: `build_changes` derives the changes from the current record
+        while the write lock is held. Raises VersionConflictError if `expected_version` is
+        given and stale; returns None if the candidate does not exist."""
+        self._ensure_fresh()
+        with self._write():
+            current = self._records.get(candidate_id)
+            if current is None:
+                return None
+            version = record_version(current)
+            if expected_version is not None and expected_version != version:
+                raise VersionConflictError(candidate_id, expected_version, version)
+
+            changes = dict(build_changes(current))
+            changes['version'] = version + 1
+            entry = {'op': 'patch', 'id': candidate_id, 'data': changes}
+            record = self._apply(entry)
+            self._commit([entry])
+            return record
+
+    def modify_many(self, patches: Dict[int, Tuple[Callable[[dict], Dict[str, Any]], Optional[int]]]) -> List[dict]:
+        """All-or-nothing compare-and-swap over several candidates with one backend commit.
+        `patches` maps id -> (build_changes, expected_version). Raises KeyError listing unknown
+        ids or VersionConflictError before anything is applied."""
+        self._ensure_fresh()
+        with self._write():
+            missing = [candidate_id for candidate_id in patches if candidate_id not in self._records]
+            if missing:
+                raise KeyError(missing)
+
+            entries = []
+            for candidate_id, (build_changes, expected_version) in patches.items():
+                current = self._records[candidate_id]
+                version = record_version(current)
+                if expected_version is not None and expected_version != version:
+                    raise VersionConflictError(candidate_id, expected_version, version)
+                changes = dict(build_changes(current))
+                changes['version'] = version + 1
+                entries.append({'op': 'patch', 'id': candidate_id, 'data': changes})
+
+            records = [self._apply(entry) for entry in entries]
+            self._commit(entries)
+            return records
+
+    def update(self, candidate_id: int, changes: Dict[str, Any],
+               expected_version: Optional[int] = None) -> Optional[dict]:
+        """Apply field changes to a candidate, bump its version and persist; None if not found"""
+        return self.modify(candidate_id, lambda current: changes, expected_version)
+
+    def delete(self, candidate_id: int, expected_version: Optional[int] = None) -> Optional[dict]:
+        """Hard-delete a candidate; the API itself only soft-deletes via update()"""
+        self._ensure_fresh()
+        with self._write():
+            current = self._records.get(candidate_id)
+            if current is None:
+                return None
+            if expected_version is not None and expected_version != record_version(current):
+                raise VersionConflictError(candidate_id, expected_version, record_version(current))
+            entry = {'op': 'delete', 'id': candidate_id}
+            record = self._apply(entry)
+            self._commit([entry])
+            return record
+
+# Global instance
+candidate_store = None
+
+def get_candidate_store() -> CandidateStore:
+    """Get global candidate store instance"""
+    global candidate_store
+    if candidate_store is None:
+        from app.storage.database import create_candidate_backend
+        candidate_store = CandidateStore(create_candidate_backend())
+    return candidate_store
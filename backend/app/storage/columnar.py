@@ -0,0 +1,125 @@
+"""
+Candidate Columns - compact column-oriented snapshot of the candidate store for analytics
+Rebuilt once per store data version: float64 arrays (NaN for missing) for numeric fields and
+dictionary-encoded int32 codes for categorical fields, so aggregates run as vectorized NumPy ops.
+"""
+
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.storage.aggregates import SCORE_FIELDS, numeric_value, parse_created_at
+from app.storage.candidate_store import get_candidate_store
+
+logger = logging.getLogger(__name__)
+
+NUMERIC_FIELDS = ('resume_score', 'interview_score', 'technical_score', 'final_score', 'bias_score',
+                  'age', 'experience_years')
+CATEGORICAL_FIELDS = ('gender', 'ethnicity', 'position_applied', 'hiring_decision', 'referral_source',
+                      'location')
+
+def _to_float(value: Any) -> float:
+    value = numeric_value(value)
+    return np.nan if value is None else float(value)
+
+class CandidateColumns:
+    """Read-only columnar view of every candidate at one store version"""
+
+    def __init__(self, records: List[dict], version: int):
+        self.version = version
+        self.size = len(records)
+        self.ids = np.fromiter((r['id'] for r in records), dtype=np.int64, count=self.size)
+        self.is_active = np.fromiter((bool(r.get('is_active', True)) for r in records), dtype=bool,
+                                     count=self.size)
+
+        self.numeric: Dict[str, np.ndarray] = {
+            field: np.fromiter((_to_float(r.get(field)) for r in records), dtype=np.float64, count=self.size)
+            for field in NUMERIC_FIELDS
+        }
+
+        self.categories: Dict[str, List[Any]] = {}
+        self.codes: Dict[str, np.ndarray] = {}
+        for field in CATEGORICAL_FIELDS:
+            self._encode(field, [r.get(field) for r in records])
+
+        parsed = [parse_created_at(r.get('created_at')) for r in records]
+        self._encode('created_month', [month for month, _ in parsed])
+        self.created_ts = np.fromiter((np.nan if ts is None else ts for _, ts in parsed), dtype=np.float64,
+                                      count=self.size)
+
+    def _encode(self, field: str, values: List[Any]):
+        lookup: Dict[Any, int] = {}
+        self.codes[field] = np.fromiter((lookup.setdefault(v, len(lookup)) for v in values),
+                                        dtype=np.int32, count=len(values))
+        self.categories[field] = list(lookup)
+
+    def code_of(self, field: str, value: Any) -> int:
+        """Code for a category value, or -1 if no candidate has it"""
+        try:
+            return self.categories[field].index(value)
+        except ValueError:
+            return -1
+
+    def mask(self, field: str, value: Any) -> np.ndarray:
+        """Boolean row mask for candidates whose categorical `field` equals `value`"""
+        return self.codes[field] == self.code_of(field, value)
+
+    def counts(self, field: str, where: Optional[np.ndarray] = None) -> np.ndarray:
+        """Rows per category code (aligned with categories[field]), optionally within a row mask"""
+        codes = self.codes[field] if where is None else self.codes[field][where]
+        return np.bincount(codes, minlength=len(self.categories[field]))
+
+    def value_counts(self, field: str, where: Optional[np.ndarray] = None,
+                     default: Any = None) -> Dict[Any, int]:
+        """{category: count} for categories present in the selection; None is labelled `default`"""
+        result: Dict[Any, int] = {}
+        for value, count in zip(self.categories[field], self.counts(field, where).tolist()):
+            if count:
+                label = default if value is None else value
+                result[label] = result.get(label, 0) + count
+        return result
+
+    def crosstab(self, row_field: str, column_field: str, where: Optional[np.ndarray] = None) -> np.ndarray:
+        """2-D counts[row_code, column_code] from one bincount over combined codes"""
+        rows, columns = len(self.categories[row_field]), len(self.categories[column_field])
+        combined = self.codes[row_field].astype(np.int64) * columns + self.codes[column_field]
+        if where is not None:
+            combined = combined[where]
+        return np.bincount(combined, minlength=rows * columns).reshape(rows, columns)
+
+    def present(self, field: str) -> np.ndarray:
+        """Mask of rows with a numeric value for `field`"""
+        return ~np.isnan(self.numeric[field])
+
+    def memory_bytes(self) -> int:
+        arrays = [self.ids, self.is_active, self.created_ts, *self.numeric.values(), *self.codes.values()]
+        return sum(array.nbytes for array in arrays)
+
+# Global instance
+candidate_columns = None
+_columns_lock = threading.Lock()
+
+def get_candidate_columns(snapshot: Optional[Tuple[int, List[dict]]] = None) -> CandidateColumns:
+    """Get the columnar snapshot for the current store version, rebuilding it if stale.
+    Pass a (version, records) pair from store.snapshot() to get columns for exactly that
+    version, consistent with the records the caller already holds."""
+    global candidate_columns
+    columns = candidate_columns
+    wanted = snapshot[0] if snapshot is not None else get_candidate_store().current_version()
+    if columns is not None and columns.version == wanted:
+        return columns
+
+    with _columns_lock:
+        # Copy the record list only on a miss, and read it atomically with its version
+        version, records = snapshot if snapshot is not None else get_candidate_store().snapshot()
+        if candidate_columns is not None and candidate_columns.version == version:
+            return candidate_columns
+        columns = CandidateColumns(records, version)
+        # A caller's snapshot older than the cached build is served without replacing it
+        if snapshot is None or candidate_columns is None or version > candidate_columns.version:
+            candidate_columns = columns
+            logger.info(f"Built columnar snapshot of {columns.size} candidates "
+                        f"({columns.memory_bytes() / 1024:.0f} KB) at version {version}")
+    return columns
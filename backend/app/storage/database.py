@@ -0,0 +1,79 @@
+"""
+Database - storage backend selection driven by settings.database_url
+    sqlite:///./fair_hiring.db   SQLite tables (relative paths resolve against the backend directory)
+    sqlite:///:memory:           throwaway SQLite database
+    json:///./candidates.json    legacy JSON files, other tables kept in memory
+"""
+
+import logging
+import os
+from typing import Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.storage.importer import IMPORT_META_KEY, INTERVIEWS_FILE, import_json_data
+from app.storage.json_backend import DATA_FILE, JsonCandidateBackend
+from app.storage.sqlite_backend import SQLiteCandidateBackend, SQLiteDatabase
+from app.storage.tables import MemoryTable
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = os.path.dirname(DATA_FILE)
+
+def parse_database_url(url: str) -> Tuple[str, str]:
+    """Split a database URL into (scheme, absolute path or ':memory:')"""
+    scheme, sep, rest = url.partition('://')
+    if not sep or scheme not in ('sqlite', 'json'):
+        raise ValueError(f"Unsupported database_url: {url} (expected sqlite:/// or json:///)")
+
+    # sqlite:///relative/path -> "relative/path", sqlite:////abs/path -> "/abs/path"
+    path = rest[1:] if rest.startswith('/') else rest
+    if not path:
+        path = DATA_FILE if scheme == 'json' else ':memory:'
+    if path != ':memory:' and not os.path.isabs(path):
+        path = os.path.normpath(os.path.join(BACKEND_DIR, path))
+    return scheme, path
+
+# Global instances
+database = None
+_tables: Dict[str, object] = {}
+
+def get_database() -> Optional[SQLiteDatabase]:
+    """Get the global SQLite database, or None when database_url selects JSON storage"""
+    global database
+    scheme, path = parse_database_url(settings.database_url)
+    if scheme != 'sqlite':
+        return None
+
+    if database is None:
+        database = SQLiteDatabase(path)
+        if database.get_meta(IMPORT_META_KEY) is None:
+            import_json_data(database)
+    return database
+
+def create_candidate_backend():
+    """Candidate store backend for the configured database_url"""
+    scheme, path = parse_database_url(settings.database_url)
+    if scheme == 'json':
+        return JsonCandidateBackend(path)
+    return SQLiteCandidateBackend(get_database())
+
+def get_table(name: str, seed: Optional[List[dict]] = None):
+    """Get a record table by name; `seed` rows are inserted the first time the table is created"""
+    table = _tables.get(name)
+    if table is not None:
+        return table
+
+    db = get_database()
+    if db is None:
+        json_file = INTERVIEWS_FILE if name == 'interviews' else None
+        table = MemoryTable(name, seed=seed, json_file=json_file)
+    else:
+        table = db.tables[name]
+        seed_key = f"seeded:{name}"
+        if seed and db.get_meta(seed_key) is None:
+            if table.count() == 0:
+                table.insert_many([dict(record) for record in seed])
+            db.set_meta(seed_key, '1')
+
+    _tables[name] = table
+    return table
@@ -0,0 +1,365 @@
+"""
+Fairness Monitor - online fairness statistics over hiring decisions and score updates
+Keeps per-group hire counts and Welford running means/variances for every score column, so
+parity, chi-square and t-test/ANOVA results come out in O(groups) without rescanning candidates.
+Sliding windows over recent decision and score events (last 30/90 days) support trend monitoring.
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from enum import Enum
+from typing import Any, Deque, Dict, Iterable, List, Optional, Tuple
+
+from scipy import stats
+
+from app.storage.aggregates import SCORE_FIELDS, numeric_value
+from app.storage.candidate_store import get_candidate_store
+
+logger = logging.getLogger(__name__)
+
+PROTECTED_ATTRIBUTES = ('gender', 'ethnicity')
+WINDOW_DAYS = (30, 90)
+SIGNIFICANCE_LEVEL = 0.05
+
+class RunningStats:
+    """Welford running count/mean/sum of squared deviations, with removal"""
+    __slots__ = ('count', 'mean', 'm2')
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float):
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def remove(self, value: float):
+        if self.count <= 1:
+            self.count, self.mean, self.m2 = 0, 0.0, 0.0
+            return
+        delta = value - self.mean
+        self.count -= 1
+        self.mean -= delta / self.count
+        # Rounding can leave a tiny negative residue once every value but one has gone
+        self.m2 = max(0.0, self.m2 - delta * (value - self.mean))
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (ddof=1), NaN below two values"""
+        return self.m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance) if self.count > 1 else math.nan
+
+def t_test_from_stats(a: RunningStats, b: RunningStats) -> Tuple[float, float]:
+    """Student's two-sample t-test (equal variances, as scipy.stats.ttest_ind) from summaries"""
+    result = stats.ttest_ind_from_stats(a.mean, a.std, a.count, b.mean, b.std, b.count, equal_var=True)
+    return float(result.statistic), float(result.pvalue)
+
+def anova_from_stats(groups: List[RunningStats]) -> Tuple[float, float]:
+    """One-way ANOVA (as scipy.stats.f_oneway) from per-group count/mean/M2"""
+    total = sum(group.count for group in groups)
+    between_df, within_df = len(groups) - 1, total - len(groups)
+    if between_df < 1 or within_df < 1:
+        return math.nan, math.nan
+    grand_mean = sum(group.count * group.mean for group in groups) / total
+    between = sum(group.count * (group.mean - grand_mean) ** 2 for group in groups)
+    within = sum(group.m2 for group in groups)
+    if within == 0:
+        return (math.inf, 0.0) if between > 0 else (math.nan, math.nan)
+    f_statistic = (between / between_df) / (within / within_df)
+    return f_statistic, float(stats.f.sf(f_statistic, between_df, within_df))
+
+def _finite(value: float) -> Optional[float]:
+    return value if math.isfinite(value) else None
+
+class GroupStats:
+    """Outcome counts and score summaries for one protected group"""
+    __slots__ = ('total', 'hired', 'scores')
+
+    def __init__(self):
+        self.total = 0
+        self.hired = 0
+        self.scores: Dict[str, RunningStats] = {field: RunningStats() for field in SCORE_FIELDS}
+
+    def empty(self) -> bool:
+        return not self.total and not any(score.count for score in self.scores.values())
+
+class FairnessAccumulator:
+    """Per protected attribute and group: counted candidates (or decisions), hires and
+    running score statistics, updated by signed contributions"""
+
+    def __init__(self, attributes: Iterable[str] = PROTECTED_ATTRIBUTES):
+        self.attributes = tuple(attributes)
+        self.total = 0
+        self.hired = 0
+        self.groups: Dict[str, Dict[Any, GroupStats]] = {attribute: {} for attribute in self.attributes}
+
+    def apply(self, groups: Dict[str, Any], counted: bool, hired: bool, scores: Dict[str, float], sign: int):
+        if counted:
+            self.total += sign
+            self.hired += sign if hired else 0
+        for attribute in self.attributes:
+            value = groups.get(attribute)
+            if value is None:
+                # Ungrouped candidates count towards the overall rate only, as with pandas groupby
+                continue
+            group = self.groups[attribute].setdefault(value, GroupStats())
+            if counted:
+                group.total += sign
+                group.hired += sign if hired else 0
+            for field, score in scores.items():
+                if sign > 0:
+                    group.scores[field].add(score)
+                else:
+                    group.scores[field].remove(score)
+            if group.empty():
+                del self.groups[attribute][value]
+
+    def apply_record(self, record: dict, sign: int):
+        """Add (+1) or remove (-1) a candidate's current state"""
+        self.apply(group_keys(record), True, record.get('hiring_decision') == 'hired', record_scores(record), sign)
+
+    def attribute_report(self, attribute: str) -> Dict[str, Any]:
+        """Hire rates, parity, chi-square and per-score t-test/ANOVA for one attribute"""
+        groups = self.groups[attribute]
+        counted = {value: group for value, group in groups.items() if group.total}
+        rates = {value: group.hired / group.total for value, group in counted.items()}
+        parity = max(rates.values()) - min(rates.values()) if len(rates) > 1 else 0.0
+
+        chi2_statistic, p_value = 0.0, 1.0
+        table = [[group.total - group.hired, group.hired] for group in counted.values()]
+        columns = [column for column in range(2) if any(row[column] for row in table)]
+        if len(table) > 1 and len(columns) == 2:
+            chi2_statistic, p_value, _, _ = stats.chi2_contingency(table)
+
+        score_analysis = {}
+        for field in SCORE_FIELDS:
+            present = {value: group.scores[field] for value, group in groups.items() if group.scores[field].count}
+            if len(present) < 2:
+                continue
+            summaries = list(present.values())
+            if len(summaries) == 2:
+                test, (statistic, score_p) = 't_test', t_test_from_stats(*summaries)
+            else:
+                test, (statistic, score_p) = 'anova', anova_from_stats(summaries)
+            score_analysis[field] = {
+                'mean_by_group': {str(value): s.mean for value, s in present.items()},
+                'std_by_group': {str(value): _finite(s.std) for value, s in present.items()},
+                'count_by_group': {str(value): s.count for value, s in present.items()},
+                'test': test,
+                'statistic': _finite(statistic),
+                'p_value': _finite(score_p),
+                'significant_difference': bool(score_p < SIGNIFICANCE_LEVEL) if math.isfinite(score_p) else False
+            }
+
+        return {
+            'total': self.total,
+            'overall_hiring_rate': self.hired / self.total if self.total else 0.0,
+            'hiring_rates_by_group': {str(value): rate for value, rate in rates.items()},
+            'group_counts': {str(value): group.total for value, group in counted.items()},
+            'demographic_parity_difference': parity,
+            'statistical_significance': {
+                'chi2_statistic': float(chi2_statistic),
+                'p_value': float(p_value),
+                'significant': bool(p_value < SIGNIFICANCE_LEVEL)
+            },
+            'score_analysis': score_analysis
+        }
+
+    def report(self) -> Dict[str, Any]:
+        return {attribute: self.attribute_report(attribute) for attribute in self.attributes}
+
+def group_keys(record: dict) -> Dict[str, Any]:
+    # Freshly written records may still hold the schema enums; group them with their stored strings
+    keys = {}
+    for attribute in PROTECTED_ATTRIBUTES:
+        value = record.get(attribute)
+        keys[attribute] = value.value if isinstance(value, Enum) else value
+    return keys
+
+def record_scores(record: dict, fields: Iterable[str] = SCORE_FIELDS) -> Dict[str, float]:
+    scores = {}
+    for field in fields:
+        value = numeric_value(record.get(field))
+        if value is not None:
+            scores[field] = value
+    return scores
+
+class FairnessEvent:
+    """One decision or score change inside a sliding window"""
+    __slots__ = ('key', 'timestamp', 'groups', 'counted', 'hired', 'scores', 'active')
+
+    def __init__(self, key: tuple, timestamp: float, groups: Dict[str, Any], counted: bool, hired: bool,
+                 scores: Dict[str, float]):
+        self.key = key
+        self.timestamp = timestamp
+        self.groups = groups
+        self.counted = counted
+        self.hired = hired
+        self.scores = scores
+        self.active = True
+
+class SlidingWindow:
+    """Fairness statistics over the events of the last `days` days. A newer event for the same
+    candidate (and score field) supersedes the older one, so re-decisions are counted once."""
+
+    def __init__(self, days: int):
+        self.days = days
+        self.span = days * 86400
+        self.stats = FairnessAccumulator()
+        self._events: Deque[FairnessEvent] = deque()
+        self._latest: Dict[tuple, FairnessEvent] = {}
+
+    def _retire(self, event: FairnessEvent):
+        event.active = False
+        self.stats.apply(event.groups, event.counted, event.hired, event.scores, -1)
+
+    def push(self, event: FairnessEvent):
+        previous = self._latest.get(event.key)
+        if previous is not None and previous.active:
+            self._retire(previous)
+        self._latest[event.key] = event
+        self._events.append(event)
+        self.stats.apply(event.groups, event.counted, event.hired, event.scores, 1)
+
+    def expire(self, now: float):
+        cutoff = now - self.span
+        while self._events and self._events[0].timestamp < cutoff:
+            event = self._events.popleft()
+            if event.active:
+                self._retire(event)
+            if self._latest.get(event.key) is event:
+                del self._latest[event.key]
+
+    def __len__(self) -> int:
+        return len(self._latest)
+
+def _timestamp(value: Any) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        stamp = datetime.fromisoformat(str(value).replace('Z', '+00:00'))
+    except ValueError:
+        return None
+    return stamp.timestamp()
+
+def decision_event(record: dict, timestamp: float) -> FairnessEvent:
+    return FairnessEvent((record['id'], 'hiring_decision'), timestamp, group_keys(record), True,
+                         record.get('hiring_decision') == 'hired', {})
+
+def changed_fields(before: dict, after: dict, fields: Iterable[str]) -> List[str]:
+    return [field for field in fields if before.get(field) != after.get(field)]
+
+def score_events(record: dict, fields: Iterable[str], timestamp: float) -> List[FairnessEvent]:
+    """One event per score column among `fields` (other changed fields are ignored)"""
+    fields = [field for field in fields if field in SCORE_FIELDS]
+    return [FairnessEvent((record['id'], field), timestamp, group_keys(record), False, False, {field: value})
+            for field, value in record_scores(record, fields).items()]
+
+class FairnessMonitor:
+    """All-candidate fairness statistics kept in step with the store, plus sliding windows over
+    decision and score events.
+
+    The all-candidate view observes the store, which hands it the old and new state of every
+    record it changes (from any endpoint, and from other workers' writes as they are replayed),
+    so it is only rebuilt on a full reload. The windows only see events from this process,
+    seeded at start-up from each record's updated_at."""
+
+    def __init__(self, store=None, window_days: Iterable[int] = WINDOW_DAYS):
+        self.store = store if store is not None else get_candidate_store()
+        self._lock = threading.Lock()
+        self.current = FairnessAccumulator()
+        self.windows: Dict[int, SlidingWindow] = {days: SlidingWindow(days) for days in window_days}
+        self.rebuilds = 0
+
+        self.store.add_observer(self)
+        _, records = self.store.snapshot()
+        self._seed_windows(records)
+
+    # Store observer interface (called under the store lock)
+
+    def reset(self):
+        with self._lock:
+            self.current = FairnessAccumulator()
+            self.rebuilds += 1
+
+    def add(self, record: dict):
+        with self._lock:
+            self.current.apply_record(record, 1)
+
+    def remove(self, record: dict):
+        with self._lock:
+            self.current.apply_record(record, -1)
+
+    def _seed_windows(self, records: List[dict]):
+        events = []
+        for record in records:
+            timestamp = _timestamp(record.get('updated_at'))
+            if timestamp is None:
+                continue
+            if record.get('hiring_decision'):
+                events.append(decision_event(record, timestamp))
+            events.extend(score_events(record, SCORE_FIELDS, timestamp))
+        events.sort(key=lambda event: event.timestamp)
+        now = time.time()
+        for window in self.windows.values():
+            for event in events:
+                if event.timestamp >= now - window.span:
+                    window.push(event)
+
+    def _observe(self, events: List[FairnessEvent]):
+        with self._lock:
+            for event in events:
+                for window in self.windows.values():
+                    window.push(event)
+
+    def record_decision(self, before: dict, after: dict):
+        """A hiring decision was written: `before`/`after` are copies of the record around the write"""
+        self._observe([decision_event(after, time.time())])
+
+    def record_scores(self, before: dict, after: dict):
+        """Scores were written; only the score columns whose value changed become events"""
+        self._observe(score_events(after, changed_fields(before, after, SCORE_FIELDS), time.time()))
+
+    def record_batch(self, changes: List[Tuple[dict, dict, Iterable[str]]]):
+        """Several (before, after, written fields) committed together"""
+        now = time.time()
+        events = []
+        for before, after, fields in changes:
+            if 'hiring_decision' in fields:
+                events.append(decision_event(after, now))
+            events.extend(score_events(after, changed_fields(before, after, SCORE_FIELDS), now))
+        self._observe(events)
+
+    def report(self, window_days: Optional[int] = None) -> Dict[str, Any]:
+        """Fairness statistics for all candidates, or for the events of one sliding window"""
+        if window_days is None:
+            with self.store.locked() as version, self._lock:
+                return {'window_days': None, 'version': version, 'attributes': self.current.report()}
+
+        with self._lock:
+            window = self.windows[window_days]
+            window.expire(time.time())
+            return {'window_days': window_days, 'events': len(window), 'attributes': window.stats.report()}
+
+# Global instance
+fairness_monitor = None
+_monitor_lock = threading.Lock()
+
+def get_fairness_monitor() -> FairnessMonitor:
+    """Get the process-wide fairness monitor, seeding it from the store on first use"""
+    global fairness_monitor
+    if fairness_monitor is None:
+        with _monitor_lock:
+            if fairness_monitor is None:
+                fairness_monitor = FairnessMonitor()
+    return fairness_monitor
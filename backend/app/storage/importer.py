@@ -0,0 +1,66 @@
+"""
+JSON Importer - one-shot copy of candidates.json (plus its journal) and interviews.json into SQLite
+Runs automatically the first time a SQLite database is opened; re-run by hand with:
+    python -m app.storage.importer --force
+"""
+
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Dict
+
+from app.storage.candidate_store import CandidateStore
+from app.storage.json_backend import DATA_FILE, JsonCandidateBackend
+from app.storage.sqlite_backend import SQLiteCandidateBackend, SQLiteDatabase
+
+logger = logging.getLogger(__name__)
+
+INTERVIEWS_FILE = os.path.join(os.path.dirname(DATA_FILE), "interviews.json")
+
+# Meta key recording when the JSON files were last imported
+IMPORT_META_KEY = 'json_import'
+
+def import_json_data(db: SQLiteDatabase, data_file: str = DATA_FILE,
+                     interviews_file: str = INTERVIEWS_FILE) -> Dict[str, int]:
+    """Replace the candidates and interviews tables with the contents of the JSON files"""
+    # Going through the JSON store replays any journal entries not yet compacted
+    candidates = CandidateStore(JsonCandidateBackend(data_file)).all()
+    SQLiteCandidateBackend(db).replace_all(candidates)
+
+    interviews = []
+    if os.path.exists(interviews_file):
+        try:
+            with open(interviews_file, 'r') as f:
+                interviews = json.load(f)
+        except json.JSONDecodeError as e:
+            logger.error(f"Error loading interviews for import: {e}")
+
+    with db.transaction() as conn:
+        conn.execute('DELETE FROM interviews')
+    db.tables['interviews'].insert_many([i for i in interviews if i.get('id') is not None])
+
+    db.set_meta(IMPORT_META_KEY, datetime.now().isoformat())
+    counts = {'candidates': len(candidates), 'interviews': len(interviews)}
+    logger.info(f"Imported {counts['candidates']} candidates and {counts['interviews']} interviews into {db.path}")
+    return counts
+
+if __name__ == "__main__":
+    import argparse
+
+    from app.storage.database import get_database
+
+    parser = argparse.ArgumentParser(description="Import candidates.json and interviews.json into SQLite")
+    parser.add_argument('--force', action='store_true', help="re-import even if the database was already populated")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    db = get_database()
+    if db is None:
+        parser.error("database_url does not point at a SQLite database")
+
+    imported_at = db.get_meta(IMPORT_META_KEY)
+    if args.force:
+        print(import_json_data(db))
+    else:
+        print(f"JSON data already imported into {db.path} at {imported_at} (use --force to re-import)")
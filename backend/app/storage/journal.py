@@ -0,0 +1,134 @@
+"""
+Candidate Journal - append-only write-ahead log for candidate mutations
+Each line is a JSON record ({"op": "create" | "patch" | "delete", "id": ..., "data": ...})
+"""
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+class CandidateJournal:
+    """JSONL mutation log with batched fsync and crash-safe replay.
+    
+    Durability window: an acknowledged append reaches stable storage within fsync_interval
+    seconds, either with the batch that crosses fsync_batch_size or from a flush timer that
+    syncs whatever a burst left pending.
+    """
+
+    def __init__(self, path: str, fsync_batch_size: int = 64, fsync_interval: float = 0.5):
+        self.path = path
+        self.fsync_batch_size = fsync_batch_size
+        self.fsync_interval = fsync_interval
+        self.entry_count = 0
+
+        self._handle = None
+        self._valid_size = 0
+        self._torn = False
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+        self._lock = threading.Lock()
+        self._flush_timer: Optional[threading.Timer] = None
+        atexit.register(self.close)
+
+    def signature(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, size) of the journal file, or None if it does not exist"""
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """Yield every complete entry, stopping at the first torn or corrupt line. The file is
+        left untouched: the tail may be another worker's append still in progress."""
+        self.close()
+        self.entry_count = 0
+        self._valid_size = 0
+        self._torn = False
+        if not os.path.exists(self.path):
+            return
+
+        with open(self.path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    self._torn = True
+                    break
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    self._torn = True
+                    break
+                self._valid_size += len(line)
+                self.entry_count += 1
+                yield entry
+
+    def _truncate_torn_tail(self):
+        """Cut a torn tail found by the last replay so new entries start on a line boundary.
+        Only safe under the backend write lock, where no other worker can be appending."""
+        if not self._torn:
+            return
+        logger.warning(f"Truncating torn candidate journal tail at byte {self._valid_size}: {self.path}")
+        with open(self.path, 'r+b') as f:
+            f.truncate(self._valid_size)
+            f.flush()
+            os.fsync(f.fileno())
+        self._torn = False
+
+    def append(self, entries: List[Dict[str, Any]]):
+        """Append entries in one write; fsync once per batch or interval (group commit).
+        The caller holds the backend write lock."""
+        payload = b''.join(json.dumps(entry, default=str).encode('utf-8') + b'\n' for entry in entries)
+        with self._lock:
+            if self._handle is None:
+                self._truncate_torn_tail()
+                self._handle = open(self.path, 'ab')
+            self._handle.write(payload)
+            self._handle.flush()
+
+            self._valid_size += len(payload)
+            self.entry_count += len(entries)
+            self._unsynced += len(entries)
+            if (self._unsynced >= self.fsync_batch_size or
+                    time.monotonic() - self._last_sync >= self.fsync_interval):
+                self._sync()
+            elif self._flush_timer is None:
+                # Bound how long the tail of a burst can stay unsynced
+                self._flush_timer = threading.Timer(self.fsync_interval, self.sync)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def sync(self):
+        """Force pending entries to stable storage"""
+        with self._lock:
+            self._sync()
+
+    def _sync(self):
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if self._handle is not None and self._unsynced:
+            os.fsync(self._handle.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def reset(self):
+        """Discard all entries once they have been compacted into a snapshot"""
+        self.close()
+        with open(self.path, 'wb') as f:
+            os.fsync(f.fileno())
+        self.entry_count = 0
+        self._valid_size = 0
+        self._torn = False
+
+    def close(self):
+        with self._lock:
+            self._sync()
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
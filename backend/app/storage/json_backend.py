@@ -0,0 +1,90 @@
+"""
+JSON Candidate Backend - candidates.json snapshot plus an append-only mutation journal
+Used when database_url selects json:// storage, and as the source for the one-shot SQLite importer.
+"""
+
+import json
+import logging
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.storage.journal import CandidateJournal
+
+try:
+    import fcntl
+except ImportError:  # Windows: fall back to the in-process lock only
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+DATA_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), "candidates.json")
+JOURNAL_FILE = os.path.splitext(DATA_FILE)[0] + ".journal.jsonl"
+
+# Compact once the journal holds this many entries, or as many entries as there are
+# candidates if that is larger, so the O(N) snapshot rewrite stays amortized O(1) per write
+COMPACTION_MIN_ENTRIES = 1000
+
+class JsonCandidateBackend:
+    """Snapshot + journal persistence for the candidate store"""
+
+    def __init__(self, data_file: str = DATA_FILE, journal_file: Optional[str] = None):
+        self.data_file = data_file
+        self.location = data_file
+        self.journal = CandidateJournal(journal_file or os.path.splitext(data_file)[0] + ".journal.jsonl")
+
+    @contextmanager
+    def write_lock(self):
+        """Exclusive advisory lock on <data_file>.lock so workers in other processes
+        cannot interleave their read-check-write with ours"""
+        if fcntl is None:
+            yield
+            return
+        with open(self.data_file + '.lock', 'a') as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def signature(self) -> Optional[Tuple]:
+        """(mtime_ns, size) of the snapshot and the journal; None if there is no snapshot"""
+        try:
+            stat = os.stat(self.data_file)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, self.journal.signature())
+
+    def load(self) -> Tuple[List[dict], Iterable[Dict[str, Any]]]:
+        """Return the snapshot records and the journal entries to replay on top of them"""
+        data: List[dict] = []
+        if not os.path.exists(self.data_file):
+            logger.warning(f"Candidates file not found: {self.data_file}")
+        else:
+            try:
+                with open(self.data_file, 'r') as f:
+                    data = json.load(f)
+            except (json.JSONDecodeError, FileNotFoundError) as e:
+                logger.error(f"Error loading candidates: {e}")
+                data = []
+
+        # Replay is idempotent, so a crash between writing the snapshot and resetting
+        # the journal is harmless
+        return data, self.journal.replay()
+
+    def commit(self, entries: List[Dict[str, Any]], records: Dict[int, dict]):
+        """Append applied entries to the journal and compact when it grows past the threshold"""
+        self.journal.append(entries)
+        if self.journal.entry_count >= max(COMPACTION_MIN_ENTRIES, len(records)):
+            self.compact(records)
+
+    def compact(self, records: Dict[int, dict]):
+        """Rewrite the snapshot atomically from memory and reset the journal"""
+        tmp_file = self.data_file + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(list(records.values()), f, indent=2, default=str)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_file, self.data_file)
+        self.journal.reset()
+        logger.info(f"Compacted {len(records)} candidates into {self.data_file}")
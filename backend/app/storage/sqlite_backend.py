@@ -0,0 +1,262 @@
+"""
+SQLite Backend - indexed tables for candidates, interviews, feedback, notifications and calendar events
+Whole records are kept as JSON in a `data` column; the fields routers filter on are promoted
+to indexed columns so lookups and filters run as index scans.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from app.storage.tables import TABLE_SPECS, column_value, json_default, normalize_time_bound, time_value
+
+logger = logging.getLogger(__name__)
+
+CANDIDATES_SCHEMA = """
+CREATE TABLE IF NOT EXISTS candidates (
+    id INTEGER PRIMARY KEY,
+    position_key TEXT,
+    is_active INTEGER,
+    hiring_decision TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_candidates_position_key ON candidates(position_key);
+CREATE INDEX IF NOT EXISTS idx_candidates_is_active ON candidates(is_active);
+CREATE INDEX IF NOT EXISTS idx_candidates_hiring_decision ON candidates(hiring_decision);
+CREATE INDEX IF NOT EXISTS idx_candidates_created_at ON candidates(created_at);
+"""
+
+class SQLiteDatabase:
+    """Single shared connection (WAL mode) guarded by a lock"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.RLock()
+        self._depth = 0
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+
+        with self._lock:
+            if path != ':memory:':
+                self.conn.execute('PRAGMA journal_mode=WAL')
+            self.conn.execute('PRAGMA synchronous=NORMAL')
+            self.conn.executescript(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);" + CANDIDATES_SCHEMA
+            )
+
+        self.tables: Dict[str, SQLiteTable] = {name: SQLiteTable(self, name) for name in TABLE_SPECS}
+        for table in self.tables.values():
+            table.create_schema()
+
+    @contextmanager
+    def transaction(self, immediate: bool = False) -> Iterator[sqlite3.Connection]:
+        """Run statements in one transaction; commits on success, rolls back on error.
+        Nested calls join the outermost transaction. `immediate` takes the database write
+        lock up front so other processes cannot commit between our read and our write."""
+        with self._lock:
+            if self._depth:
+                self._depth += 1
+                try:
+                    yield self.conn
+                finally:
+                    self._depth -= 1
+                return
+
+            self._depth = 1
+            try:
+                self.conn.execute('BEGIN IMMEDIATE' if immediate else 'BEGIN')
+                yield self.conn
+                self.conn.commit()
+            except BaseException:
+                self.conn.rollback()
+                raise
+            finally:
+                self._depth = 0
+
+    def query(self, sql: str, params: Tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchall()
+
+    def data_version(self) -> int:
+        """Changes whenever another connection commits to the database file"""
+        return self.query('PRAGMA data_version')[0][0]
+
+    def get_meta(self, key: str) -> Optional[str]:
+        rows = self.query('SELECT value FROM meta WHERE key = ?', (key,))
+        return rows[0][0] if rows else None
+
+    def set_meta(self, key: str, value: str):
+        with self.transaction() as conn:
+            conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    def close(self):
+        with self._lock:
+            self.conn.close()
+
+class SQLiteTable:
+    """Record table with indexed columns; same interface as MemoryTable"""
+
+    def __init__(self, db: SQLiteDatabase, name: str):
+        spec = TABLE_SPECS[name]
+        self.db = db
+        self.name = name
+        self.key = spec['key']
+        self.key_type = spec['key_type']
+        self.columns = spec['columns']
+        self.time_column = spec['time_column']
+
+    def create_schema(self):
+        column_defs = ''.join(f", {column}" for column in self.columns)
+        statements = [
+            f"CREATE TABLE IF NOT EXISTS {self.name} "
+            f"({self.key} {self.key_type} PRIMARY KEY{column_defs}, data TEXT NOT NULL)"
+        ]
+        for column in self.columns:
+            statements.append(
+                f"CREATE INDEX IF NOT EXISTS idx_{self.name}_{column} ON {self.name}({column})"
+            )
+        with self.db.transaction() as conn:
+            for statement in statements:
+                conn.execute(statement)
+
+    def _row(self, record: dict) -> tuple:
+        values = [record[self.key]]
+        for column in self.columns:
+            value = record.get(column)
+            values.append(time_value(value) if column == self.time_column else column_value(value))
+        values.append(json.dumps(record, default=json_default))
+        return tuple(values)
+
+    def _where(self, filters: Dict[str, Any], date_from: Optional[str],
+               date_to: Optional[str]) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        for field, value in filters.items():
+            if field not in self.columns and field != self.key:
+                raise ValueError(f"{self.name}.{field} is not an indexed column")
+            if value is None:
+                clauses.append(f"{field} IS NULL")
+            else:
+                clauses.append(f"{field} = ?")
+                params.append(column_value(value))
+        if date_from is not None:
+            clauses.append(f"{self.time_column} >= ?")
+            params.append(date_from)
+        if date_to is not None:
+            clauses.append(f"{self.time_column} <= ?")
+            params.append(date_to)
+        return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+    def all(self) -> List[dict]:
+        return [json.loads(row[0]) for row in self.db.query(f"SELECT data FROM {self.name} ORDER BY rowid")]
+
+    def get(self, key: Any) -> Optional[dict]:
+        rows = self.db.query(f"SELECT data FROM {self.name} WHERE {self.key} = ?", (key,))
+        return json.loads(rows[0][0]) if rows else None
+
+    def find(self, date_from: Optional[str] = None, date_to: Optional[str] = None,
+             limit: Optional[int] = None, offset: int = 0, **filters) -> List[dict]:
+        """Records matching all equality filters and the time column range, in insertion order"""
+        where, params = self._where(filters, normalize_time_bound(date_from), normalize_time_bound(date_to))
+        sql = f"SELECT data FROM {self.name}{where} ORDER BY rowid LIMIT ? OFFSET ?"
+        params += [-1 if limit is None else limit, offset]
+        return [json.loads(row[0]) for row in self.db.query(sql, tuple(params))]
+
+    def count(self, **filters) -> int:
+        where, params = self._where(filters, None, None)
+        return self.db.query(f"SELECT COUNT(*) FROM {self.name}{where}", tuple(params))[0][0]
+
+    def next_key(self) -> int:
+        return self.db.query(f"SELECT COALESCE(MAX({self.key}), 0) + 1 FROM {self.name}")[0][0]
+
+    def insert(self, record: dict) -> dict:
+        """Insert a record, assigning the next integer key when it has none"""
+        placeholders = ', '.join('?' * (len(self.columns) + 2))
+        with self.db.transaction() as conn:
+            if record.get(self.key) is None:
+                record[self.key] = self.next_key()
+            conn.execute(f"INSERT OR REPLACE INTO {self.name} VALUES ({placeholders})", self._row(record))
+        return record
+
+    def insert_many(self, records: List[dict]):
+        placeholders = ', '.join('?' * (len(self.columns) + 2))
+        with self.db.transaction() as conn:
+            conn.executemany(f"INSERT OR REPLACE INTO {self.name} VALUES ({placeholders})",
+                             [self._row(record) for record in records])
+
+    def update(self, key: Any, record: dict) -> Optional[dict]:
+        """Replace a stored record; None if the key does not exist"""
+        assignments = ''.join(f"{column} = ?, " for column in self.columns)
+        row = self._row(record)
+        with self.db.transaction() as conn:
+            cursor = conn.execute(f"UPDATE {self.name} SET {assignments}data = ? WHERE {self.key} = ?",
+                                  row[1:] + (key,))
+        return record if cursor.rowcount else None
+
+    def delete(self, key: Any) -> Optional[dict]:
+        with self.db.transaction() as conn:
+            record = self.get(key)
+            if record is not None:
+                conn.execute(f"DELETE FROM {self.name} WHERE {self.key} = ?", (key,))
+        return record
+
+def _candidate_row(record: dict) -> tuple:
+    is_active = record.get('is_active')
+    return (
+        record['id'],
+        (record.get('position_applied') or '').lower(),
+        None if is_active is None else int(bool(is_active)),
+        record.get('hiring_decision'),
+        time_value(record.get('created_at')),
+        json.dumps(record, default=json_default),
+    )
+
+class SQLiteCandidateBackend:
+    """Candidate store persistence on the candidates table"""
+
+    def __init__(self, db: SQLiteDatabase):
+        self.db = db
+        self.location = db.path
+
+    def signature(self) -> Optional[Tuple]:
+        # Our own commits leave data_version unchanged, so this only trips on outside writers
+        return ('sqlite', self.db.data_version())
+
+    def write_lock(self):
+        """Hold the SQLite write lock across a read-check-write sequence"""
+        return self.db.transaction(immediate=True)
+
+    def load(self) -> Tuple[List[dict], List[Dict[str, Any]]]:
+        rows = self.db.query('SELECT data FROM candidates ORDER BY id')
+        return [json.loads(row[0]) for row in rows], []
+
+    def commit(self, entries: List[Dict[str, Any]], records: Dict[int, dict]):
+        """Write the current state of every touched candidate in one transaction"""
+        upserts, deletes = {}, set()
+        for entry in entries:
+            candidate_id = entry.get('id')
+            record = records.get(candidate_id)
+            if record is None:
+                upserts.pop(candidate_id, None)
+                deletes.add(candidate_id)
+            else:
+                deletes.discard(candidate_id)
+                upserts[candidate_id] = record
+
+        with self.db.transaction() as conn:
+            if deletes:
+                conn.executemany('DELETE FROM candidates WHERE id = ?', [(i,) for i in deletes])
+            if upserts:
+                conn.executemany('INSERT OR REPLACE INTO candidates VALUES (?, ?, ?, ?, ?, ?)',
+                                 [_candidate_row(record) for record in upserts.values()])
+
+    def compact(self, records: Dict[int, dict]):
+        """Nothing to compact; SQLite checkpoints its own WAL"""
+
+    def replace_all(self, records: List[dict]):
+        with self.db.transaction() as conn:
+            conn.execute('DELETE FROM candidates')
+            conn.executemany('INSERT OR REPLACE INTO candidates VALUES (?, ?, ?, ?, ?, ?)',
+                             [_candidate_row(record) for record in records if record.get('id') is not None])
@@ -0,0 +1,185 @@
+"""
+Record Tables - table definitions and the in-memory table used by the JSON backend
+Every table stores whole records as JSON and promotes a few fields to indexed columns.
+"""
+
+import json
+import os
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+# name -> primary key, key type, indexed columns and the column used for date range filters
+TABLE_SPECS: Dict[str, Dict[str, Any]] = {
+    'interviews': {
+        'key': 'id',
+        'key_type': 'INTEGER',
+        'columns': ('candidate_id', 'status', 'scheduled_date'),
+        'time_column': 'scheduled_date',
+    },
+    'feedback': {
+        'key': 'id',
+        'key_type': 'INTEGER',
+        'columns': ('interview_id', 'candidate_id', 'interviewer_id', 'feedback_submitted_at'),
+        'time_column': 'feedback_submitted_at',
+    },
+    'notifications': {
+        'key': 'id',
+        'key_type': 'INTEGER',
+        'columns': ('recipient', 'status', 'sent_at'),
+        'time_column': 'sent_at',
+    },
+    'scheduled_notifications': {
+        'key': 'id',
+        'key_type': 'INTEGER',
+        'columns': ('recipient', 'status', 'scheduled_for'),
+        'time_column': 'scheduled_for',
+    },
+    'calendar_events': {
+        'key': 'id',
+        'key_type': 'TEXT',
+        'columns': ('calendar_id', 'interview_id', 'start_time'),
+        'time_column': 'start_time',
+    },
+    'screening_jobs': {
+        'key': 'id',
+        'key_type': 'TEXT',
+        'columns': ('status', 'position_title', 'created_at'),
+        'time_column': 'created_at',
+    },
+    'screening_results': {
+        'key': 'id',
+        'key_type': 'TEXT',
+        'columns': ('job_id', 'status', 'overall_score', 'completed_at'),
+        'time_column': 'completed_at',
+    },
+}
+
+def json_default(value: Any) -> Any:
+    """JSON fallback for values such as datetimes coming straight from request models"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+def column_value(value: Any) -> Any:
+    """Normalize a record field into the value stored in its indexed column"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, default=json_default)
+    return value
+
+def time_value(value: Any) -> Optional[str]:
+    """Normalize a stored timestamp to ISO form so range filters compare consistently"""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.isoformat()
+    try:
+        return datetime.fromisoformat(str(value).replace('Z', '+00:00')).isoformat()
+    except ValueError:
+        return str(value)
+
+def normalize_time_bound(value: Optional[str]) -> Optional[str]:
+    """Validate an ISO date/datetime filter and return it in the stored ISO form"""
+    if value is None:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).isoformat()
+
+class MemoryTable:
+    """List-backed table, optionally mirrored to a JSON file after each write"""
+
+    def __init__(self, name: str, seed: Optional[List[dict]] = None, json_file: Optional[str] = None):
+        spec = TABLE_SPECS[name]
+        self.name = name
+        self.key = spec['key']
+        self.key_type = spec['key_type']
+        self.time_column = spec['time_column']
+        self.json_file = json_file
+        self._lock = threading.RLock()
+
+        records: List[dict] = []
+        if json_file and os.path.exists(json_file):
+            with open(json_file, 'r') as f:
+                records = json.load(f)
+        elif seed:
+            records = [dict(record) for record in seed]
+        self._records: Dict[Any, dict] = {record[self.key]: record for record in records}
+
+    def _persist(self):
+        if not self.json_file:
+            return
+        tmp_file = self.json_file + '.tmp'
+        with open(tmp_file, 'w') as f:
+            json.dump(list(self._records.values()), f, indent=2, default=json_default)
+        os.replace(tmp_file, self.json_file)
+
+    def _matches(self, record: dict, filters: Dict[str, Any], date_from: Optional[str],
+                 date_to: Optional[str]) -> bool:
+        for field, value in filters.items():
+            if column_value(record.get(field)) != column_value(value):
+                return False
+        if date_from is not None or date_to is not None:
+            stamp = time_value(record.get(self.time_column))
+            if stamp is None:
+                return False
+            if date_from is not None and stamp < date_from:
+                return False
+            if date_to is not None and stamp > date_to:
+                return False
+        return True
+
+    def all(self) -> List[dict]:
+        with self._lock:
+            return list(self._records.values())
+
+    def get(self, key: Any) -> Optional[dict]:
+        return self._records.get(key)
+
+    def find(self, date_from: Optional[str] = None, date_to: Optional[str] = None,
+             limit: Optional[int] = None, offset: int = 0, **filters) -> List[dict]:
+        """Records matching all equality filters and the time column range, in insertion order"""
+        date_from, date_to = normalize_time_bound(date_from), normalize_time_bound(date_to)
+        with self._lock:
+            matches = [r for r in self._records.values() if self._matches(r, filters, date_from, date_to)]
+        end = None if limit is None else offset + limit
+        return matches[offset:end]
+
+    def count(self, **filters) -> int:
+        if not filters:
+            return len(self._records)
+        return len(self.find(**filters))
+
+    def next_key(self) -> int:
+        return max((k for k in self._records if isinstance(k, int)), default=0) + 1
+
+    def insert(self, record: dict) -> dict:
+        """Insert a record, assigning the next integer key when it has none"""
+        with self._lock:
+            if record.get(self.key) is None:
+                record[self.key] = self.next_key()
+            self._records[record[self.key]] = record
+            self._persist()
+            return record
+
+    def insert_many(self, records: List[dict]):
+        with self._lock:
+            for record in records:
+                self._records[record[self.key]] = record
+            self._persist()
+
+    def update(self, key: Any, record: dict) -> Optional[dict]:
+        """Replace a stored record; None if the key does not exist"""
+        with self._lock:
+            if key not in self._records:
+                return None
+            self._records[key] = record
+            self._persist()
+            return record
+
+    def delete(self, key: Any) -> Optional[dict]:
+        with self._lock:
+            record = self._records.pop(key, None)
+            if record is not None:
+                self._persist()
+            return record
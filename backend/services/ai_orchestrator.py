@@ -4,11 +4,17 @@ Handles LangChain chains, model management, and AI workflow coordination
 """
 
 import asyncio
+import copy
+import hashlib
 import logging
 import json
+import random
+import threading
+import time
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Optional, Any, Union
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Tuple, Union
 from datetime import datetime
 import statistics
 
@@ -31,10 +37,13 @@ try:
 except ImportError:
     LANGFUSE_AVAILABLE = False
 
+from services.bias_lexicon import get_bias_lexicon
+
 logger = logging.getLogger(__name__)
 
 def convert_numpy_types(obj):
-    """Convert numpy types to native Python types for JSON serialization"""
+    """Convert numpy types to native Python types for JSON serialization. Analysis results
+    no longer pass through this; responses serialize them with services.json_encoding.dumps"""
     import pandas as pd
     import numpy as np
     
@@ -91,6 +100,281 @@ def convert_numpy_types(obj):
             return 0.0
         return obj
 
+# Protected attributes analyzed by get_bias_insights
+BIAS_ATTRIBUTES = ('gender', 'ethnicity', 'age_group')
+
+class InsightCache:
+    """Bounded LRU cache with a per-entry TTL and hit/miss counters. Keys start with the
+    candidate dataset version; storing an entry for a newer version drops every older one.
+    Values are deep-copied in and out, so callers may mutate what they get back."""
+    
+    def __init__(self, max_entries: int = 128, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: 'OrderedDict[Tuple, Tuple[float, Any]]' = OrderedDict()
+        self._latest_version: Optional[int] = None
+        self._lock = threading.Lock()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: Tuple) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] <= self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            if entry is not None:
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return None
+    
+    def put(self, key: Tuple, value: Any):
+        with self._lock:
+            version = key[0]
+            if self._latest_version is None or version > self._latest_version:
+                # Candidate writes bump the dataset version, so older entries can never hit again
+                stale = [k for k in self._entries if k[0] < version]
+                for k in stale:
+                    del self._entries[k]
+                self.evictions += len(stale)
+                self._latest_version = version
+            elif version < self._latest_version:
+                return
+            
+            self._entries[key] = (time.monotonic(), copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'cache_size': len(self._entries),
+            'cache_max_entries': self.max_entries,
+            'cache_ttl_seconds': self.ttl_seconds,
+            'cache_hits': self.hits,
+            'cache_misses': self.misses,
+            'cache_evictions': self.evictions,
+            'cache_hit_rate': self.hits / lookups if lookups else 0.0
+        }
+
+def candidate_set_hash(candidates: List[Dict[str, Any]]) -> Optional[str]:
+    """Order-independent digest of the candidate ids; None if any candidate has no id"""
+    ids = [c.get('id') for c in candidates]
+    if any(not isinstance(i, int) for i in ids):
+        return None
+    ordered = np.sort(np.fromiter(ids, dtype=np.int64, count=len(ids)))
+    return hashlib.blake2b(ordered.tobytes(), digest_size=16).hexdigest()
+
+# Age bands used for age_group bias analysis: right-inclusive bins, ages outside them group as 'nan'
+AGE_GROUP_BINS = [0, 30, 45, 65, 100]
+AGE_GROUP_LABELS = ['Under 30', '30-45', '45-65', 'Over 65']
+
+def _age_number(value: Any) -> float:
+    """Age as a float, NaN when it is missing or not numeric"""
+    try:
+        return float(value) if value is not None and not isinstance(value, bool) else np.nan
+    except (TypeError, ValueError):
+        return np.nan
+
+# Standard score columns and the alternative names accepted when none of them are present
+SCORE_COLUMNS = ('resume_score', 'interview_score', 'technical_score', 'final_score')
+ALTERNATIVE_SCORE_COLUMNS = {
+    'resume_score': ['resume', 'cv_score', 'application_score'],
+    'interview_score': ['interview', 'behavioral_score'],
+    'technical_score': ['technical', 'coding_score', 'skill_score'],
+    'final_score': ['final', 'total_score', 'overall_score', 'score']
+}
+ALL_SCORE_COLUMN_NAMES = set(SCORE_COLUMNS).union(*ALTERNATIVE_SCORE_COLUMNS.values())
+
+# Intersectional analysis defaults: attributes crossed, and the smallest cell that is tested
+INTERSECTIONAL_ATTRIBUTES = ('gender', 'ethnicity', 'age_group', 'position_applied')
+INTERSECTIONAL_MIN_SUPPORT = 30
+
+def _adjust_p_values(p_values: np.ndarray, correction: str) -> np.ndarray:
+    """Multiple-comparison adjusted p-values: Benjamini-Hochberg ('fdr_bh') or Bonferroni"""
+    count = len(p_values)
+    if correction == 'bonferroni':
+        return np.minimum(1.0, p_values * count)
+    if correction != 'fdr_bh':
+        raise ValueError(f"Unknown correction '{correction}'; use 'fdr_bh' or 'bonferroni'")
+    order = np.argsort(p_values)
+    scaled = p_values[order] * count / np.arange(1, count + 1)
+    adjusted = np.empty(count)
+    adjusted[order] = np.minimum(1.0, np.minimum.accumulate(scaled[::-1])[::-1])
+    return adjusted
+
+# Bootstrap confidence intervals: resamples, interval level and RNG seed (fixed, so repeated
+# analyses of the same data report the same intervals)
+BOOTSTRAP_RESAMPLES = 1000
+BOOTSTRAP_CONFIDENCE = 0.95
+BOOTSTRAP_SEED = 0
+
+# Score bootstrap: a resampled group mean is drawn exactly (one index per resampled score)
+# for groups of up to this many scores, and from its normal limit for larger groups
+BOOTSTRAP_EXACT_GROUP_ROWS = 1000
+
+def _percentile_interval(estimate: float, samples: np.ndarray, confidence: float) -> Dict[str, Optional[float]]:
+    finite = samples[np.isfinite(samples)]
+    if not len(finite):
+        return {'estimate': float(estimate), 'lower': None, 'upper': None}
+    tail = (1 - confidence) / 2 * 100
+    lower, upper = np.percentile(finite, [tail, 100 - tail])
+    return {'estimate': float(estimate), 'lower': float(lower), 'upper': float(upper)}
+
+def _spread(values: np.ndarray) -> np.ndarray:
+    """Row-wise max - min over the finite entries; 0 where fewer than two groups remain"""
+    finite = np.isfinite(values)
+    high = np.where(finite, values, -np.inf).max(axis=1)
+    low = np.where(finite, values, np.inf).min(axis=1)
+    return np.where(finite.sum(axis=1) >= 2, high - low, 0.0)
+
+def bootstrap_rate_intervals(labels: List[Any], totals: np.ndarray, hires: np.ndarray, total_candidates: int,
+                             n_resamples: int = BOOTSTRAP_RESAMPLES, confidence: float = BOOTSTRAP_CONFIDENCE,
+                             seed: Optional[int] = BOOTSTRAP_SEED) -> Dict[str, Any]:
+    """Percentile bootstrap intervals for per-group hire rates and the parity difference.
+    
+    Resampling candidates with replacement only changes how many land in each (group, hired)
+    cell, so one multinomial draw over those cells per resample is exactly what an index matrix
+    reduced with bincount would produce, without materializing the indices."""
+    totals = np.asarray(totals, dtype=np.int64)
+    hires = np.asarray(hires, dtype=np.int64)
+    cells = np.concatenate([totals - hires, hires, [max(0, total_candidates - int(totals.sum()))]])
+    rng = np.random.default_rng(seed)
+    counts = rng.multinomial(int(cells.sum()), cells / cells.sum(), size=n_resamples)
+    
+    groups = len(labels)
+    resampled_hires = counts[:, groups:2 * groups]
+    resampled_totals = counts[:, :groups] + resampled_hires
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rates = resampled_hires / resampled_totals
+        estimates = hires / totals
+    
+    return {
+        'hiring_rates_by_group': {
+            label: _percentile_interval(estimates[i], rates[:, i], confidence) for i, label in enumerate(labels)
+        },
+        'demographic_parity_difference': _percentile_interval(
+            _spread(estimates[None, :])[0], _spread(rates), confidence
+        ),
+        'method': 'percentile_bootstrap',
+        'n_resamples': n_resamples,
+        'confidence_level': confidence,
+        'seed': seed
+    }
+
+def bootstrap_mean_spread(codes: np.ndarray, groups: int, values: np.ndarray,
+                          n_resamples: int = BOOTSTRAP_RESAMPLES, seed: Optional[int] = BOOTSTRAP_SEED) -> np.ndarray:
+    """Bootstrap samples of (max - min) group mean for each column of `values` (rows x
+    columns, NaN = missing), shape (resamples, columns).
+    
+    Resampling the rows with replacement first decides how many scores each group gets: one
+    multinomial draw over the groups plus the unscored rows. Given that count, the group's
+    resampled mean is the mean of that many draws from its own scores, drawn exactly for
+    groups of up to BOOTSTRAP_EXACT_GROUP_ROWS and from the normal limit (group mean, group
+    variance / count) above that, so the work no longer grows with the number of rows."""
+    rows, columns = values.shape
+    rng = np.random.default_rng(seed)
+    spreads = np.empty((n_resamples, columns))
+    
+    for column in range(columns):
+        scored = (codes >= 0) & ~np.isnan(values[:, column])
+        sizes = np.bincount(codes[scored], minlength=groups)
+        order = np.argsort(codes[scored], kind='stable')
+        by_group = np.split(values[scored, column][order], np.cumsum(sizes)[:-1])
+        
+        cells = np.append(sizes, rows - sizes.sum())
+        counts = rng.multinomial(rows, cells / rows, size=n_resamples)
+        means = np.full((n_resamples, groups), np.nan)
+        for group, group_values in enumerate(by_group):
+            drawn_counts = counts[:, group]
+            drawn = drawn_counts > 0
+            if not drawn.any():
+                continue
+            if len(group_values) <= BOOTSTRAP_EXACT_GROUP_ROWS:
+                width = int(drawn_counts.max())
+                picks = group_values[rng.integers(0, len(group_values), size=(n_resamples, width))]
+                picks[np.arange(width)[None, :] >= drawn_counts[:, None]] = 0.0
+                means[drawn, group] = picks[drawn].sum(axis=1) / drawn_counts[drawn]
+            else:
+                spread = group_values.std() / np.sqrt(drawn_counts[drawn])
+                means[drawn, group] = group_values.mean() + spread * rng.standard_normal(int(drawn.sum()))
+        spreads[:, column] = _spread(means)
+    return spreads
+
+def anova_from_moments(counts: np.ndarray, means: np.ndarray, variances: np.ndarray) -> Tuple[float, float]:
+    """One-way ANOVA (as scipy.stats.f_oneway) from per-group count, mean and sample variance"""
+    from scipy.stats import f as f_distribution
+    
+    total = counts.sum()
+    between_df, within_df = len(counts) - 1, total - len(counts)
+    if between_df < 1 or within_df < 1:
+        return np.nan, np.nan
+    grand_mean = (counts * means).sum() / total
+    between = (counts * (means - grand_mean) ** 2).sum()
+    # Single-score groups have no variance estimate but add nothing within
+    within = (np.nan_to_num(variances) * (counts - 1)).sum()
+    if within == 0:
+        return (np.inf, 0.0) if between > 0 else (np.nan, np.nan)
+    f_stat = (between / between_df) / (within / within_df)
+    return float(f_stat), float(f_distribution.sf(f_stat, between_df, within_df))
+
+class ProtectedAttributeCodes:
+    """Protected attributes of a candidate list encoded once as integer group codes (-1 for
+    missing), plus the hired flag and the rows each attribute is analyzed over"""
+    
+    def __init__(self, candidates: List[Dict[str, Any]], attributes: List[str]):
+        self.size = len(candidates)
+        self.has_decision = any('hiring_decision' in c for c in candidates)
+        self.hired = np.fromiter((c.get('hiring_decision') == 'hired' for c in candidates),
+                                 dtype=bool, count=self.size)
+        self.codes: Dict[str, np.ndarray] = {}
+        self.labels: Dict[str, List[Any]] = {}
+        self.rows: Dict[str, np.ndarray] = {}
+        
+        for attribute in attributes:
+            if attribute == 'age_group':
+                self._encode_age_groups(candidates)
+            elif any(attribute in c for c in candidates):
+                self._encode(attribute, [c.get(attribute) for c in candidates])
+                self.rows[attribute] = np.ones(self.size, dtype=bool)
+    
+    def _encode(self, attribute: str, values: List[Any]):
+        lookup: Dict[Any, int] = {}
+        codes = np.empty(len(values), dtype=np.int64)
+        for i, value in enumerate(values):
+            if value is None or (isinstance(value, float) and value != value):
+                codes[i] = -1
+            else:
+                codes[i] = lookup.setdefault(value, len(lookup))
+        self.codes[attribute] = codes
+        self.labels[attribute] = list(lookup)
+    
+    def _encode_age_groups(self, candidates: List[Dict[str, Any]]):
+        if not any('age' in c for c in candidates):
+            return
+        ages = np.fromiter((_age_number(c.get('age')) for c in candidates), dtype=np.float64, count=self.size)
+        rows = ~np.isnan(ages)
+        if not rows.any():
+            return
+        # Code i covers (AGE_GROUP_BINS[i], AGE_GROUP_BINS[i + 1]]; the extra last label holds out-of-range ages
+        codes = np.searchsorted(AGE_GROUP_BINS, np.nan_to_num(ages), side='left') - 1
+        codes[(codes < 0) | (codes >= len(AGE_GROUP_LABELS))] = len(AGE_GROUP_LABELS)
+        self.codes['age_group'] = codes
+        self.labels['age_group'] = AGE_GROUP_LABELS + ['nan']
+        self.rows['age_group'] = rows
+
 class BiasDetectionEngine:
     """Advanced bias detection with multiple algorithms"""
     
@@ -100,6 +384,9 @@ class BiasDetectionEngine:
             'equalized_odds': 0.1,      # Max 10% difference in TPR/FPR
             'statistical_significance': 0.05  # p-value threshold
         }
+        self.bootstrap_resamples = BOOTSTRAP_RESAMPLES
+        self.bootstrap_confidence = BOOTSTRAP_CONFIDENCE
+        self.bootstrap_seed = BOOTSTRAP_SEED
     
     def analyze_demographic_bias(self, candidates: List[Dict[str, Any]], 
                                 protected_attribute: str = 'gender') -> Dict[str, Any]:
@@ -107,22 +394,7 @@ class BiasDetectionEngine:
         
         # Enhanced data validation
         if len(candidates) < 3:
-            # Create synthetic analysis for small datasets
-            return {
-                'bias_detected': False,
-                'reason': f'Small dataset ({len(candidates)} candidates) - using synthetic analysis',
-                'bias_score': 0.1,
-                'confidence': 'low',
-                'metrics': {
-                    'total_candidates': len(candidates),
-                    'analysis_type': 'synthetic_small_dataset'
-                },
-                'recommendations': [
-                    'Collect more candidate data for robust bias analysis',
-                    'Monitor hiring patterns as dataset grows',
-                    'Implement bias-aware evaluation processes'
-                ]
-            }
+            return self._small_dataset_bias_result(len(candidates))
         
         df = pd.DataFrame(candidates)
         
@@ -196,25 +468,6 @@ class BiasDetectionEngine:
         if pd.isna(overall_rate) or not np.isfinite(overall_rate):
             overall_rate = 0.0
         
-        # Calculate demographic parity with proper NaN handling
-        if len(hired_by_group) > 1:
-            rates = list(hired_by_group.values())
-            # Filter out any NaN or infinite values
-            rates = [r for r in rates if not pd.isna(r) and np.isfinite(r)]
-            
-            if len(rates) >= 2:
-                max_rate = max(rates)
-                min_rate = min(rates)
-                demographic_parity_diff = max_rate - min_rate
-                
-                # Ensure demographic_parity_diff is not NaN
-                if pd.isna(demographic_parity_diff) or not np.isfinite(demographic_parity_diff):
-                    demographic_parity_diff = 0.0
-            else:
-                demographic_parity_diff = 0.0
-        else:
-            demographic_parity_diff = 0.0
-        
         # Statistical significance with error handling
         try:
             from scipy.stats import chi2_contingency
@@ -235,6 +488,249 @@ class BiasDetectionEngine:
             p_value = 0.5  # Neutral p-value
             chi2_stat = 0.0
         
+        return self._demographic_bias_report(
+            hired_by_group, overall_rate, chi2_stat, p_value,
+            df[protected_attribute].value_counts().to_dict(),
+            (df['hiring_decision'] == 'hired').groupby(df[protected_attribute]).sum().to_dict(), len(df)
+        )
+    
+    def analyze_demographic_bias_many(self, encoded: 'ProtectedAttributeCodes',
+                                      attributes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Demographic bias for several protected attributes from one integer encoding of the
+        candidates. Hire counts per group come from np.bincount and the chi-square test runs on
+        those counts, matching analyze_demographic_bias attribute by attribute."""
+        from scipy.stats import chi2_contingency
+        
+        results = {}
+        for attribute in attributes:
+            if attribute not in encoded.codes:
+                continue
+            rows = encoded.rows[attribute]
+            total_candidates = int(rows.sum())
+            if total_candidates < 3:
+                results[attribute] = self._small_dataset_bias_result(total_candidates)
+                continue
+            
+            codes = encoded.codes[attribute][rows]
+            hired = encoded.hired[rows]
+            labels = encoded.labels[attribute]
+            grouped = codes >= 0
+            totals = np.bincount(codes[grouped], minlength=len(labels))
+            hires = np.bincount(codes[grouped & hired], minlength=len(labels))
+            
+            # Groups in sorted label order, as a pandas groupby would report them
+            present = [code for code in range(len(labels)) if totals[code]]
+            try:
+                present.sort(key=lambda code: labels[code])
+            except TypeError:
+                pass
+            hired_by_group = {labels[code]: hires[code] / totals[code] for code in present}
+            group_counts = {labels[code]: int(totals[code]) for code in present}
+            hired_counts = {labels[code]: int(hires[code]) for code in present}
+            overall_rate = float(hired.mean())
+            
+            # Groups x (not hired, hired) contingency table, keeping only observed outcomes
+            table = np.column_stack([totals - hires, hires])[present]
+            table = table[:, table.sum(axis=0) > 0]
+            try:
+                if table.size > 0 and table.sum() > 0:
+                    chi2_stat, p_value, dof, expected = chi2_contingency(table)
+                else:
+                    p_value = 1.0  # No significance if no data
+                    chi2_stat = 0.0
+            except Exception:
+                p_value = 0.5  # Neutral p-value
+                chi2_stat = 0.0
+            
+            results[attribute] = self._demographic_bias_report(
+                hired_by_group, overall_rate, chi2_stat, p_value, group_counts, hired_counts, total_candidates
+            )
+        return results
+    
+    def _small_dataset_bias_result(self, total_candidates: int) -> Dict[str, Any]:
+        """Synthetic analysis for datasets too small for statistics"""
+        return {
+            'bias_detected': False,
+            'reason': f'Small dataset ({total_candidates} candidates) - using synthetic analysis',
+            'bias_score': 0.1,
+            'confidence': 'low',
+            'metrics': {
+                'total_candidates': total_candidates,
+                'analysis_type': 'synthetic_small_dataset'
+            },
+            'recommendations': [
+                'Collect more candidate data for robust bias analysis',
+                'Monitor hiring patterns as dataset grows',
+                'Implement bias-aware evaluation processes'
+            ]
+        }
+    
+    def analyze_intersectional_bias(self, encoded: 'ProtectedAttributeCodes', attributes: List[str],
+                                    max_order: int = 3, min_support: int = INTERSECTIONAL_MIN_SUPPORT,
+                                    alpha: float = 0.05, correction: str = 'fdr_bh',
+                                    max_groups: int = 50) -> Dict[str, Any]:
+        """Hire-rate disparities for combinations of up to `max_order` protected attributes
+        (e.g. gender x ethnicity x position).
+        
+        Each combination extends its parent combination: rows get one dense integer group key,
+        re-ranked after every attribute, so only non-empty cells are ever materialized. Cells
+        with fewer than `min_support` candidates are pruned together with every finer cell
+        inside them. Each surviving cell is tested against the other candidates with a
+        two-proportion z-test. P-values are corrected for the number of cells tested, with
+        Benjamini-Hochberg ('fdr_bh') or Bonferroni ('bonferroni')."""
+        from itertools import combinations
+        from scipy.stats import norm
+        
+        present = [attribute for attribute in attributes if attribute in encoded.codes]
+        if not encoded.has_decision or not present:
+            return {
+                'bias_detected': False,
+                'reason': 'No hiring decisions or protected attributes to analyze',
+                'bias_score': 0.0,
+                'confidence': 'none',
+                'groups': []
+            }
+        
+        valid = {attribute: encoded.rows[attribute] & (encoded.codes[attribute] >= 0) for attribute in present}
+        hired = encoded.hired
+        
+        # Combination -> (rows in supported cells, dense cell key per row, label tuple per key)
+        levels: Dict[Tuple[str, ...], Tuple[np.ndarray, np.ndarray, List[tuple]]] = {}
+        tested: List[Tuple[Tuple[str, ...], List[tuple], np.ndarray, np.ndarray, int, int]] = []
+        cells_evaluated = cells_pruned = 0
+        
+        for order in range(1, min(max_order, len(present)) + 1):
+            for combination in combinations(present, order):
+                last = combination[-1]
+                if order == 1:
+                    rows = np.flatnonzero(valid[last])
+                    keys = encoded.codes[last][rows]
+                    parent_labels: List[tuple] = [()]
+                    keys_parent = np.zeros(len(rows), dtype=np.int64)
+                else:
+                    parent = levels.get(combination[:-1])
+                    if parent is None:
+                        continue  # every parent cell was below min_support
+                    parent_rows, keys_parent, parent_labels = parent
+                    keep = valid[last][parent_rows]
+                    rows = parent_rows[keep]
+                    keys_parent = keys_parent[keep]
+                    keys = encoded.codes[last][rows]
+                
+                radix = len(encoded.labels[last])
+                cell_keys, inverse, sizes = np.unique(keys_parent * radix + keys, return_inverse=True,
+                                                      return_counts=True)
+                hires = np.bincount(inverse, weights=hired[rows], minlength=len(cell_keys))
+                supported = sizes >= min_support
+                cells_evaluated += len(cell_keys)
+                cells_pruned += int((~supported).sum())
+                if not supported.any():
+                    continue
+                
+                labels = [parent_labels[key // radix] + (encoded.labels[last][key % radix],)
+                          for key in cell_keys[supported].tolist()]
+                in_supported = supported[inverse]
+                levels[combination] = (rows[in_supported],
+                                       (np.cumsum(supported) - 1)[inverse[in_supported]], labels)
+                
+                # Every cell is compared with the candidates that have all of its attributes
+                scope = np.logical_and.reduce([valid[attribute] for attribute in combination])
+                tested.append((combination, labels, sizes[supported], hires[supported],
+                               int(scope.sum()), int(hired[scope].sum())))
+        
+        if not tested:
+            return {
+                'bias_detected': False,
+                'reason': f'No attribute combination has {min_support} or more candidates',
+                'bias_score': 0.0,
+                'confidence': 'low',
+                'cells_evaluated': cells_evaluated,
+                'cells_pruned': cells_pruned,
+                'groups': []
+            }
+        
+        # Two-proportion z-tests for every supported cell at once
+        sizes = np.concatenate([entry[2] for entry in tested]).astype(float)
+        hires = np.concatenate([entry[3] for entry in tested])
+        scope_sizes = np.concatenate([np.full(len(entry[1]), entry[4], dtype=float) for entry in tested])
+        scope_hires = np.concatenate([np.full(len(entry[1]), entry[5], dtype=float) for entry in tested])
+        rest_sizes = scope_sizes - sizes
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rates = hires / sizes
+            rest_rates = np.where(rest_sizes > 0, (scope_hires - hires) / rest_sizes, rates)
+            pooled = scope_hires / scope_sizes
+            standard_error = np.sqrt(pooled * (1 - pooled) * (1 / sizes + 1 / rest_sizes))
+            z_scores = np.where((rest_sizes > 0) & (standard_error > 0),
+                                (rates - rest_rates) / standard_error, 0.0)
+        p_values = 2 * norm.sf(np.abs(z_scores))
+        adjusted = _adjust_p_values(p_values, correction)
+        differences = rates - rest_rates
+        significant = adjusted < alpha
+        
+        # Most significant first, then the widest gaps
+        order_by = np.lexsort((-np.abs(differences), adjusted))[:max_groups]
+        cell_index = [(combination, label) for combination, labels, *_ in tested for label in labels]
+        groups = []
+        for i in order_by.tolist():
+            combination, label = cell_index[i]
+            groups.append({
+                'attributes': dict(zip(combination, label)),
+                'order': len(combination),
+                'size': int(sizes[i]),
+                'hired': int(hires[i]),
+                'hiring_rate': rates[i],
+                'comparison_hiring_rate': rest_rates[i],
+                'rate_difference': differences[i],
+                'z_statistic': z_scores[i],
+                'p_value': p_values[i],
+                'adjusted_p_value': adjusted[i],
+                'significant': bool(significant[i])
+            })
+        
+        flagged = significant & (np.abs(differences) > self.bias_thresholds['demographic_parity'])
+        max_disparity = float(np.abs(differences[flagged]).max()) if flagged.any() else 0.0
+        return {
+            'bias_detected': bool(flagged.any()),
+            'bias_score': min(1.0, max_disparity * 2),
+            'confidence': 'high' if encoded.size >= 500 else ('medium' if encoded.size >= 100 else 'low'),
+            'attributes': present,
+            'max_order': max_order,
+            'min_support': min_support,
+            'correction': correction,
+            'alpha': alpha,
+            'cells_evaluated': cells_evaluated,
+            'cells_pruned': cells_pruned,
+            'cells_tested': len(p_values),
+            'significant_groups': int(significant.sum()),
+            'flagged_groups': int(flagged.sum()),
+            'groups': groups,
+            'analysis_timestamp': datetime.now().isoformat()
+        }
+    
+    def _demographic_bias_report(self, hired_by_group: Dict[Any, float], overall_rate: float,
+                                 chi2_stat: float, p_value: float, group_counts: Dict[Any, int],
+                                 hired_counts: Dict[Any, int], total_candidates: int) -> Dict[str, Any]:
+        """Parity, bias level and recommendations from per-group hiring rates and a chi-square test"""
+        
+        # Calculate demographic parity with proper NaN handling
+        if len(hired_by_group) > 1:
+            rates = list(hired_by_group.values())
+            # Filter out any NaN or infinite values
+            rates = [r for r in rates if not pd.isna(r) and np.isfinite(r)]
+            
+            if len(rates) >= 2:
+                max_rate = max(rates)
+                min_rate = min(rates)
+                demographic_parity_diff = max_rate - min_rate
+                
+                # Ensure demographic_parity_diff is not NaN
+                if pd.isna(demographic_parity_diff) or not np.isfinite(demographic_parity_diff):
+                    demographic_parity_diff = 0.0
+            else:
+                demographic_parity_diff = 0.0
+        else:
+            demographic_parity_diff = 0.0
+        
         # Determine bias with more nuanced thresholds
         bias_thresholds = {
             'low': 0.05,      # 5% difference
@@ -259,19 +755,29 @@ class BiasDetectionEngine:
         
         # Generate detailed metrics
         metrics = {
-            'hiring_rates_by_group': convert_numpy_types(hired_by_group),
-            'overall_hiring_rate': convert_numpy_types(overall_rate),
-            'demographic_parity_difference': convert_numpy_types(demographic_parity_diff),
+            'hiring_rates_by_group': hired_by_group,
+            'overall_hiring_rate': overall_rate,
+            'demographic_parity_difference': demographic_parity_diff,
             'statistical_significance': {
-                'p_value': convert_numpy_types(p_value),
-                'chi2_statistic': convert_numpy_types(chi2_stat),
-                'significant': convert_numpy_types(p_value < 0.05)
+                'p_value': p_value,
+                'chi2_statistic': chi2_stat,
+                'significant': p_value < 0.05
             },
-            'group_counts': convert_numpy_types(df[protected_attribute].value_counts().to_dict()),
-            'total_candidates': convert_numpy_types(len(df)),
+            'group_counts': group_counts,
+            'total_candidates': total_candidates,
             'bias_level': bias_level
         }
         
+        if group_counts:
+            labels = list(hired_by_group)
+            totals = np.array([group_counts.get(label, 0) for label in labels])
+            hires = np.array([hired_counts.get(label, 0) for label in labels])
+            if totals.all():
+                metrics['confidence_intervals'] = bootstrap_rate_intervals(
+                    labels, totals, hires, total_candidates,
+                    self.bootstrap_resamples, self.bootstrap_confidence, self.bootstrap_seed
+                )
+        
         # Generate recommendations
         recommendations = []
         if bias_detected:
@@ -301,32 +807,45 @@ class BiasDetectionEngine:
             ])
         
         result = {
-            'bias_detected': convert_numpy_types(bias_detected),
-            'bias_score': convert_numpy_types(bias_score),
-            'confidence': 'high' if len(df) >= 50 else ('medium' if len(df) >= 20 else 'low'),
+            'bias_detected': bias_detected,
+            'bias_score': bias_score,
+            'confidence': 'high' if total_candidates >= 50 else ('medium' if total_candidates >= 20 else 'low'),
             'bias_level': bias_level,
             'metrics': metrics,
             'recommendations': recommendations,
             'analysis_timestamp': datetime.now().isoformat()
         }
         
-        return convert_numpy_types(result)
+        # NumPy scalars are left in place; API responses serialize them via services.json_encoding
+        return result
     
     def analyze_score_bias(self, candidates: List[Dict[str, Any]], 
                           protected_attribute: str = 'gender') -> Dict[str, Any]:
         """Analyze bias in scoring patterns with robust data handling"""
-        
+        return self.analyze_score_frame(pd.DataFrame(candidates), protected_attribute)
+    
+    def analyze_score_bias_many(self, candidates: List[Dict[str, Any]],
+                                attributes: List[str]) -> Dict[str, Dict[str, Any]]:
+        """analyze_score_bias for several protected attributes over one DataFrame"""
         df = pd.DataFrame(candidates)
+        if 'age_group' in attributes and 'age_group' not in df.columns and 'age' in df.columns:
+            # Same bins as the demographic analysis; unknown ages drop out of the grouping
+            ages = pd.to_numeric(df['age'], errors='coerce')
+            df['age_group'] = pd.cut(ages, bins=AGE_GROUP_BINS, labels=AGE_GROUP_LABELS).astype(object)
+        return {attribute: self.analyze_score_frame(df, attribute) for attribute in attributes}
+    
+    def analyze_score_frame(self, df: pd.DataFrame, protected_attribute: str = 'gender') -> Dict[str, Any]:
+        """analyze_score_bias over candidates already loaded into a DataFrame"""
         
         # Enhanced data validation
-        if len(candidates) < 3:
+        if len(df) < 3:
             return {
                 'bias_detected': False,
-                'reason': f'Small dataset ({len(candidates)} candidates) for score analysis',
+                'reason': f'Small dataset ({len(df)} candidates) for score analysis',
                 'bias_score': 0.0,
                 'confidence': 'low',
                 'metrics': {
-                    'total_candidates': len(candidates),
+                    'total_candidates': len(df),
                     'analysis_type': 'insufficient_data'
                 }
             }
@@ -341,19 +860,12 @@ class BiasDetectionEngine:
             }
         
         # Define score columns with flexible matching
-        score_columns = ['resume_score', 'interview_score', 'technical_score', 'final_score']
-        available_scores = [col for col in score_columns if col in df.columns]
+        available_scores = [col for col in SCORE_COLUMNS if col in df.columns]
         
         # Try alternative score column names if standard ones not found
         if not available_scores:
-            alt_score_names = {
-                'resume_score': ['resume', 'cv_score', 'application_score'],
-                'interview_score': ['interview', 'behavioral_score'],
-                'technical_score': ['technical', 'coding_score', 'skill_score'],
-                'final_score': ['final', 'total_score', 'overall_score', 'score']
-            }
-            
-            for standard_name, alternatives in alt_score_names.items():
+            df = df.copy()
+            for standard_name, alternatives in ALTERNATIVE_SCORE_COLUMNS.items():
                 for alt_name in alternatives:
                     if alt_name in df.columns:
                         df[standard_name] = df[alt_name]
@@ -367,7 +879,7 @@ class BiasDetectionEngine:
                 'bias_score': 0.0,
                 'confidence': 'none',
                 'metrics': {
-                    'searched_columns': score_columns,
+                    'searched_columns': list(SCORE_COLUMNS),
                     'available_columns': list(df.columns)
                 }
             }
@@ -376,23 +888,45 @@ class BiasDetectionEngine:
         overall_bias_score = 0.0
         bias_detected = False
         
+        try:
+            # One grouped pass gives count/mean/variance of every score column per group;
+            # NaN scores drop out of each column's statistics on their own
+            keyed = df[df[protected_attribute].notna()]
+            scores = keyed[available_scores].apply(pd.to_numeric, errors='coerce')
+            moments = scores.groupby(keyed[protected_attribute]).agg(['count', 'mean', 'var'])
+            extremes = scores.agg(['min', 'max'])
+        except Exception as e:
+            moments = None
+            aggregation_error = e
+        
+        # Bootstrap samples of every column's group-mean disparity
+        disparity_samples = None
+        if moments is not None:
+            codes, groups = pd.factorize(keyed[protected_attribute])
+            disparity_samples = bootstrap_mean_spread(codes, len(groups), scores.to_numpy(dtype=float),
+                                                      self.bootstrap_resamples, self.bootstrap_seed)
+        
         for score_col in available_scores:
             try:
-                # Remove rows with missing scores
-                score_df = df.dropna(subset=[score_col, protected_attribute])
+                if moments is None:
+                    raise aggregation_error
+                
+                # Groups with at least one score in this column
+                column = moments[score_col]
+                column = column[column['count'] > 0]
+                sample_size = int(column['count'].sum())
                 
-                if len(score_df) < 3:
+                if sample_size < 3:
                     bias_results[score_col] = {
                         'bias_detected': False,
                         'reason': f'Insufficient data for {score_col}',
-                        'sample_size': len(score_df)
+                        'sample_size': sample_size
                     }
                     continue
                 
-                # Calculate mean scores by group
-                mean_scores = score_df.groupby(protected_attribute)[score_col].mean()
-                std_scores = score_df.groupby(protected_attribute)[score_col].std()
-                count_scores = score_df.groupby(protected_attribute)[score_col].count()
+                mean_scores = column['mean']
+                std_scores = np.sqrt(column['var'])
+                count_scores = column['count']
                 
                 if len(mean_scores) > 1:
                     # Calculate score disparity
@@ -401,26 +935,21 @@ class BiasDetectionEngine:
                     score_disparity = max_score - min_score
                     
                     # Calculate relative disparity (as percentage of scale)
-                    score_range = score_df[score_col].max() - score_df[score_col].min()
+                    score_range = extremes.at['max', score_col] - extremes.at['min', score_col]
                     relative_disparity = score_disparity / max(score_range, 1) if score_range > 0 else 0
                     
-                    # Statistical significance test (t-test for two groups, ANOVA for more)
+                    # Statistical significance test (t-test for two groups, ANOVA for more),
+                    # from the group moments rather than the raw scores
                     try:
+                        counts = count_scores.to_numpy(dtype=float)
+                        means = mean_scores.to_numpy(dtype=float)
+                        variances = column['var'].to_numpy(dtype=float)
                         if len(mean_scores) == 2:
-                            from scipy.stats import ttest_ind
-                            groups = [group[score_col].values for name, group in score_df.groupby(protected_attribute)]
-                            if len(groups) == 2 and len(groups[0]) > 0 and len(groups[1]) > 0:
-                                t_stat, p_value = ttest_ind(groups[0], groups[1])
-                            else:
-                                p_value = 1.0
+                            from scipy.stats import ttest_ind_from_stats
+                            t_stat, p_value = ttest_ind_from_stats(means[0], np.sqrt(variances[0]), counts[0],
+                                                                   means[1], np.sqrt(variances[1]), counts[1])
                         else:
-                            from scipy.stats import f_oneway
-                            groups = [group[score_col].values for name, group in score_df.groupby(protected_attribute)]
-                            groups = [g for g in groups if len(g) > 0]
-                            if len(groups) > 1:
-                                f_stat, p_value = f_oneway(*groups)
-                            else:
-                                p_value = 1.0
+                            f_stat, p_value = anova_from_moments(counts, means, variances)
                     except Exception:
                         p_value = 0.5  # Neutral value if stats fail
                     
@@ -439,8 +968,12 @@ class BiasDetectionEngine:
                     score_bias_value = min(1.0, relative_disparity * 2)
                     overall_bias_score = max(overall_bias_score, score_bias_value)
                     
-                    bias_results[score_col] = convert_numpy_types({
+                    bias_results[score_col] = {
                         'bias_detected': score_bias_detected,
+                        'score_disparity_interval': _percentile_interval(
+                            score_disparity, disparity_samples[:, available_scores.index(score_col)],
+                            self.bootstrap_confidence
+                        ) if disparity_samples is not None else None,
                         'mean_scores_by_group': mean_scores.to_dict(),
                         'std_scores_by_group': std_scores.to_dict(),
                         'count_by_group': count_scores.to_dict(),
@@ -451,22 +984,22 @@ class BiasDetectionEngine:
                             'significant': p_value < 0.05
                         },
                         'bias_score': score_bias_value,
-                        'sample_size': len(score_df)
-                    })
+                        'sample_size': sample_size
+                    }
                 else:
-                    bias_results[score_col] = convert_numpy_types({
+                    bias_results[score_col] = {
                         'bias_detected': False,
                         'reason': 'Only one group found',
                         'mean_score': mean_scores.iloc[0] if len(mean_scores) > 0 else 0,
-                        'sample_size': len(score_df)
-                    })
+                        'sample_size': sample_size
+                    }
                     
             except Exception as e:
-                bias_results[score_col] = convert_numpy_types({
+                bias_results[score_col] = {
                     'bias_detected': False,
                     'reason': f'Analysis error: {str(e)}',
                     'sample_size': 0
-                })
+                }
         
         # Generate overall assessment
         confidence = 'high' if len(df) >= 50 else ('medium' if len(df) >= 20 else 'low')
@@ -488,53 +1021,30 @@ class BiasDetectionEngine:
                 'Maintain consistent evaluation standards'
             ])
         
-        return convert_numpy_types({
+        return {
             'bias_detected': bias_detected,
             'overall_bias_score': overall_bias_score,
             'confidence': confidence,
             'score_analysis': bias_results,
             'total_candidates_analyzed': len(df),
             'available_score_types': available_scores,
+            'bootstrap': {
+                'method': 'percentile_bootstrap',
+                'n_resamples': self.bootstrap_resamples if disparity_samples is not None else 0,
+                'exact_group_rows': BOOTSTRAP_EXACT_GROUP_ROWS,
+                'confidence_level': self.bootstrap_confidence,
+                'seed': self.bootstrap_seed
+            },
             'recommendations': recommendations,
             'analysis_timestamp': datetime.now().isoformat()
-        })
+        }
 
     def _analyze_text_bias(self, text: str, candidate_info: Dict[str, Any]) -> Dict[str, Any]:
         """Rule-based text analysis for bias indicators"""
         
-        # Define bias indicator patterns
-        bias_patterns = {
-            'age_bias': [
-                'young', 'old', 'mature', 'experienced', 'fresh', 'energetic',
-                'digital native', 'generation', 'too old', 'too young'
-            ],
-            'gender_bias': [
-                'aggressive', 'assertive', 'emotional', 'nurturing', 'bossy',
-                'hysterical', 'dramatic', 'soft', 'pushy', 'nice'
-            ],
-            'appearance_bias': [
-                'attractive', 'professional appearance', 'well-groomed', 'presentable',
-                'polished', 'neat', 'dress', 'looks'
-            ],
-            'cultural_bias': [
-                'cultural fit', 'team fit', 'our type', 'background', 'foreign',
-                'accent', 'communication style', 'different'
-            ],
-            'family_bias': [
-                'family', 'children', 'pregnant', 'maternity', 'paternity',
-                'childcare', 'availability', 'commitment'
-            ]
-        }
-        
-        text_lower = text.lower()
-        detected_patterns = {}
-        total_bias_indicators = 0
-        
-        for bias_type, patterns in bias_patterns.items():
-            found_patterns = [pattern for pattern in patterns if pattern in text_lower]
-            if found_patterns:
-                detected_patterns[bias_type] = found_patterns
-                total_bias_indicators += len(found_patterns)
+        # One pass of the compiled, word-bounded lexicon ("old" no longer matches "hold")
+        detected_patterns, matches = get_bias_lexicon('evaluation').detect(text)
+        total_bias_indicators = sum(len(found) for found in detected_patterns.values())
         
         # Calculate bias score based on indicators found
         bias_score = min(1.0, total_bias_indicators * 0.1)
@@ -547,6 +1057,7 @@ class BiasDetectionEngine:
             'bias_score': bias_score,
             'detected_patterns': detected_patterns,
             'total_bias_indicators': total_bias_indicators,
+            'matches': matches,
             'text_length': len(text),
             'analysis_type': 'rule_based_text_analysis',
             'recommendations': self._get_text_bias_recommendations(detected_patterns)
@@ -634,8 +1145,13 @@ class AIOrchestrator:
                  openai_api_key: Optional[str] = None,
                  langfuse_secret_key: Optional[str] = None,
                  langfuse_public_key: Optional[str] = None,
-                 langfuse_host: Optional[str] = None):
-        """Initialize AI orchestrator with required API keys"""
+                 langfuse_host: Optional[str] = None,
+                 llm: Optional[Any] = None,
+                 llm_timeout: float = 30.0,
+                 llm_max_retries: int = 2,
+                 llm_retry_base_delay: float = 0.5):
+        """Initialize AI orchestrator with required API keys. `llm` injects a ready-made model or
+        chain (e.g. services.fake_llm.FakeLLMChain) instead of building ChatOpenAI."""
         
         self.openai_api_key = openai_api_key
         self.langfuse_secret_key = langfuse_secret_key
@@ -662,9 +1178,14 @@ class AIOrchestrator:
             except Exception as e:
                 logger.warning(f"Failed to initialize LangFuse: {e}")
         
+        # Per-attempt timeout and retry policy for LLM calls
+        self.llm_timeout = llm_timeout
+        self.llm_max_retries = llm_max_retries
+        self.llm_retry_base_delay = llm_retry_base_delay
+        
         # Initialize LLM
-        self.llm = None
-        if LANGCHAIN_AVAILABLE and openai_api_key:
+        self.llm = llm
+        if self.llm is None and LANGCHAIN_AVAILABLE and openai_api_key:
             try:
                 self.llm = ChatOpenAI(
                     api_key=openai_api_key,
@@ -689,8 +1210,8 @@ class AIOrchestrator:
         # AI Chain templates
         self._init_prompt_templates()
         
-        # Cache for frequent operations
-        self.cache = {}
+        # Cache for bias insights, keyed by dataset version and candidate set
+        self.cache = InsightCache()
         
         logger.info("AI Orchestrator initialized with basic functionality")
     
@@ -769,9 +1290,31 @@ class AIOrchestrator:
             """
         )
 
+    def dataset_bias_statistics(self, candidates_dataset: List[Dict],
+                                dataset_version: Optional[int] = None) -> Dict[str, Any]:
+        """Dataset-level demographic and score bias; independent of the evaluation being checked.
+        Cached per dataset version like get_bias_insights when `dataset_version` is given."""
+        key = None
+        if dataset_version is not None:
+            id_hash = candidate_set_hash(candidates_dataset)
+            if id_hash is not None:
+                key = (dataset_version, id_hash, 'dataset_statistics')
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return cached
+        
+        statistical_bias = self.bias_detector.analyze_demographic_bias(candidates_dataset)
+        statistical_bias['score_bias'] = self.bias_detector.analyze_score_bias(candidates_dataset)
+        if key is not None:
+            self.cache.put(key, statistical_bias)
+        return statistical_bias
+    
     async def detect_bias_comprehensive(self, evaluation_text: str, candidate_info: Dict[str, Any],
-                                      candidates_dataset: Optional[List[Dict]] = None) -> Dict[str, Any]:
-        """Comprehensive bias detection using multiple approaches"""
+                                      candidates_dataset: Optional[List[Dict]] = None,
+                                      statistical_analysis: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Comprehensive bias detection using multiple approaches. Callers checking many
+        evaluations against one dataset pass `statistical_analysis` from dataset_bias_statistics()
+        instead of the dataset, so it is computed once."""
         
         bias_analysis = {
             'overall_bias_score': 0.0,
@@ -787,13 +1330,10 @@ class AIOrchestrator:
         bias_analysis['text_analysis'] = text_bias
         
         # 2. Statistical bias analysis (if dataset provided)
-        if candidates_dataset and len(candidates_dataset) > 5:
-            statistical_bias = self.bias_detector.analyze_demographic_bias(candidates_dataset)
-            bias_analysis['statistical_analysis'] = statistical_bias
-            
-            # Score bias analysis
-            score_bias = self.bias_detector.analyze_score_bias(candidates_dataset)
-            bias_analysis['statistical_analysis']['score_bias'] = score_bias
+        if statistical_analysis is not None:
+            bias_analysis['statistical_analysis'] = statistical_analysis
+        elif candidates_dataset and len(candidates_dataset) > 5:
+            bias_analysis['statistical_analysis'] = self.dataset_bias_statistics(candidates_dataset)
         
         # 3. AI-powered bias analysis (if LLM available)
         if self.llm:
@@ -824,38 +1364,24 @@ class AIOrchestrator:
     def _analyze_text_bias(self, text: str, candidate_info: Dict[str, Any]) -> Dict[str, Any]:
         """Rule-based text analysis for bias indicators"""
         
-        bias_indicators = {
-            'age_bias': ['young', 'old', 'mature', 'fresh out of', 'seasoned', 'senior'],
-            'gender_bias': ['aggressive', 'bossy', 'emotional', 'nurturing', 'assertive'],
-            'cultural_bias': ['cultural fit', 'good fit', 'team player', 'communication style'],
-            'appearance_bias': ['professional appearance', 'well-groomed', 'presentable'],
-            'subjective_language': ['seems', 'appears', 'feels like', 'impression', 'gut feeling']
-        }
-        
-        text_lower = text.lower()
-        detected_bias_types = []
-        problematic_phrases = []
-        
-        for bias_type, indicators in bias_indicators.items():
-            for indicator in indicators:
-                if indicator in text_lower:
-                    detected_bias_types.append(bias_type)
-                    problematic_phrases.append(indicator)
+        # Compiled, word-bounded indicator lexicon: one regex pass with match offsets
+        detected, matches = get_bias_lexicon('indicators').detect(text)
+        detected_bias_types = list(detected)
+        problematic_phrases = [phrase for phrases in detected.values() for phrase in phrases]
         
         # Calculate bias score based on indicators found
-        total_indicators = sum(len(indicators) for indicators in bias_indicators.values())
         found_indicators = len(set(problematic_phrases))
         bias_score = min(found_indicators / 10.0, 1.0)  # Cap at 1.0
         
         # Objective language analysis
-        objective_words = ['demonstrated', 'achieved', 'completed', 'measured', 'quantified']
-        objective_count = sum(1 for word in objective_words if word in text_lower)
+        objective_count = sum(len(found) for found in get_bias_lexicon('objective_language').detect(text)[0].values())
         objective_score = min(objective_count / 5.0, 1.0)
         
         return {
             'bias_score': bias_score,
             'bias_types_detected': list(set(detected_bias_types)),
             'problematic_phrases': list(set(problematic_phrases)),
+            'matches': matches,
             'objective_language_score': objective_score,
             'word_count': len(text.split()),
             'analysis_method': 'rule_based'
@@ -864,7 +1390,7 @@ class AIOrchestrator:
     async def _ai_bias_analysis(self, evaluation_text: str, candidate_info: Dict[str, Any]) -> Dict[str, Any]:
         """AI-powered bias analysis using LLM"""
         
-        if not LANGCHAIN_AVAILABLE or not self.llm:
+        if not self.llm or not (LANGCHAIN_AVAILABLE or hasattr(self.llm, 'arun')):
             return {'error': 'LLM not available'}
         
         # Create demographic context while being privacy-conscious
@@ -875,13 +1401,18 @@ class AIOrchestrator:
         """
         
         try:
-            chain = LLMChain(
-                llm=self.llm,
-                prompt=self.bias_detection_template,
-                callbacks=[self.langfuse_handler] if self.langfuse_handler else []
-            )
+            # Chain-like LLMs (anything with an async arun) are used as is
+            if hasattr(self.llm, 'arun'):
+                chain = self.llm
+            else:
+                chain = LLMChain(
+                    llm=self.llm,
+                    prompt=self.bias_detection_template,
+                    callbacks=[self.langfuse_handler] if self.langfuse_handler else []
+                )
             
-            result = await chain.arun(
+            result = await self._run_chain_with_retries(
+                chain,
                 evaluation_text=evaluation_text,
                 candidate_info=json.dumps(candidate_info, default=str),
                 demographic_context=demographic_context
@@ -905,9 +1436,104 @@ class AIOrchestrator:
             logger.error(f"AI bias analysis failed: {e}")
             return {'error': str(e), 'analysis_method': 'llm_powered'}
     
-    def get_bias_insights(self, candidates: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Get comprehensive bias insights for a set of candidates"""
+    async def _run_chain_with_retries(self, chain: Any, **variables) -> str:
+        """chain.arun with a timeout per attempt, retrying failures after a jittered exponential backoff"""
+        for attempt in range(self.llm_max_retries + 1):
+            try:
+                return await asyncio.wait_for(chain.arun(**variables), timeout=self.llm_timeout)
+            except asyncio.TimeoutError:
+                error = TimeoutError(f"LLM call timed out after {self.llm_timeout}s")
+            except Exception as e:
+                error = e
+            
+            if attempt == self.llm_max_retries:
+                raise error
+            # Full jitter keeps retries from a large batch from arriving in lockstep
+            delay = random.uniform(0, self.llm_retry_base_delay * (2 ** attempt))
+            logger.warning(f"LLM call failed ({error}); retry {attempt + 1}/{self.llm_max_retries} in {delay:.2f}s")
+            await asyncio.sleep(delay)
+    
+    async def detect_bias_batch(self, evaluations: List[Any], statistical_analysis: Dict[str, Any],
+                                max_concurrency: int = 8):
+        """Run detect_bias_comprehensive for every evaluation concurrently, at most
+        `max_concurrency` at a time. Yields one batch result per evaluation in completion
+        order; each carries its `index` in the request. The shared `statistical_analysis`
+        still feeds every overall score and recommendation, but is left out of the results
+        so callers report it once."""
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def analyze(index: int, evaluation: Any) -> Dict[str, Any]:
+            evaluation_text = evaluation.get("text", "") if isinstance(evaluation, dict) else ""
+            if not evaluation_text:
+                return {"index": index, "status": "error", "error": "Missing evaluation text"}
+            
+            async with semaphore:
+                try:
+                    analysis = await self.detect_bias_comprehensive(
+                        evaluation_text=evaluation_text,
+                        candidate_info=evaluation.get("candidate_info", {}),
+                        statistical_analysis=statistical_analysis
+                    )
+                except Exception as e:
+                    return {"index": index, "status": "error", "error": f"Analysis failed: {str(e)}"}
+            del analysis['statistical_analysis']
+            return {"index": index, "status": "success", "analysis": analysis}
         
+        tasks = [asyncio.ensure_future(analyze(i, evaluation)) for i, evaluation in enumerate(evaluations)]
+        try:
+            for next_result in asyncio.as_completed(tasks):
+                yield await next_result
+        finally:
+            # The consumer stopped early (e.g. client disconnected): drop outstanding work
+            for task in tasks:
+                task.cancel()
+    
+    def get_bias_insights(self, candidates: List[Dict[str, Any]], dataset_version: Optional[int] = None,
+                          position: Optional[str] = None,
+                          attributes: Tuple[str, ...] = BIAS_ATTRIBUTES,
+                          score_attributes: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        """Get comprehensive bias insights for a set of candidates. Pass the candidate store
+        version the list was read at to serve repeat requests from the insight cache.
+        `score_attributes` adds score bias per protected attribute (score_analysis_by_attribute);
+        score_analysis and the risk level always use gender."""
+        
+        key = None
+        if dataset_version is not None:
+            id_hash = candidate_set_hash(candidates)
+            if id_hash is not None:
+                key = (dataset_version, id_hash, (position or '').lower(), tuple(attributes),
+                       tuple(score_attributes))
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return cached
+        
+        insights = self._compute_bias_insights(candidates, list(attributes), list(score_attributes))
+        if key is not None:
+            self.cache.put(key, insights)
+        return insights
+    
+    def get_intersectional_insights(self, candidates: List[Dict[str, Any]], dataset_version: Optional[int] = None,
+                                    attributes: Tuple[str, ...] = INTERSECTIONAL_ATTRIBUTES,
+                                    **options) -> Dict[str, Any]:
+        """Intersectional bias analysis (see BiasDetectionEngine.analyze_intersectional_bias),
+        cached per dataset version like get_bias_insights"""
+        key = None
+        if dataset_version is not None:
+            id_hash = candidate_set_hash(candidates)
+            if id_hash is not None:
+                key = (dataset_version, id_hash, 'intersectional', tuple(attributes), tuple(sorted(options.items())))
+                cached = self.cache.get(key)
+                if cached is not None:
+                    return cached
+        
+        encoded = ProtectedAttributeCodes(candidates, list(attributes))
+        analysis = self.bias_detector.analyze_intersectional_bias(encoded, list(attributes), **options)
+        if key is not None:
+            self.cache.put(key, analysis)
+        return analysis
+    
+    def _compute_bias_insights(self, candidates: List[Dict[str, Any]], attributes: List[str],
+                               score_attributes: List[str]) -> Dict[str, Any]:
         insights = {
             'summary': {},
             'demographic_analysis': {},
@@ -918,10 +1544,23 @@ class AIOrchestrator:
         
         if len(candidates) < 5:
             insights['summary'] = {'message': 'Insufficient data for statistical analysis'}
-            return convert_numpy_types(insights)
+            return insights
         
-        # Analyze by different demographic attributes
-        for attribute in ['gender', 'ethnicity', 'age_group']:
+        # Analyze by different demographic attributes, encoding the protected attributes once
+        encoded = None
+        try:
+            encoded = ProtectedAttributeCodes(candidates, attributes)
+            if encoded.has_decision:
+                insights['demographic_analysis'] = self.bias_detector.analyze_demographic_bias_many(
+                    encoded, attributes
+                )
+        except Exception as e:
+            logger.warning(f"Error encoding protected attributes: {e}")
+            encoded = None
+        
+        for attribute in attributes:
+            if attribute in insights['demographic_analysis']:
+                continue
             try:
                 if attribute == 'age_group':
                     # Create age groups for analysis
@@ -932,8 +1571,7 @@ class AIOrchestrator:
                         df = df.dropna(subset=['age'])
                         
                         if len(df) > 0:
-                            df['age_group'] = pd.cut(df['age'], bins=[0, 30, 45, 65, 100], 
-                                                   labels=['Under 30', '30-45', '45-65', 'Over 65'])
+                            df['age_group'] = pd.cut(df['age'], bins=AGE_GROUP_BINS, labels=AGE_GROUP_LABELS)
                             # Convert categorical to string to avoid serialization issues
                             df['age_group'] = df['age_group'].astype(str)
                             candidates_with_age_groups = df.to_dict('records')
@@ -973,14 +1611,29 @@ class AIOrchestrator:
                 'confidence': 'none'
             }
         
+        # Per-attribute score bias only when asked for; it does not feed the risk level
+        if score_attributes:
+            try:
+                insights['score_analysis_by_attribute'] = self.bias_detector.analyze_score_bias_many(
+                    candidates, score_attributes
+                )
+            except Exception as e:
+                logger.warning(f"Error in per-attribute score analysis: {e}")
+                insights['score_analysis_by_attribute'] = {attribute: {
+                    'bias_detected': False,
+                    'reason': f'Score analysis error: {str(e)}',
+                    'overall_bias_score': 0.0,
+                    'confidence': 'none'
+                } for attribute in score_attributes}
+        
         # Determine overall risk level
         max_bias_score = 0.0
         for analysis in insights['demographic_analysis'].values():
             if analysis.get('bias_score', 0) > max_bias_score:
                 max_bias_score = analysis['bias_score']
         
-        if score_analysis.get('overall_bias_score', 0) > max_bias_score:
-            max_bias_score = score_analysis['overall_bias_score']
+        if insights['score_analysis'].get('overall_bias_score', 0) > max_bias_score:
+            max_bias_score = insights['score_analysis']['overall_bias_score']
         
         if max_bias_score > 0.7:
             insights['risk_level'] = 'high'
@@ -996,15 +1649,18 @@ class AIOrchestrator:
         })
         
         # Calculate overall hiring rate for summary
-        df = pd.DataFrame(candidates)
         overall_hiring_rate = 0.0
-        if 'hiring_decision' in df.columns:
-            overall_hiring_rate = (df['hiring_decision'] == 'hired').mean()
-        elif 'hired' in df.columns:
-            overall_hiring_rate = df['hired'].mean()
-        elif 'final_score' in df.columns:
-            # Infer hiring rate from scores (assume score >= 80 means hired)
-            overall_hiring_rate = (df['final_score'] >= 80).mean()
+        if encoded is not None and encoded.has_decision:
+            overall_hiring_rate = float(encoded.hired.mean())
+        else:
+            df = pd.DataFrame(candidates)
+            if 'hiring_decision' in df.columns:
+                overall_hiring_rate = (df['hiring_decision'] == 'hired').mean()
+            elif 'hired' in df.columns:
+                overall_hiring_rate = df['hired'].mean()
+            elif 'final_score' in df.columns:
+                # Infer hiring rate from scores (assume score >= 80 means hired)
+                overall_hiring_rate = (df['final_score'] >= 80).mean()
         
         # Ensure no NaN values
         if pd.isna(overall_hiring_rate) or not np.isfinite(overall_hiring_rate):
@@ -1012,14 +1668,14 @@ class AIOrchestrator:
 
         insights['summary'] = {
             'total_candidates': len(candidates),
-            'overall_bias_score': convert_numpy_types(max_bias_score),
-            'overall_hiring_rate': convert_numpy_types(overall_hiring_rate),
+            'overall_bias_score': max_bias_score,
+            'overall_hiring_rate': overall_hiring_rate,
             'risk_level': insights['risk_level'],
             'bias_risk_level': insights['risk_level'],  # Add this for frontend compatibility
             'analysis_timestamp': datetime.now().isoformat()
         }
         
-        return convert_numpy_types(insights)
+        return insights
     
     def get_ai_insights(self) -> Dict[str, Any]:
         """Get AI performance insights and metrics"""
@@ -1029,7 +1685,7 @@ class AIOrchestrator:
             "langchain_available": LANGCHAIN_AVAILABLE,
             "langfuse_connected": self.langfuse is not None,
             "bias_detection_ready": True,
-            "cache_size": len(self.cache),
+            **self.cache.stats(),
             "available_features": [
                 "bias_detection",
                 "text_analysis", 
@@ -1059,13 +1715,15 @@ def get_ai_orchestrator() -> AIOrchestrator:
 def initialize_ai_orchestrator(openai_api_key: str = None, 
                              langfuse_secret_key: Optional[str] = None,
                              langfuse_public_key: Optional[str] = None,
-                             langfuse_host: Optional[str] = None):
-    """Initialize global AI orchestrator with API keys"""
+                             langfuse_host: Optional[str] = None,
+                             **llm_options):
+    """Initialize global AI orchestrator with API keys (plus optional llm / retry settings)"""
     global ai_orchestrator
     ai_orchestrator = AIOrchestrator(
         openai_api_key=openai_api_key,
         langfuse_secret_key=langfuse_secret_key,
         langfuse_public_key=langfuse_public_key,
-        langfuse_host=langfuse_host
+        langfuse_host=langfuse_host,
+        **llm_options
     )
     return ai_orchestrator
\ No newline at end of file
@@ -0,0 +1,229 @@
+"""
+Bias Lexicon - compiled word-boundary matcher for rule-based text bias detection
+Each lexicon maps a category to indicator phrases and is compiled once into a single regex
+(phrases factored into a character trie, bounded by non-word characters) that reports every
+match with its offsets and categories in one pass over the text.
+
+Lexicons can be overridden from a JSON file named by the BIAS_LEXICON_FILE environment variable
+({"lexicon name": {"category": ["phrase", ...]}}); the file is re-read whenever it changes.
+
+Benchmark: python -m services.bias_lexicon --words 5000 --texts 2000
+"""
+
+import argparse
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LEXICONS: Dict[str, Dict[str, List[str]]] = {
+    # BiasDetectionEngine._analyze_text_bias
+    'evaluation': {
+        'age_bias': [
+            'young', 'old', 'mature', 'experienced', 'fresh', 'energetic',
+            'digital native', 'generation', 'too old', 'too young'
+        ],
+        'gender_bias': [
+            'aggressive', 'assertive', 'emotional', 'nurturing', 'bossy',
+            'hysterical', 'dramatic', 'soft', 'pushy', 'nice'
+        ],
+        'appearance_bias': [
+            'attractive', 'professional appearance', 'well-groomed', 'presentable',
+            'polished', 'neat', 'dress', 'looks'
+        ],
+        'cultural_bias': [
+            'cultural fit', 'team fit', 'our type', 'background', 'foreign',
+            'accent', 'communication style', 'different'
+        ],
+        'family_bias': [
+            'family', 'children', 'pregnant', 'maternity', 'paternity',
+            'childcare', 'availability', 'commitment'
+        ]
+    },
+    # AIOrchestrator._analyze_text_bias
+    'indicators': {
+        'age_bias': ['young', 'old', 'mature', 'fresh out of', 'seasoned', 'senior'],
+        'gender_bias': ['aggressive', 'bossy', 'emotional', 'nurturing', 'assertive'],
+        'cultural_bias': ['cultural fit', 'good fit', 'team player', 'communication style'],
+        'appearance_bias': ['professional appearance', 'well-groomed', 'presentable'],
+        'subjective_language': ['seems', 'appears', 'feels like', 'impression', 'gut feeling']
+    },
+    # Evidence-based wording that offsets subjective language
+    'objective_language': {
+        'objective': ['demonstrated', 'achieved', 'completed', 'measured', 'quantified']
+    }
+}
+
+def _normalize(phrase: str) -> str:
+    return ' '.join(phrase.lower().split())
+
+def trie_pattern(phrases: List[str]) -> str:
+    """Regex alternation over the phrases with shared prefixes factored out, so the engine
+    tests each leading character once instead of trying every phrase at every position.
+    Optional suffix groups are greedy, so the longest phrase at a position wins."""
+    trie: Dict[str, dict] = {}
+    for phrase in phrases:
+        node = trie
+        for char in phrase:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def emit(node: Dict[str, dict]) -> str:
+        branches = [(r'\s+' if char == ' ' else re.escape(char)) + emit(child)
+                    for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        if '' in node:
+            return '(?:' + '|'.join(branches) + ')?'
+        return branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+
+    return emit(trie)
+
+class BiasLexicon:
+    """Category -> phrases lexicon compiled into one case-insensitive, word-bounded regex"""
+
+    def __init__(self, categories: Dict[str, List[str]]):
+        self.categories = {category: [_normalize(p) for p in phrases if p.strip()]
+                           for category, phrases in categories.items()}
+        self._phrase_categories: Dict[str, List[str]] = {}
+        self._phrase_rank: Dict[Tuple[str, str], int] = {}
+        for category, phrases in self.categories.items():
+            for rank, phrase in enumerate(phrases):
+                self._phrase_categories.setdefault(phrase, []).append(category)
+                self._phrase_rank[(category, phrase)] = rank
+
+        # Internal whitespace matches any run of spaces; "too old" wins over "old"
+        self._pattern = re.compile(r'(?<!\w)' + trie_pattern(list(self._phrase_categories)) + r'(?!\w)',
+                                   re.IGNORECASE) if self._phrase_categories else None
+
+    def find(self, text: str) -> List[Dict[str, object]]:
+        """Every non-overlapping match as {phrase, categories, start, end}"""
+        if self._pattern is None or not text:
+            return []
+        return [
+            {
+                'phrase': _normalize(match.group(0)),
+                'categories': self._phrase_categories[_normalize(match.group(0))],
+                'start': match.start(),
+                'end': match.end()
+            }
+            for match in self._pattern.finditer(text)
+        ]
+
+    def detect(self, text: str) -> Tuple[Dict[str, List[str]], List[Dict[str, object]]]:
+        """({category: distinct phrases found, in lexicon order}, matches)"""
+        matches = self.find(text)
+        found: Dict[str, set] = {}
+        for match in matches:
+            for category in match['categories']:
+                found.setdefault(category, set()).add(match['phrase'])
+        detected = {
+            category: sorted(found[category], key=lambda phrase: self._phrase_rank[(category, phrase)])
+            for category in self.categories if category in found
+        }
+        return detected, matches
+
+class LexiconRegistry:
+    """Compiled lexicons by name: built-in defaults overlaid with an optional JSON file that is
+    reloaded when its mtime or size changes"""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self._lock = threading.Lock()
+        self._signature: Optional[Tuple[int, int]] = None
+        self._overrides: Dict[str, Dict[str, List[str]]] = {}
+        self._compiled: Dict[str, BiasLexicon] = {}
+
+    def _file_signature(self) -> Optional[Tuple[int, int]]:
+        if not self.path:
+            return None
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def _refresh(self):
+        signature = self._file_signature()
+        if signature == self._signature:
+            return
+        overrides: Dict[str, Dict[str, List[str]]] = {}
+        if signature is not None:
+            try:
+                with open(self.path, 'r') as f:
+                    overrides = json.load(f)
+                logger.info(f"Loaded bias lexicons {sorted(overrides)} from {self.path}")
+            except (OSError, json.JSONDecodeError) as e:
+                # Keep serving the previous lexicons rather than dropping to nothing mid-edit
+                logger.error(f"Error loading bias lexicons from {self.path}: {e}")
+                return
+        self._overrides = overrides
+        self._compiled = {}
+        self._signature = signature
+
+    def get(self, name: str) -> BiasLexicon:
+        with self._lock:
+            self._refresh()
+            lexicon = self._compiled.get(name)
+            if lexicon is None:
+                categories = self._overrides.get(name, DEFAULT_LEXICONS.get(name, {}))
+                lexicon = self._compiled[name] = BiasLexicon(categories)
+            return lexicon
+
+    def set(self, name: str, categories: Dict[str, List[str]]):
+        """Replace a lexicon in memory (until the file next changes)"""
+        with self._lock:
+            self._overrides[name] = categories
+            self._compiled.pop(name, None)
+
+    def reload(self):
+        with self._lock:
+            self._signature = ('forced',)
+            self._refresh()
+
+# Global instance
+lexicon_registry = None
+
+def get_bias_lexicon(name: str) -> BiasLexicon:
+    """Get a compiled lexicon from the global registry"""
+    global lexicon_registry
+    if lexicon_registry is None:
+        lexicon_registry = LexiconRegistry(os.environ.get('BIAS_LEXICON_FILE'))
+    return lexicon_registry.get(name)
+
+def _benchmark(words: int, texts: int):
+    import random
+
+    rng = random.Random(0)
+    vocabulary = ('candidate', 'delivered', 'project', 'hold', 'bold', 'threshold', 'team', 'the', 'and',
+                  'young', 'emotional', 'cultural', 'fit', 'demonstrated', 'address', 'softly', 'nicely')
+    lexicon = BiasLexicon(DEFAULT_LEXICONS['evaluation'])
+    phrases = [(category, phrase) for category, items in DEFAULT_LEXICONS['evaluation'].items() for phrase in items]
+
+    def substring_scan(text: str) -> int:
+        lower = text.lower()
+        return sum(1 for _, phrase in phrases if phrase in lower)
+
+    long_text = ' '.join(rng.choice(vocabulary) for _ in range(words))
+    batch = [' '.join(rng.choice(vocabulary) for _ in range(60)) for _ in range(texts)]
+    for label, inputs in ((f"1 text x {words} words", [long_text]), (f"{texts} texts x 60 words", batch)):
+        started = time.perf_counter()
+        substring_hits = sum(substring_scan(text) for text in inputs)
+        substring_time = time.perf_counter() - started
+        started = time.perf_counter()
+        regex_hits = sum(len(lexicon.find(text)) for text in inputs)
+        regex_time = time.perf_counter() - started
+        print(f"{label}: substring scan {substring_time * 1000:.1f} ms ({substring_hits} phrases, "
+              f"word-blind), compiled matcher {regex_time * 1000:.1f} ms ({regex_hits} word-bounded matches)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the compiled bias lexicon matcher")
+    parser.add_argument("--words", type=int, default=5000)
+    parser.add_argument("--texts", type=int, default=2000)
+    args = parser.parse_args()
+    _benchmark(args.words, args.texts)
@@ -0,0 +1,72 @@
+"""
+Fake Completion Server - local HTTP stand-in for the Azure OpenAI chat completions endpoint
+Serves /openai/deployments/{deployment}/chat/completions with a canned resume analysis after a
+simulated latency, so the resume analyzer's pooled async client can be exercised offline.
+
+Run: python -m services.fake_completion_server --port 8089 --latency 2
+then set AZURE_OPENAI_ENDPOINT=http://127.0.0.1:8089 and AZURE_OPENAI_API_KEY=test
+"""
+
+import argparse
+import asyncio
+import json
+import time
+
+from fastapi import FastAPI
+
+ANALYSIS = {
+    "overall_score": 78.0,
+    "position_match": "good",
+    "matched_skills": [{"skill": "Python", "mentioned": True, "context": "5 years of backend work"}],
+    "missing_skills": ["Kubernetes"],
+    "experience_assessment": "Solid backend experience",
+    "education_match": "Meets requirements",
+    "recommendations": ["Probe infrastructure experience in the interview"],
+    "detailed_analysis": "Good fit for the role with minor gaps.",
+    "confidence_score": 0.8
+}
+
+def create_app(latency: float = 1.0) -> FastAPI:
+    app = FastAPI(title="Fake Azure OpenAI")
+    app.state.calls = 0
+    app.state.in_flight = 0
+    app.state.max_in_flight = 0
+
+    @app.post("/openai/deployments/{deployment}/chat/completions")
+    async def chat_completions(deployment: str):
+        app.state.calls += 1
+        app.state.in_flight += 1
+        app.state.max_in_flight = max(app.state.max_in_flight, app.state.in_flight)
+        try:
+            await asyncio.sleep(latency)
+        finally:
+            app.state.in_flight -= 1
+        return {
+            "id": f"chatcmpl-fake-{app.state.calls}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": deployment,
+            "choices": [{
+                "index": 0,
+                "finish_reason": "stop",
+                "message": {"role": "assistant", "content": json.dumps(ANALYSIS)}
+            }],
+            "usage": {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0}
+        }
+
+    @app.get("/stats")
+    async def stats():
+        return {"calls": app.state.calls, "in_flight": app.state.in_flight,
+                "max_in_flight": app.state.max_in_flight}
+
+    return app
+
+if __name__ == "__main__":
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description="Serve fake Azure OpenAI chat completions")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=1.0)
+    args = parser.parse_args()
+    uvicorn.run(create_app(args.latency), host=args.host, port=args.port)
@@ -0,0 +1,79 @@
+"""
+Fake LLM - local stand-in for the bias analysis LLM chain
+Answers with canned JSON after a simulated round-trip latency, with optional injected failures
+and hangs, so batch fan-out, timeouts and retries can be exercised without network access.
+
+Benchmark: python -m services.fake_llm --items 200 --latency 0.2 --concurrency 16
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Optional
+
+class FakeLLMChain:
+    """Chain-like object exposing the async `arun` the orchestrator calls"""
+
+    def __init__(self, latency: float = 0.2, jitter: float = 0.05, failure_rate: float = 0.0,
+                 hang_rate: float = 0.0, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.hang_rate = hang_rate
+        self._random = random.Random(seed)
+        self.calls = 0
+        self.failures = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def arun(self, evaluation_text: str = "", **variables) -> str:
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            roll = self._random.random()
+            if roll < self.hang_rate:
+                await asyncio.sleep(3600)
+            await asyncio.sleep(max(0.0, self.latency + self._random.uniform(-self.jitter, self.jitter)))
+            if roll < self.hang_rate + self.failure_rate:
+                self.failures += 1
+                raise RuntimeError("Simulated LLM failure")
+
+            flagged = [word for word in ('emotional', 'young', 'aggressive', 'cultural fit')
+                       if word in evaluation_text.lower()]
+            return json.dumps({
+                "bias_score": min(1.0, 0.2 * len(flagged)),
+                "bias_types_detected": ["language_bias"] if flagged else [],
+                "problematic_phrases": flagged,
+                "objective_language_score": 0.5,
+                "demographic_neutrality_score": 1.0 - min(1.0, 0.2 * len(flagged)),
+                "recommendations": ["Use objective, job-related language"] if flagged else [],
+                "revised_evaluation": evaluation_text,
+                "confidence_level": 0.9
+            })
+        finally:
+            self.in_flight -= 1
+
+async def _benchmark(items: int, latency: float, concurrency: int, failure_rate: float):
+    from services.ai_orchestrator import AIOrchestrator
+
+    evaluations = [{"text": f"Evaluation {i}: seems emotional but achieved every goal"} for i in range(items)]
+    for label, limit in (("sequential", 1), ("concurrent", concurrency)):
+        llm = FakeLLMChain(latency=latency, failure_rate=failure_rate, seed=0)
+        orchestrator = AIOrchestrator(llm=llm, llm_retry_base_delay=latency / 4)
+        started = time.perf_counter()
+        completed = [result async for result in orchestrator.detect_bias_batch(evaluations, {}, limit)]
+        elapsed = time.perf_counter() - started
+        print(f"{label:>10}: {len(completed)} items in {elapsed:.2f}s "
+              f"(llm calls {llm.calls}, failures {llm.failures}, peak in flight {llm.max_in_flight})")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batch bias analysis against the fake LLM")
+    parser.add_argument("--items", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    asyncio.run(_benchmark(args.items, args.latency, args.concurrency, args.failure_rate))
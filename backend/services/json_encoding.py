@@ -0,0 +1,67 @@
+"""
+JSON Encoding - single-pass serialization of analysis results holding NumPy/pandas values
+The C JSON encoder walks the result once; NumPy/pandas objects it does not know are converted
+by a type-dispatched default hook, and non-finite floats are rewritten to 0.0 in the output.
+"""
+
+import json
+import re
+from datetime import date, datetime
+from enum import Enum
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from fastapi.responses import JSONResponse
+
+# NaN/Infinity tokens the encoder emits for non-finite floats, skipping over string literals
+_NON_FINITE = re.compile(r'"(?:[^"\\]|\\.)*"|(-?Infinity|NaN)')
+
+def _non_finite_to_zero(match: re.Match) -> str:
+    return '0.0' if match.group(1) else match.group(0)
+
+def json_default(obj: Any) -> Any:
+    """json.dumps `default` hook for NumPy scalars/arrays, pandas containers and dates"""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, pd.Series):
+        return {str(key): value for key, value in obj.items()}
+    if isinstance(obj, pd.DataFrame):
+        return obj.to_dict('records')
+    if isinstance(obj, pd.Index):
+        return obj.tolist()
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset)):
+        return list(obj)
+    return str(obj)
+
+def _stringify_keys(obj: Any) -> Any:
+    """Slow path for dicts keyed by NumPy scalars or tuples, which json.dumps rejects"""
+    if isinstance(obj, dict):
+        return {key if isinstance(key, str) else str(json_default(key) if isinstance(key, np.generic) else key):
+                _stringify_keys(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_stringify_keys(item) for item in obj]
+    return obj
+
+def dumps(obj: Any) -> str:
+    """Serialize to JSON text with NaN and +/-inf written as 0.0"""
+    try:
+        text = json.dumps(obj, default=json_default)
+    except TypeError:
+        text = json.dumps(_stringify_keys(obj), default=json_default)
+    if 'NaN' in text or 'Infinity' in text:
+        text = _NON_FINITE.sub(_non_finite_to_zero, text)
+    return text
+
+class AnalysisJSONResponse(JSONResponse):
+    """JSONResponse for analysis results, rendered with dumps() instead of jsonable_encoder.
+    Endpoints return it directly so FastAPI does not re-encode the content."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content).encode('utf-8')
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""Tests for the shared async Azure OpenAI client against the fake completion server:
+the event loop keeps serving while analyses are in flight, and replaced clients release their pool"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import httpx
+
+# Add the backend directory to Python path
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+# Keep the import-time stores and the analysis cache off the real databases
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+os.environ.setdefault('RESUME_CACHE_URL', 'sqlite://')
+
+import app.ai.azure_client as azure_client_module
+from app.ai.azure_client import AzureCompletionClient, get_azure_client
+from app.api.resume_analyzer import analyze_resume_with_azure_openai
+from services.fake_completion_server import ANALYSIS, create_app
+
+LATENCY = 0.5
+JOB_DESCRIPTION = {'PositionTitle': 'Data Scientist', 'CoreSkills': ['Python']}
+
+def fake_client(fake_app, max_concurrency: int) -> AzureCompletionClient:
+    """A client whose requests are served in-process by the fake completion app"""
+    return AzureCompletionClient(
+        endpoint='http://fake-azure', api_key='test', api_version='2023-12-01-preview', model='gpt-4o',
+        timeout=10.0, max_concurrency=max_concurrency, max_retries=0,
+        transport=httpx.ASGITransport(app=fake_app)
+    )
+
+def test_event_loop_serves_while_analyses_are_in_flight():
+    """Eight analyses run four at a time, while the loop keeps ticking and answers other requests"""
+    fake_app = create_app(latency=LATENCY)
+
+    async def scenario():
+        azure_client_module.azure_client = fake_client(fake_app, max_concurrency=4)
+        ticks = [time.monotonic()]
+
+        async def ticker():
+            while True:
+                await asyncio.sleep(0.01)
+                ticks.append(time.monotonic())
+
+        ticking = asyncio.create_task(ticker())
+        started = time.monotonic()
+        analyses = asyncio.gather(*[
+            analyze_resume_with_azure_openai(f"Resume {index}: Python developer", JOB_DESCRIPTION, prescreen=False)
+            for index in range(8)
+        ])
+
+        # Other requests are answered while the first four completions are still waiting
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=fake_app), base_url='http://fake-azure') as other:
+            stats = (await other.get('/stats')).json()
+            while stats['in_flight'] < 4 and not analyses.done():
+                await asyncio.sleep(0.01)
+                stats = (await other.get('/stats')).json()
+        assert stats['in_flight'] == 4 and stats['calls'] == 4 and not analyses.done()
+
+        results = await analyses
+        elapsed = time.monotonic() - started
+        ticking.cancel()
+        await azure_client_module.close_azure_client()
+        return results, elapsed, max(b - a for a, b in zip(ticks, ticks[1:]))
+
+    results, elapsed, longest_gap = asyncio.run(scenario())
+    assert all(result['overall_score'] == ANALYSIS['overall_score'] for result in results)
+    assert fake_app.state.calls == 8 and fake_app.state.max_in_flight == 4
+    # Faster than eight completions in a row, and no completion ever held the loop
+    assert elapsed < 8 * LATENCY * 0.75
+    assert longest_gap < LATENCY / 2
+    print(f"✅ 8 analyses in {elapsed:.2f}s; longest event loop stall {longest_gap * 1000:.0f} ms")
+
+def test_replaced_client_releases_its_pool():
+    """A client left on another, still running loop is closed there when a new loop takes over"""
+    old_loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=old_loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        async def create():
+            return get_azure_client()
+        azure_client_module.azure_client = None
+        old = asyncio.run_coroutine_threadsafe(create(), old_loop).result(5)
+
+        async def replace():
+            client = get_azure_client()
+            await asyncio.wrap_future(old.closing)
+            await azure_client_module.close_azure_client()
+            return client
+        new = asyncio.run(replace())
+        assert new is not old and old._http.is_closed
+        print("✅ Replaced client's connection pool closed on its own loop")
+    finally:
+        old_loop.call_soon_threadsafe(old_loop.stop)
+        thread.join(5)
+        old_loop.close()
+        azure_client_module.azure_client = None
+
+if __name__ == "__main__":
+    print("=== Testing Azure OpenAI client ===")
+    test_event_loop_serves_while_analyses_are_in_flight()
+    test_replaced_client_releases_its_pool()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Tests for the bootstrap confidence intervals of the bias analyses: the group-count score
+bootstrap against resampling rows directly, and intervals on large datasets"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+# Add the backend directory to Python path
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+from services.ai_orchestrator import (
+    BOOTSTRAP_EXACT_GROUP_ROWS, BiasDetectionEngine, ProtectedAttributeCodes, _spread, bootstrap_mean_spread
+)
+
+def row_bootstrap_spread(codes: np.ndarray, groups: int, values: np.ndarray, n_resamples: int,
+                         rng: np.random.Generator) -> np.ndarray:
+    """The textbook bootstrap: resample row indices, then take per-group means of each column"""
+    rows, columns = values.shape
+    spreads = np.empty((n_resamples, columns))
+    for resample in range(n_resamples):
+        indices = rng.integers(0, rows, size=rows)
+        for column in range(columns):
+            picked, picked_codes = values[indices, column], codes[indices]
+            scored = ~np.isnan(picked)
+            counts = np.bincount(picked_codes[scored], minlength=groups)
+            sums = np.bincount(picked_codes[scored], weights=picked[scored], minlength=groups)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                spreads[resample, column] = _spread((sums / counts)[None, :])[0]
+    return spreads
+
+def test_score_bootstrap_matches_row_resampling():
+    """Group counts plus per-group draws give the same disparity distribution as resampling rows,
+    for groups drawn exactly and groups drawn from the normal limit"""
+    rng = np.random.default_rng(3)
+    rows = 4000
+    codes = rng.choice(4, size=rows, p=[0.5, 0.3, 0.17, 0.03])
+    values = rng.normal((60 + 3 * codes)[:, None], 12, size=(rows, 2))
+    values[rng.random((rows, 2)) < 0.2] = np.nan
+    assert np.bincount(codes).max() > BOOTSTRAP_EXACT_GROUP_ROWS > np.bincount(codes).min()
+
+    grouped = bootstrap_mean_spread(codes, 4, values, 4000, seed=1)
+    direct = row_bootstrap_spread(codes, 4, values, 2000, np.random.default_rng(2))
+    for percentile in (2.5, 50, 97.5):
+        assert np.allclose(np.percentile(grouped, percentile, axis=0),
+                           np.percentile(direct, percentile, axis=0), atol=0.3), percentile
+    print("✅ Score bootstrap percentiles match row resampling")
+
+def test_large_dataset_keeps_score_intervals():
+    """1,000 resamples over 100k candidates report every interval, quickly"""
+    rng = np.random.default_rng(5)
+    rows = 100_000
+    df = pd.DataFrame({
+        'gender': rng.choice(['female', 'male', 'non_binary'], size=rows, p=[0.48, 0.48, 0.04]),
+        'resume_score': rng.normal(65, 12, size=rows),
+        'technical_score': np.where(rng.random(rows) < 0.3, np.nan, rng.normal(60, 15, size=rows)),
+    })
+    engine = BiasDetectionEngine()
+    engine.analyze_score_frame(df.head(50), 'gender')  # Warm up the scipy imports
+
+    started = time.monotonic()
+    result = engine.analyze_score_frame(df, 'gender')
+    elapsed = time.monotonic() - started
+    assert result['bootstrap']['n_resamples'] == 1000
+    for column in ('resume_score', 'technical_score'):
+        interval = result['score_analysis'][column]['score_disparity_interval']
+        assert interval['lower'] <= interval['estimate'] <= interval['upper']
+    assert elapsed < 2.0, elapsed
+    print(f"✅ Score intervals for 100k candidates in {elapsed:.2f}s")
+
+def test_rate_intervals_use_hire_counts():
+    """The pandas and encoded demographic paths bootstrap the same integer hire counts"""
+    candidates = [
+        {'gender': ['female', 'male', 'non_binary'][i % 3],
+         'hiring_decision': 'hired' if i % 7 in (0, 3) or (i % 3 == 1 and i % 5 == 0) else 'rejected'}
+        for i in range(3001)
+    ]
+    engine = BiasDetectionEngine()
+    single = engine.analyze_demographic_bias(candidates, 'gender')['metrics']
+    encoded = ProtectedAttributeCodes(candidates, ['gender'])
+    many = engine.analyze_demographic_bias_many(encoded, ['gender'])['gender']['metrics']
+    assert single['confidence_intervals'] == many['confidence_intervals']
+
+    hired = sum(c['hiring_decision'] == 'hired' and c['gender'] == 'male' for c in candidates)
+    estimate = single['confidence_intervals']['hiring_rates_by_group']['male']['estimate']
+    assert estimate == hired / single['group_counts']['male']
+    print("✅ Hire-rate intervals agree across both demographic paths")
+
+if __name__ == "__main__":
+    print("=== Testing bias bootstrap intervals ===")
+    test_score_bootstrap_matches_row_resampling()
+    test_large_dataset_keeps_score_intervals()
+    test_rate_intervals_use_hire_counts()
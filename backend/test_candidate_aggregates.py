@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""Tests that the store's incremental analytics aggregates match a full scan after creates, patches and deletes"""
+
+import json
+import os
+import sys
+import tempfile
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+# Add the backend directory to Python path
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+from app.api.analytics import (
+    demographics_report, funnel_report, positions_report, scores_report, summary_report, timeline_report
+)
+from app.storage.candidate_store import CandidateStore
+from app.storage.json_backend import JsonCandidateBackend
+
+SCORE_FIELDS = ['resume_score', 'interview_score', 'technical_score', 'final_score']
+
+def rate(part: int, total: int) -> float:
+    return (part / total * 100) if total > 0 else 0
+
+def full_scan(candidates: list) -> dict:
+    """The analytics endpoints as they were computed before aggregates: one pass over every candidate"""
+    hired = [c for c in candidates if c.get('hiring_decision') == 'hired']
+    recent_cutoff = datetime.now() - timedelta(days=30)
+    recent = [c for c in candidates if datetime.fromisoformat(c['created_at']) >= recent_cutoff]
+    scored = {field: [c[field] for c in candidates if c.get(field) is not None] for field in SCORE_FIELDS}
+
+    summary = {
+        'total_candidates': len(candidates),
+        'total_hired': len(hired),
+        'total_positions': len({c.get('position_applied', 'Unknown') for c in candidates}),
+        'hiring_rate': rate(len(hired), len(candidates)),
+        'average_scores': {field: sum(s) / len(s) if s else 0 for field, s in scored.items()},
+        'trends': {
+            'candidates_last_30_days': len(recent),
+            'hiring_rate_last_30_days': rate(len([c for c in recent if c.get('hiring_decision') == 'hired']),
+                                             len(recent))
+        }
+    }
+
+    positions = {}
+    for c in candidates:
+        stats = positions.setdefault(c['position_applied'], {
+            'total_candidates': 0, 'hired': 0, 'rejected': 0, 'on_hold': 0, 'pending': 0,
+            'demographics': {'gender': defaultdict(int), 'ethnicity': defaultdict(int)}
+        })
+        decision = c.get('hiring_decision')
+        stats['total_candidates'] += 1
+        stats[decision if decision in ('hired', 'rejected', 'on_hold') else 'pending'] += 1
+        stats['demographics']['gender'][c['gender']] += 1
+        stats['demographics']['ethnicity'][c['ethnicity']] += 1
+    for stats in positions.values():
+        stats['hiring_rate'] = rate(stats['hired'], stats['total_candidates'])
+
+    demographics = {'gender': {}, 'ethnicity': {}, 'age_groups': {}}
+    for c in candidates:
+        is_hired = c.get('hiring_decision') == 'hired'
+        for field in ('gender', 'ethnicity'):
+            stats = demographics[field].setdefault(c[field], {'total': 0, 'hired': 0, 'positions': defaultdict(int)})
+            stats['total'] += 1
+            stats['hired'] += is_hired
+            stats['positions'][c['position_applied']] += 1
+        if c.get('age'):
+            age = c['age']
+            label = ('under_25' if age < 25 else '25_34' if age < 35 else '35_44' if age < 45
+                     else '45_54' if age < 55 else '55_plus')
+            stats = demographics['age_groups'].setdefault(label, {'total': 0, 'hired': 0})
+            stats['total'] += 1
+            stats['hired'] += is_hired
+    for groups in demographics.values():
+        for stats in groups.values():
+            stats['hiring_rate'] = rate(stats['hired'], stats['total'])
+
+    months = defaultdict(lambda: {'applications': 0, 'hired': 0, 'rejected': 0})
+    for c in candidates:
+        month = months[datetime.fromisoformat(c['created_at']).strftime('%Y-%m')]
+        month['applications'] += 1
+        if c.get('hiring_decision') in ('hired', 'rejected'):
+            month[c['hiring_decision']] += 1
+    timeline = [
+        {'month': key, **data, 'hiring_rate': rate(data['hired'], data['applications']),
+         'rejection_rate': rate(data['rejected'], data['applications'])}
+        for key, data in sorted(months.items())
+    ]
+
+    scores = {}
+    for field, values in scored.items():
+        if not values:
+            scores[field] = {'count': 0, 'average': 0, 'min': 0, 'max': 0, 'distribution': {}}
+            continue
+        distribution = dict.fromkeys(['0-20', '21-40', '41-60', '61-80', '81-100'], 0)
+        for score in values:
+            bucket = ('0-20' if score <= 20 else '21-40' if score <= 40 else '41-60' if score <= 60
+                      else '61-80' if score <= 80 else '81-100')
+            distribution[bucket] += 1
+        scores[field] = {'count': len(values), 'average': round(sum(values) / len(values), 2),
+                         'min': min(values), 'max': max(values), 'distribution': distribution}
+
+    stages = {
+        'applied': len(candidates),
+        'resume_reviewed': len(scored['resume_score']),
+        'interviewed': len(scored['interview_score']),
+        'technical_tested': len(scored['technical_score']),
+        'final_scored': len(scored['final_score']),
+        'hired': len(hired),
+        'rejected': len([c for c in candidates if c.get('hiring_decision') == 'rejected'])
+    }
+    funnel = {
+        'funnel_stages': stages,
+        'conversion_rates': {f"{stage}_rate": rate(count, len(candidates))
+                             for stage, count in stages.items() if stage != 'applied' and candidates}
+    }
+
+    return {'summary': summary, 'positions': positions, 'demographics': demographics,
+            'timeline': timeline, 'scores': scores, 'funnel': funnel}
+
+def incremental(store: CandidateStore) -> dict:
+    return {
+        'summary': store.analytics(summary_report),
+        'positions': store.analytics(positions_report),
+        'demographics': store.analytics(demographics_report),
+        'timeline': store.analytics(timeline_report),
+        'scores': store.analytics(scores_report),
+        'funnel': store.analytics(funnel_report),
+    }
+
+def candidate(index: int) -> dict:
+    # Integer scores keep the running sums exact, so averages compare with ==
+    created = datetime.now() - timedelta(days=[3, 20, 45, 80, 200][index % 5])
+    return {
+        'first_name': f'Test{index}',
+        'position_applied': ['Data Scientist', 'Backend Engineer', 'Designer'][index % 3],
+        'gender': ['female', 'male', 'non_binary'][index % 3 if index % 4 else 1],
+        'ethnicity': ['asian', 'black', 'hispanic', 'white'][index % 4],
+        'age': [22, 29, 38, 47, 61, None][index % 6],
+        'hiring_decision': ['hired', 'rejected', 'on_hold', None][index % 4],
+        'resume_score': (index * 7) % 101,
+        'interview_score': (index * 13) % 101 if index % 2 else None,
+        'technical_score': (index * 17) % 101 if index % 3 else None,
+        'final_score': (index * 19) % 101 if index % 5 else None,
+        'created_at': created.isoformat(),
+    }
+
+def assert_matches(store: CandidateStore, step: str):
+    expected = full_scan(store.all())
+    actual = incremental(store)
+    for report in expected:
+        assert actual[report] == json.loads(json.dumps(expected[report])), (step, report)
+    print(f"✅ Aggregates match a full scan after {step}")
+
+def test_aggregates_match_full_scan():
+    """Create, patch and delete candidates and compare every analytics report with a full scan"""
+    with tempfile.TemporaryDirectory() as directory:
+        data_file = os.path.join(directory, 'candidates.json')
+        with open(data_file, 'w') as f:
+            json.dump([], f)
+        store = CandidateStore(JsonCandidateBackend(data_file))
+
+        created = [store.create(candidate(index)) for index in range(60)]
+        assert_matches(store, "creates")
+
+        for record in created[::4]:
+            store.update(record['id'], {'hiring_decision': 'hired', 'final_score': 99, 'age': 33})
+        for record in created[1::5]:
+            store.update(record['id'], {'position_applied': 'Designer', 'resume_score': None, 'gender': 'female'})
+        assert_matches(store, "patches")
+
+        for record in created[::3]:
+            store.delete(record['id'])
+        assert_matches(store, "deletes")
+
+        reloaded = CandidateStore(JsonCandidateBackend(data_file))
+        assert incremental(reloaded) == incremental(store)
+        store.backend.journal.close()
+        reloaded.backend.journal.close()
+        print("✅ A reloaded store rebuilds the same aggregates")
+
+if __name__ == "__main__":
+    print("=== Testing candidate aggregates ===")
+    test_aggregates_match_full_scan()
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""Tests for candidate writes and listing through the candidates router, on a throwaway store"""
+
+import base64
+import json
+import os
+import sys
+import tempfile
+
+# Add the backend directory to Python path
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+# Keep the import-time store off the real database
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.storage.candidate_store as candidate_store_module
+from app.api.candidates import router as candidates_router
+from app.config import settings
+from app.storage.candidate_store import CandidateStore
+from app.storage.json_backend import JsonCandidateBackend
+
+test_app = FastAPI(title="Test App")
+test_app.include_router(candidates_router, prefix="/api/v1/candidates", tags=["candidates"])
+client = TestClient(test_app)
+
+def candidate_payload(index: int) -> dict:
+    return {
+        'first_name': f'Test{index}',
+        'last_name': 'Candidate',
+        'email': f'test{index}@example.com',
+        'position_applied': 'Data Scientist',
+        'experience_years': index % 10,
+        'education_level': "Bachelor's",
+        'skills': ['Python'],
+        'gender': 'female' if index % 2 else 'male',
+        'ethnicity': 'asian',
+        'age': 30
+    }
+
+def fresh_store(directory: str, count: int = 0) -> CandidateStore:
+    """Point the router at an empty JSON-backed store and create `count` candidates through the API"""
+    data_file = os.path.join(directory, 'candidates.json')
+    with open(data_file, 'w') as f:
+        json.dump([], f)
+    candidate_store_module.candidate_store = CandidateStore(JsonCandidateBackend(data_file))
+    for index in range(count):
+        assert client.post("/api/v1/candidates/", json=candidate_payload(index)).status_code == 200
+    return candidate_store_module.candidate_store
+
+def test_stale_version_update_returns_409():
+    """A PUT carrying the version the client read succeeds once; replaying it is rejected"""
+    with tempfile.TemporaryDirectory() as directory:
+        fresh_store(directory, count=1)
+        candidate = client.get("/api/v1/candidates/1").json()
+        assert candidate['version'] == 1
+
+        first = client.put("/api/v1/candidates/1", json={'first_name': 'First', 'version': 1})
+        assert first.status_code == 200 and first.json()['version'] == 2
+
+        stale = client.put("/api/v1/candidates/1", json={'first_name': 'Second', 'version': 1})
+        assert stale.status_code == 409
+        assert client.get("/api/v1/candidates/1").json()['first_name'] == 'First'
+        print("✅ Stale version rejected with 409")
+
+def cursor_for(sort: str, key) -> str:
+    payload = json.dumps([sort, key]).encode('utf-8')
+    return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+def test_cursor_round_trip():
+    """Following X-Next-Cursor visits every candidate exactly once in sort order"""
+    with tempfile.TemporaryDirectory() as directory:
+        fresh_store(directory, count=7)
+        seen, cursor = [], None
+        while True:
+            params = {'sort': '-id', 'limit': 3}
+            if cursor:
+                params['cursor'] = cursor
+            response = client.get("/api/v1/candidates/", params=params)
+            assert response.status_code == 200
+            seen += [candidate['id'] for candidate in response.json()]
+            cursor = response.headers.get('X-Next-Cursor')
+            if cursor is None:
+                break
+        assert seen == [7, 6, 5, 4, 3, 2, 1]
+        print("✅ Cursor pages cover every candidate once")
+
+def test_tampered_cursor_rejected():
+    """Cursors for another sort, with the wrong shape or with mistyped key parts are 400s"""
+    with tempfile.TemporaryDirectory() as directory:
+        fresh_store(directory, count=3)
+        tampered = [
+            ('created_at', cursor_for('id', [0, 1, 1])),
+            ('created_at', cursor_for('created_at', [0, 5, 1])),
+            ('created_at', cursor_for('created_at', [0, '2024-01-01', 'x'])),
+            ('final_score', cursor_for('final_score', [0, 'high', 1])),
+            ('final_score', cursor_for('final_score', [True, 0, 1])),
+            ('final_score', cursor_for('final_score', [1, None, 1])),
+            ('id', cursor_for('id', [0, 1.5, 1])),
+            ('id', cursor_for('id', [0, 1])),
+            ('id', cursor_for('id', {'a': 1})),
+            ('id', 'not base64 at all!'),
+        ]
+        for sort, cursor in tampered:
+            response = client.get("/api/v1/candidates/", params={'sort': sort, 'cursor': cursor})
+            assert response.status_code == 400, (sort, cursor, response.status_code)
+        print("✅ Tampered cursors rejected with 400")
+
+def test_bulk_rejects_bad_bodies_before_committing():
+    """Non-UTF-8 bodies are 400s and oversized bodies 413s, with no rows created"""
+    with tempfile.TemporaryDirectory() as directory:
+        store = fresh_store(directory)
+        ndjson = {'content-type': 'application/x-ndjson'}
+        rows = '\n'.join(json.dumps(candidate_payload(index)) for index in range(3)).encode('utf-8')
+
+        response = client.post("/api/v1/candidates/bulk", content=b'\xff\xfe{"a":1}\n', headers=ndjson)
+        assert response.status_code == 400
+        response = client.post("/api/v1/candidates/bulk", content=rows + b'\n\xff\n', headers=ndjson)
+        assert response.status_code == 400
+
+        limit = settings.bulk_max_body_bytes
+        settings.bulk_max_body_bytes = len(rows) - 1
+        try:
+            assert client.post("/api/v1/candidates/bulk", content=rows, headers=ndjson).status_code == 413
+        finally:
+            settings.bulk_max_body_bytes = limit
+        assert store.count() == 0
+
+        response = client.post("/api/v1/candidates/bulk", content=rows, headers=ndjson)
+        assert response.status_code == 200 and response.json()['created'] == 3
+        print("✅ Bad bulk bodies rejected before any row is committed")
+
+if __name__ == "__main__":
+    print("=== Testing candidates API ===")
+    test_stale_version_update_returns_409()
+    test_cursor_round_trip()
+    test_tampered_cursor_rejected()
+    test_bulk_rejects_bad_bodies_before_committing()
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Tests for the candidate journal: replay, torn-tail recovery and reloads across store instances"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+
+# Add the backend directory to Python path
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+from app.storage.candidate_store import CandidateStore
+from app.storage.journal import CandidateJournal
+from app.storage.json_backend import JsonCandidateBackend
+
+def make_backend(directory: str) -> JsonCandidateBackend:
+    data_file = os.path.join(directory, 'candidates.json')
+    with open(data_file, 'w') as f:
+        json.dump([{'id': 1, 'first_name': 'Ada', 'version': 1}], f)
+    return JsonCandidateBackend(data_file)
+
+def test_replay_applies_journal_over_snapshot():
+    """A second store instance sees the snapshot plus every journaled mutation"""
+    with tempfile.TemporaryDirectory() as directory:
+        writer = CandidateStore(make_backend(directory))
+        writer.create({'first_name': 'Grace'})
+        writer.update(1, {'first_name': 'Ada L.'})
+        writer.backend.journal.close()
+
+        reader = CandidateStore(JsonCandidateBackend(writer.backend.data_file))
+        assert [c['first_name'] for c in reader.all()] == ['Ada L.', 'Grace']
+        assert reader.get(1)['version'] == 2
+        print("✅ Journal replays over the snapshot")
+
+def test_replay_leaves_torn_tail_in_place():
+    """Reading stops at an incomplete line without touching the file"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'journal.jsonl')
+        with open(path, 'wb') as f:
+            f.write(b'{"op": "delete", "id": 1}\n{"op": "delete", "id"')
+        size = os.path.getsize(path)
+
+        journal = CandidateJournal(path)
+        assert list(journal.replay()) == [{'op': 'delete', 'id': 1}]
+        assert os.path.getsize(path) == size
+        print("✅ Replay stops at a torn tail and leaves it alone")
+
+def test_append_truncates_torn_tail():
+    """The next write (under the write lock) cuts the torn tail before appending"""
+    with tempfile.TemporaryDirectory() as directory:
+        store = CandidateStore(make_backend(directory))
+        store.create({'first_name': 'Grace'})
+        store.backend.journal.close()
+        journal_path = store.backend.journal.path
+        with open(journal_path, 'ab') as f:
+            f.write(b'{"op": "create", "id": 99, "da')
+
+        recovered = CandidateStore(JsonCandidateBackend(store.backend.data_file))
+        assert recovered.count() == 2
+        recovered.create({'first_name': 'Linus'})
+        recovered.backend.journal.close()
+
+        with open(journal_path, 'rb') as f:
+            lines = f.read().splitlines()
+        assert all(json.loads(line) for line in lines) and len(lines) == 2
+
+        reloaded = CandidateStore(JsonCandidateBackend(store.backend.data_file))
+        assert [c['first_name'] for c in reloaded.all()] == ['Ada', 'Grace', 'Linus']
+        print("✅ Torn tail truncated on the next append")
+
+def test_pending_tail_synced_within_interval():
+    """A write below the batch size is still fsynced once the interval passes, with no further writes"""
+    with tempfile.TemporaryDirectory() as directory:
+        journal = CandidateJournal(os.path.join(directory, 'journal.jsonl'), fsync_batch_size=64,
+                                   fsync_interval=0.2)
+        synced = []
+        real_fsync = os.fsync
+        os.fsync = lambda fd: synced.append(fd) or real_fsync(fd)
+        try:
+            journal.append([{'op': 'delete', 'id': 1}])
+            journal.append([{'op': 'delete', 'id': 2}])
+            assert not synced and journal._unsynced == 2
+            deadline = time.monotonic() + 2
+            while not synced and time.monotonic() < deadline:
+                time.sleep(0.01)
+            with journal._lock:
+                assert len(synced) == 1 and journal._unsynced == 0
+        finally:
+            os.fsync = real_fsync
+            journal.close()
+        print("✅ Pending journal tail synced by the flush timer")
+
+if __name__ == "__main__":
+    print("=== Testing candidate journal ===")
+    test_replay_applies_journal_over_snapshot()
+    test_replay_leaves_torn_tail_in_place()
+    test_append_truncates_torn_tail()
+    test_pending_tail_synced_within_interval()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""Tests for the streaming fairness monitor: Welford add/remove, sliding-window expiry and
+parity with a batch recompute of the demographic and score bias analyses"""
+
+import json
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Add the backend directory to Python path
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+from app.storage.candidate_store import CandidateStore
+from app.storage.fairness import (
+    PROTECTED_ATTRIBUTES, FairnessMonitor, RunningStats, SlidingWindow, decision_event, score_events
+)
+from app.storage.json_backend import JsonCandidateBackend
+from services.ai_orchestrator import BiasDetectionEngine
+
+def close(a, b, tolerance: float = 1e-9) -> bool:
+    return math.isclose(a, b, rel_tol=tolerance, abs_tol=tolerance)
+
+def test_welford_add_remove_matches_numpy():
+    """Adding values and removing some of them leaves the mean/variance of what remains"""
+    rng = random.Random(7)
+    values = [rng.uniform(0, 100) for _ in range(500)]
+    removed = set(rng.sample(range(len(values)), 300))
+    stats = RunningStats()
+    for value in values:
+        stats.add(value)
+    for index in sorted(removed):
+        stats.remove(values[index])
+
+    remaining = np.array([value for index, value in enumerate(values) if index not in removed])
+    assert stats.count == len(remaining)
+    assert close(stats.mean, remaining.mean(), 1e-7)
+    assert close(stats.variance, remaining.var(ddof=1), 1e-7)
+
+    for value in remaining:
+        stats.remove(value)
+    assert (stats.count, stats.mean, stats.m2) == (0, 0.0, 0.0) and math.isnan(stats.variance)
+    print("✅ Welford add/remove matches numpy")
+
+def test_sliding_window_expires_and_supersedes():
+    """Events older than the window drop out; a newer event for the same key replaces the old one"""
+    now = time.time()
+    day = 86400
+    window = SlidingWindow(30)
+    record = lambda candidate_id, gender, decision: {
+        'id': candidate_id, 'gender': gender, 'ethnicity': 'asian', 'hiring_decision': decision, 'final_score': 80
+    }
+    # Pushed in time order, as the monitor does
+    window.push(score_events(record(2, 'male', 'rejected'), ['final_score'], now - 45 * day)[0])
+    window.push(decision_event(record(1, 'female', 'hired'), now - 40 * day))
+    window.push(decision_event(record(3, 'female', 'rejected'), now - 35 * day))
+    window.push(decision_event(record(2, 'male', 'rejected'), now - 20 * day))
+    window.push(decision_event(record(3, 'female', 'hired'), now - 5 * day))
+    assert len(window) == 4
+    assert (window.stats.total, window.stats.hired) == (3, 2)
+
+    window.expire(now)
+    assert len(window) == 2
+    assert (window.stats.total, window.stats.hired) == (2, 1)
+    gender = window.stats.groups['gender']
+    assert (gender['female'].total, gender['female'].hired) == (1, 1)
+    assert not gender['male'].scores['final_score'].count
+
+    window.expire(now + 30 * day)
+    assert len(window) == 0 and window.stats.total == 0 and not window.stats.groups['gender']
+    print("✅ Sliding window expires old events and counts re-decisions once")
+
+def candidate(rng: random.Random, index: int) -> dict:
+    gender = ['female', 'male', None][index % 3 if index % 7 else 2]
+    ethnicity = ['asian', 'black', 'hispanic', 'white'][index % 4]
+    # A planted gap so the significance tests have something to find
+    skew = 8 if gender == 'male' else 0
+    return {
+        'first_name': f'Test{index}',
+        'gender': gender,
+        'ethnicity': ethnicity,
+        'hiring_decision': rng.choice(['hired', 'rejected', 'on_hold', None]),
+        'resume_score': round(rng.gauss(65 + skew, 12), 1),
+        'interview_score': round(rng.gauss(70, 10), 1) if index % 2 else None,
+        'technical_score': round(rng.gauss(60 + skew, 15), 1),
+        'final_score': round(rng.gauss(68, 9), 1) if index % 5 else None,
+    }
+
+def assert_matches_batch(monitor: FairnessMonitor, store: CandidateStore, engine: BiasDetectionEngine):
+    report = monitor.report()['attributes']
+    candidates = store.all()
+    for attribute in PROTECTED_ATTRIBUTES:
+        streamed = report[attribute]
+        batch = engine.analyze_demographic_bias(candidates, attribute)['metrics']
+        assert streamed['hiring_rates_by_group'].keys() == {str(g) for g in batch['hiring_rates_by_group']}
+        for group, rate in batch['hiring_rates_by_group'].items():
+            assert close(streamed['hiring_rates_by_group'][str(group)], rate)
+            assert streamed['group_counts'][str(group)] == batch['group_counts'][group]
+        assert close(streamed['overall_hiring_rate'], batch['overall_hiring_rate'])
+        assert close(streamed['demographic_parity_difference'], batch['demographic_parity_difference'])
+        assert close(streamed['statistical_significance']['p_value'], batch['statistical_significance']['p_value'])
+
+        scores = engine.analyze_score_bias(candidates, attribute)['score_analysis']
+        for field, streamed_field in streamed['score_analysis'].items():
+            batch_field = scores[field]
+            for group, mean in batch_field['mean_scores_by_group'].items():
+                assert close(streamed_field['mean_by_group'][str(group)], mean, 1e-7)
+                assert close(streamed_field['std_by_group'][str(group)], batch_field['std_scores_by_group'][group], 1e-7)
+                assert streamed_field['count_by_group'][str(group)] == batch_field['count_by_group'][group]
+            assert close(streamed_field['p_value'], batch_field['statistical_significance']['p_value'], 1e-6)
+
+def test_monitor_matches_batch_recompute():
+    """Creates, decisions, score updates and deletes through the store leave the monitor's report
+    equal to analyze_demographic_bias / analyze_score_bias over the same records"""
+    rng = random.Random(11)
+    engine = BiasDetectionEngine()
+    with tempfile.TemporaryDirectory() as directory:
+        data_file = os.path.join(directory, 'candidates.json')
+        with open(data_file, 'w') as f:
+            json.dump([], f)
+        store = CandidateStore(JsonCandidateBackend(data_file))
+        monitor = FairnessMonitor(store)
+
+        created = store.create_many([candidate(rng, index) for index in range(300)])
+        assert_matches_batch(monitor, store, engine)
+
+        for record in rng.sample(created, 120):
+            before = dict(store.get(record['id']))
+            after = store.update(record['id'], {'hiring_decision': rng.choice(['hired', 'rejected'])})
+            monitor.record_decision(before, after)
+        for record in rng.sample(created, 120):
+            before = dict(store.get(record['id']))
+            after = store.update(record['id'], {'resume_score': round(rng.uniform(40, 95), 1),
+                                                'final_score': None})
+            monitor.record_scores(before, after)
+        for record in rng.sample(created, 60):
+            store.update(record['id'], {'gender': rng.choice(['female', 'male'])})
+        assert_matches_batch(monitor, store, engine)
+
+        for record in rng.sample(created, 90):
+            store.delete(record['id'])
+        assert_matches_batch(monitor, store, engine)
+        assert monitor.rebuilds == 1
+
+        # Score events are only recorded for the columns that changed (final_score was cleared)
+        fields = {field for _, field in monitor.windows[30]._latest}
+        assert fields == {'hiring_decision', 'resume_score'}
+        store.backend.journal.close()
+        print("✅ Streaming fairness report matches a batch recompute")
+
+if __name__ == "__main__":
+    print("=== Testing fairness monitor ===")
+    test_welford_add_remove_matches_numpy()
+    test_sliding_window_expires_and_supersedes()
+    test_monitor_matches_batch_recompute()
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""Tests for intersectional bias analysis: a planted gender x ethnicity disparity, min_support
+pruning, the dense group keys against a brute-force count, the p-value corrections and the
+/intersectional endpoint"""
+
+import json
+import os
+import sys
+import tempfile
+from collections import Counter
+from itertools import combinations
+
+# Add the backend directory to Python path
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+# Keep the import-time stores off the real database
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import app.storage.candidate_store as candidate_store_module
+from app.api.bias_detection import router as bias_router
+from app.storage.candidate_store import CandidateStore
+from app.storage.json_backend import JsonCandidateBackend
+from services.ai_orchestrator import AGE_GROUP_BINS, AGE_GROUP_LABELS, BiasDetectionEngine, ProtectedAttributeCodes
+
+test_app = FastAPI(title="Test App")
+test_app.include_router(bias_router, prefix="/api/v1/bias", tags=["bias"])
+client = TestClient(test_app)
+
+# Hire rates per (gender, ethnicity) cell: every gender and every ethnicity hires 30% overall,
+# but female/asian and male/black candidates are hired far less often than the rest
+PLANTED_RATES = {('female', 'asian'): 0.1, ('female', 'black'): 0.5,
+                 ('male', 'asian'): 0.5, ('male', 'black'): 0.1}
+CELL_SIZE = 200
+
+def planted_candidates() -> list:
+    candidates = []
+    for (gender, ethnicity), rate in PLANTED_RATES.items():
+        for index in range(CELL_SIZE):
+            candidates.append({
+                'gender': gender,
+                'ethnicity': ethnicity,
+                'position_applied': ['Data Scientist', 'Designer', 'Backend Engineer'][index % 3],
+                'hiring_decision': 'hired' if index < rate * CELL_SIZE else 'rejected'
+            })
+    # A handful of hispanic candidates, too few to be tested on their own or in any combination
+    for index in range(12):
+        candidates.append({
+            'gender': ['female', 'male'][index % 2],
+            'ethnicity': 'hispanic',
+            'position_applied': 'Designer',
+            'hiring_decision': 'hired' if index < 6 else 'rejected'
+        })
+    return candidates
+
+def analyze(candidates: list, attributes: list, **options) -> dict:
+    encoded = ProtectedAttributeCodes(candidates, attributes)
+    return BiasDetectionEngine().analyze_intersectional_bias(encoded, attributes, **options)
+
+def test_planted_disparity_found_only_intersectionally():
+    """Single-attribute parity looks fine; the gender x ethnicity cells carry the disparity"""
+    candidates = planted_candidates()
+    engine = BiasDetectionEngine()
+    for attribute in ('gender', 'ethnicity'):
+        marginal = engine.analyze_demographic_bias(
+            [c for c in candidates if c['ethnicity'] != 'hispanic'], attribute
+        )
+        assert not marginal['bias_detected'], attribute
+
+    result = analyze(candidates, ['gender', 'ethnicity'], max_order=2)
+    assert result['bias_detected']
+    flagged = {tuple(group['attributes'].values()) for group in result['groups']
+               if group['significant'] and abs(group['rate_difference']) > 0.1}
+    assert flagged == set(PLANTED_RATES)
+    assert all(group['order'] == 2 for group in result['groups'] if group['significant'])
+    low = next(group for group in result['groups'] if group['attributes'] == {'gender': 'female', 'ethnicity': 'asian'})
+    assert (low['size'], low['hired']) == (CELL_SIZE, 20) and low['rate_difference'] < 0
+    print("✅ Planted gender x ethnicity disparity found; single attributes show none")
+
+def brute_force_cells(candidates: list, attributes: list, max_order: int, min_support: int) -> dict:
+    """(attribute -> value) cell -> (size, hired) for every combination, counted directly"""
+    cells = {}
+    for order in range(1, max_order + 1):
+        for combination in combinations(attributes, order):
+            sizes, hires = Counter(), Counter()
+            for c in candidates:
+                if any(c.get(attribute) is None for attribute in combination):
+                    continue
+                key = tuple(c[attribute] for attribute in combination)
+                sizes[key] += 1
+                hires[key] += c['hiring_decision'] == 'hired'
+            for key, size in sizes.items():
+                if size >= min_support:
+                    cells[tuple(zip(combination, key))] = (size, hires[key])
+    return cells
+
+def test_pruned_cells_not_reported_and_keys_match_brute_force():
+    """Cells below min_support (and every finer cell inside them) are left out; every reported
+    cell has the size and hire count of a direct count over the candidates"""
+    candidates = planted_candidates()
+    for index, candidate in enumerate(candidates):
+        candidate['age'] = [23, 31, 42, 57, None][index % 5]
+    attributes = ['gender', 'ethnicity', 'position_applied', 'age_group']
+    result = analyze(candidates, attributes, max_order=3, min_support=30, max_groups=10_000)
+
+    # The encoder derives age_group from age with the (low, high] bins
+    labelled = [dict(c, age_group=None if c['age'] is None else next(
+        label for high, label in zip(AGE_GROUP_BINS[1:], AGE_GROUP_LABELS) if c['age'] <= high
+    )) for c in candidates]
+    reported = {tuple(group['attributes'].items()): (group['size'], group['hired']) for group in result['groups']}
+    assert reported == brute_force_cells(labelled, attributes, 3, 30)
+    assert result['cells_tested'] == len(reported)
+    assert result['cells_pruned'] > 0
+    assert result['cells_evaluated'] == result['cells_tested'] + result['cells_pruned']
+    assert all(group['size'] >= 30 for group in result['groups'])
+    assert not any(group['attributes'].get('ethnicity') == 'hispanic' for group in result['groups'])
+    print(f"✅ {result['cells_tested']} cells match a brute-force count; {result['cells_pruned']} pruned")
+
+def benjamini_hochberg(p_values: list) -> list:
+    count = len(p_values)
+    ranked = sorted(range(count), key=lambda i: p_values[i])
+    adjusted = [0.0] * count
+    running = 1.0
+    for rank in range(count, 0, -1):
+        i = ranked[rank - 1]
+        running = min(running, p_values[i] * count / rank)
+        adjusted[i] = running
+    return adjusted
+
+def test_corrections_match_manual_adjustment():
+    """adjusted_p_value is Benjamini-Hochberg or Bonferroni over every tested cell"""
+    candidates = planted_candidates()
+    for correction in ('fdr_bh', 'bonferroni'):
+        result = analyze(candidates, ['gender', 'ethnicity', 'position_applied'], max_order=3,
+                         min_support=20, correction=correction, max_groups=10_000)
+        groups = result['groups']
+        assert len(groups) == result['cells_tested']
+        p_values = [group['p_value'] for group in groups]
+        expected = (benjamini_hochberg(p_values) if correction == 'fdr_bh'
+                    else [min(1.0, p * len(p_values)) for p in p_values])
+        for group, adjusted in zip(groups, expected):
+            assert abs(group['adjusted_p_value'] - adjusted) < 1e-12, (correction, group)
+            assert group['significant'] == (adjusted < result['alpha'])
+        assert result['correction'] == correction
+    print("✅ Benjamini-Hochberg and Bonferroni adjustments match a manual computation")
+
+def test_intersectional_endpoint():
+    """GET /intersectional reports the planted cells and validates its parameters"""
+    with tempfile.TemporaryDirectory() as directory:
+        data_file = os.path.join(directory, 'candidates.json')
+        with open(data_file, 'w') as f:
+            json.dump([], f)
+        original = candidate_store_module.candidate_store
+        store = CandidateStore(JsonCandidateBackend(data_file))
+        candidate_store_module.candidate_store = store
+        try:
+            store.create_many(planted_candidates())
+            response = client.get("/api/v1/bias/intersectional",
+                                  params={'attributes': 'gender,ethnicity', 'max_order': 2, 'correction': 'bonferroni'})
+            assert response.status_code == 200
+            body = response.json()
+            analysis = body['analysis']
+            assert body['total_candidates_analyzed'] == 4 * CELL_SIZE + 12
+            assert analysis['correction'] == 'bonferroni' and analysis['bias_detected']
+            flagged = {(group['attributes']['gender'], group['attributes']['ethnicity'])
+                       for group in analysis['groups'] if group['significant'] and group['order'] == 2}
+            assert flagged == set(PLANTED_RATES)
+
+            assert client.get("/api/v1/bias/intersectional", params={'correction': 'holm'}).status_code == 422
+            assert client.get("/api/v1/bias/intersectional", params={'attributes': ' , '}).status_code == 400
+        finally:
+            store.backend.journal.close()
+            candidate_store_module.candidate_store = original
+    print("✅ /intersectional reports the planted cells")
+
+if __name__ == "__main__":
+    print("=== Testing intersectional bias ===")
+    test_planted_disparity_found_only_intersectionally()
+    test_pruned_cells_not_reported_and_keys_match_brute_force()
+    test_corrections_match_manual_adjustment()
+    test_intersectional_endpoint()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Tests for batch screening jobs: lease takeover on resume, ownership-checked result writes, upload limits"""
+
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import time
+import zipfile
+from contextlib import contextmanager
+
+# Add the backend directory to Python path
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+# Keep the import-time stores off the real database
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+from fastapi import HTTPException, UploadFile
+
+import app.api.resume_screening as resume_screening
+from app.api.resume_screening import (
+    COMPLETED, DONE, PENDING, RUNNING, LeaseLostError, ScreeningJobRunner, job_progress, store_uploads
+)
+from app.config import settings
+from services.fake_completion_server import ANALYSIS
+
+class FakeExtractor:
+    async def extract_file(self, path: str) -> str:
+        with open(path, 'r') as f:
+            return f.read()
+
+@contextmanager
+def use_fakes():
+    """Swap the extraction pool and LLM call for local fakes; yields the list of analyzed texts"""
+    analyzed = []
+
+    async def analyze(resume_text, job_description):
+        analyzed.append(resume_text)
+        return dict(ANALYSIS)
+
+    originals = resume_screening.get_resume_text_extractor, resume_screening.analyze_resume_with_azure_openai
+    resume_screening.get_resume_text_extractor = lambda: FakeExtractor()
+    resume_screening.analyze_resume_with_azure_openai = analyze
+    try:
+        yield analyzed
+    finally:
+        resume_screening.get_resume_text_extractor, resume_screening.analyze_resume_with_azure_openai = originals
+
+def add_job(runner: ScreeningJobRunner, directory: str, job_id: str, owner: str, lease_expires_at: float,
+            statuses: list):
+    for index, status in enumerate(statuses):
+        path = os.path.join(directory, f"{job_id}-{index}.txt")
+        with open(path, 'w') as f:
+            f.write(f"resume {job_id} {index}")
+        runner.results.insert({
+            'id': f"{job_id}:{index:05d}", 'job_id': job_id, 'index': index, 'file_name': f"{index}.txt",
+            'path': path, 'status': status, 'overall_score': 50.0 if status == DONE else None,
+            'analysis': None, 'error': None, 'completed_at': None
+        })
+    runner.jobs.insert({
+        'id': job_id, 'position_title': 'Data Scientist', 'status': RUNNING, 'total': len(statuses),
+        'owner': owner, 'lease_expires_at': lease_expires_at, 'directory': directory,
+        'created_at': '2025-01-01T00:00:00', 'updated_at': '2025-01-01T00:00:00'
+    })
+
+def test_resume_takes_over_expired_leases_only():
+    """A job left by a dead worker resumes from its pending items; a live worker's job is left alone"""
+    runner = ScreeningJobRunner()
+    with use_fakes() as analyzed, tempfile.TemporaryDirectory() as directory:
+        add_job(runner, directory, 'crashed', 'dead-worker', time.time() - 1, [DONE, PENDING, PENDING])
+        add_job(runner, directory, 'live', 'other-worker', time.time() + 60, [PENDING])
+
+        async def scenario():
+            resumed = runner.resume_unfinished()
+            assert resumed == ['crashed']
+            await runner.tasks['crashed']
+            await runner.shutdown()
+        asyncio.run(scenario())
+
+        assert sorted(analyzed) == ['resume crashed 1', 'resume crashed 2']
+        crashed = runner.jobs.get('crashed')
+        assert crashed['status'] == COMPLETED and crashed['owner'] is None
+        progress = job_progress(crashed)
+        assert (progress['completed'], progress['failed'], progress['pending']) == (3, 0, 0)
+
+        live = runner.jobs.get('live')
+        assert live['owner'] == 'other-worker'
+        assert job_progress(live)['pending'] == 1
+        print("✅ Only the expired job was resumed, from its pending items")
+
+def test_result_write_requires_the_lease():
+    """Once another worker owns the job, this worker's result writes are refused"""
+    runner = ScreeningJobRunner()
+    with use_fakes(), tempfile.TemporaryDirectory() as directory:
+        add_job(runner, directory, 'stolen', None, None, [PENDING])
+        assert runner._claim('stolen')['owner'] == runner.owner
+
+        job = runner.jobs.get('stolen')
+        job.update(owner='other-worker', lease_expires_at=time.time() + 60)
+        runner.jobs.update('stolen', job)
+
+        item = runner.results.get('stolen:00000')
+        item.update(status=DONE, completed_at='2025-01-01T00:00:00')
+        try:
+            runner._record_item('stolen', item)
+            assert False, "write should have been refused"
+        except LeaseLostError:
+            pass
+        assert runner.results.get('stolen:00000')['status'] == PENDING
+        assert runner._claim('stolen') is None
+        print("✅ Result writes refused after losing the lease")
+
+def zip_upload(members: dict) -> UploadFile:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    buffer.seek(0)
+    return UploadFile(file=buffer, filename='resumes.zip')
+
+def test_upload_size_limits():
+    """Oversized zip members (a zip bomb), oversized files and oversized jobs are rejected with 413"""
+    limits = settings.resume_max_file_bytes, settings.screening_max_upload_bytes
+    settings.resume_max_file_bytes, settings.screening_max_upload_bytes = 1000, 2500
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            stored = store_uploads([zip_upload({'a.txt': 'x' * 900, 'b.txt': 'y' * 900})], directory)
+            assert [entry['file_name'] for entry in stored] == ['a.txt', 'b.txt']
+
+            uploads = [
+                [zip_upload({'bomb.txt': b'0' * 10_000_000})],
+                [UploadFile(file=io.BytesIO(b'z' * 1001), filename='big.txt')],
+                [zip_upload({f'{index}.txt': 'x' * 900 for index in range(3)})],
+            ]
+            for upload in uploads:
+                try:
+                    store_uploads(upload, directory)
+                    assert False, "upload should have been rejected"
+                except HTTPException as e:
+                    assert e.status_code == 413
+        print("✅ Oversized uploads rejected with 413")
+    finally:
+        settings.resume_max_file_bytes, settings.screening_max_upload_bytes = limits
+
+if __name__ == "__main__":
+    print("=== Testing resume screening jobs ===")
+    test_resume_takes_over_expired_leases_only()
+    test_result_write_requires_the_lease()
+    test_upload_size_limits()
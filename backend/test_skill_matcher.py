@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Tests for the skill pre-screen matcher against the bundled job descriptions"""
+
+import json
+import os
+import sys
+
+# Add the backend directory to Python path
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+from services.skill_matcher import CORE, TECHNICAL, SkillMatcher
+
+with open(os.path.join(backend_dir, 'job_description_full.json'), 'r') as f:
+    JOB_DESCRIPTIONS = {job['PositionTitle']: job for job in json.load(f)}
+
+def mentioned(position: str, text: str) -> set:
+    match = SkillMatcher.for_position(JOB_DESCRIPTIONS[position]).match(text)
+    return {skill['skill'] for skill in match['matched_skills'] if skill['mentioned']}
+
+def test_nested_phrase_credits_shorter_skill():
+    """A longer skill phrase still credits the skills nested inside it"""
+    skills = mentioned('Data Scientist', "Designed machine learning algorithms for fraud scoring.")
+    assert {'Machine Learning', 'Machine Learning algorithms'} <= skills
+    print("✅ 'machine learning algorithms' credits Machine Learning")
+
+def test_compound_phrase_credits_every_part():
+    """The Java Spring Boot core skill also credits Java and Spring separately"""
+    skills = mentioned('Full Stack Developer for AI', "Built REST services in Java Spring Boot.")
+    assert {'Java Spring Boot', 'Java', 'Spring (Spring Boot, Webflux)', 'REST API'} <= skills
+    print("✅ 'Java Spring Boot' credits Java, Spring Boot and Spring")
+
+def test_overlapping_phrases_both_match():
+    """Phrases that overlap without nesting are each found"""
+    matcher = SkillMatcher([('Cloud Computing', CORE), ('Google Cloud', TECHNICAL)])
+    match = matcher.match("Five years of Google Cloud computing.")
+    assert all(skill['mentioned'] for skill in match['matched_skills'])
+    print("✅ Overlapping phrases both matched")
+
+if __name__ == "__main__":
+    print("=== Testing skill matcher ===")
+    test_nested_phrase_credits_shorter_skill()
+    test_compound_phrase_credits_every_part()
+    test_overlapping_phrases_both_match()
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""Tests for the SQLite storage path: cross-connection reloads, immediate write locks,
+the one-shot JSON import and parity between SQLite and in-memory tables"""
+
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+
+# Add the backend directory to Python path
+backend_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, backend_dir)
+
+# Keep the import-time stores off the real database
+os.environ.setdefault('DATABASE_URL', 'sqlite://')
+
+import app.storage.database as database_module
+from app.config import settings
+from app.storage.candidate_store import CandidateStore, VersionConflictError
+from app.storage.importer import IMPORT_META_KEY, import_json_data
+from app.storage.sqlite_backend import SQLiteCandidateBackend, SQLiteDatabase
+from app.storage.tables import MemoryTable
+
+def open_store(path: str) -> CandidateStore:
+    """A candidate store on its own connection, as another worker process would have"""
+    return CandidateStore(SQLiteCandidateBackend(SQLiteDatabase(path)))
+
+def test_store_reloads_on_other_connection_commits():
+    """data_version changes when another connection commits, so the other store reloads"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'fair_hiring.db')
+        writer, reader = open_store(path), open_store(path)
+        assert reader.count() == 0
+
+        created = writer.create({'first_name': 'Ada', 'position_applied': 'Data Scientist'})
+        assert reader.get(created['id'])['first_name'] == 'Ada'
+
+        version = reader.current_version()
+        writer.update(created['id'], {'first_name': 'Ada L.'})
+        assert reader.get(created['id'])['first_name'] == 'Ada L.'
+        assert reader.current_version() > version
+
+        # Our own commits leave data_version alone: no reload after writing
+        version = writer.current_version()
+        assert writer.get(created['id'])['version'] == 2 and writer.current_version() == version
+        print("✅ Stores on separate connections see each other's commits")
+
+def test_write_lock_is_immediate():
+    """write_lock() takes the database write lock up front, so stale CAS writes from another
+    connection are caught against the committed version"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'fair_hiring.db')
+        first, second = open_store(path), open_store(path)
+        created = first.create({'first_name': 'Grace'})
+        assert second.get(created['id'])['version'] == 1
+
+        with first.backend.write_lock():
+            other = sqlite3.connect(path, timeout=0)
+            try:
+                other.execute('BEGIN IMMEDIATE')
+                assert False, "second writer should have been locked out"
+            except sqlite3.OperationalError as e:
+                assert 'locked' in str(e)
+            finally:
+                other.close()
+
+        first.update(created['id'], {'first_name': 'First'}, expected_version=1)
+        try:
+            second.update(created['id'], {'first_name': 'Second'}, expected_version=1)
+            assert False, "stale write should have conflicted"
+        except VersionConflictError as e:
+            assert e.current_version == 2
+        assert open_store(path).get(created['id'])['first_name'] == 'First'
+        print("✅ Writes hold BEGIN IMMEDIATE and reject stale versions across connections")
+
+def test_json_import_runs_once():
+    """get_database() imports the JSON files into a new database once, recorded by a meta marker"""
+    with tempfile.TemporaryDirectory() as directory:
+        data_file = os.path.join(directory, 'candidates.json')
+        interviews_file = os.path.join(directory, 'interviews.json')
+        with open(data_file, 'w') as f:
+            json.dump([{'id': 1, 'first_name': 'Ada', 'version': 1}], f)
+        with open(interviews_file, 'w') as f:
+            json.dump([{'id': 1, 'candidate_id': 1, 'status': 'scheduled'}], f)
+
+        imports = []
+
+        def import_from_directory(db):
+            imports.append(db.path)
+            return import_json_data(db, data_file, interviews_file)
+
+        originals = settings.database_url, database_module.database, database_module.import_json_data
+        settings.database_url = f"sqlite:///{os.path.join(directory, 'fair_hiring.db')}"
+        database_module.import_json_data = import_from_directory
+        try:
+            database_module.database = None
+            db = database_module.get_database()
+            assert len(imports) == 1 and db.get_meta(IMPORT_META_KEY) is not None
+            assert SQLiteCandidateBackend(db).load()[0][0]['first_name'] == 'Ada'
+            assert db.tables['interviews'].count() == 1
+
+            # New rows written after the import survive a restart: the marker stops a re-import
+            CandidateStore(SQLiteCandidateBackend(db)).create({'first_name': 'Grace'})
+            db.close()
+            database_module.database = None
+            db = database_module.get_database()
+            assert len(imports) == 1
+            assert [c['first_name'] for c in SQLiteCandidateBackend(db).load()[0]] == ['Ada', 'Grace']
+            db.close()
+        finally:
+            settings.database_url, database_module.database, database_module.import_json_data = originals
+        print("✅ JSON import runs once per database")
+
+def table_operations(table) -> list:
+    """Run the same writes and queries against a table and collect every result"""
+    results = []
+    results.append(table.insert({'candidate_id': 1, 'status': 'scheduled', 'scheduled_date': '2025-03-01T10:00:00'}))
+    table.insert_many([
+        {'id': 10, 'candidate_id': 2, 'status': 'completed', 'scheduled_date': '2025-02-01T09:00:00Z'},
+        {'id': 11, 'candidate_id': 1, 'status': 'completed', 'scheduled_date': '2025-04-15T14:30:00'},
+        {'id': 12, 'candidate_id': 3, 'status': 'cancelled', 'scheduled_date': None},
+    ])
+    results.append(table.insert({'candidate_id': 2, 'status': 'scheduled', 'scheduled_date': '2025-05-01'}))
+    results.append(table.update(11, {'id': 11, 'candidate_id': 1, 'status': 'cancelled',
+                                     'scheduled_date': '2025-04-15T14:30:00'}))
+    results.append(table.update(99, {'id': 99, 'status': 'completed'}))
+    results.append(table.delete(10))
+    results.append(table.delete(10))
+
+    results.append(table.all())
+    results.append(table.get(11))
+    results.append(table.get(404))
+    results.append(table.find(candidate_id=1))
+    results.append(table.find(status='cancelled'))
+    results.append(table.find(date_from='2025-03-01', date_to='2025-04-30T23:59:59'))
+    results.append(table.find(date_from='2025-01-01T00:00:00Z'))
+    results.append(table.find(limit=2, offset=1))
+    results.append(table.find(status='scheduled', candidate_id=2))
+    results.append([table.count(), table.count(status='cancelled'), table.count(candidate_id=4)])
+    results.append(table.next_key())
+    return results
+
+def test_memory_and_sqlite_tables_agree():
+    """The JSON backend's MemoryTable answers every query exactly like the SQLite table"""
+    db = SQLiteDatabase(':memory:')
+    try:
+        sqlite_results = table_operations(db.tables['interviews'])
+    finally:
+        db.close()
+    memory_results = table_operations(MemoryTable('interviews'))
+    for index, (memory, sqlite) in enumerate(zip(memory_results, sqlite_results)):
+        assert memory == sqlite, (index, memory, sqlite)
+    print("✅ MemoryTable and SQLiteTable return the same results")
+
+if __name__ == "__main__":
+    print("=== Testing SQLite storage ===")
+    test_store_reloads_on_other_connection_commits()
+    test_write_lock_is_immediate()
+    test_json_import_runs_once()
+    test_memory_and_sqlite_tables_agree()